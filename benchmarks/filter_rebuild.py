@@ -0,0 +1,67 @@
+"""Rebuilding the list of an `orderedset` after removing elements in bulk.
+
+Times the in-place operations that remove elements for elements that are
+cheap to hash (`int`), ones that are hashed in C but not cached (`tuple`)
+and ones that are hashed by Python code (frozen dataclasses). Operands
+are built before timing. Run it on two revisions to compare them:
+
+    python benchmarks/filter_rebuild.py
+"""
+
+import dataclasses
+import timeit
+
+from ordered_set import orderedset
+
+
+N = 100_000
+REPEAT = 5
+
+
+@dataclasses.dataclass(frozen=True)
+class Point:
+    x: int
+    y: int
+    label: str
+    tags: tuple[str, ...]
+
+
+ELEMENTS = {
+    'int': lambda i: i,
+    'tuple (20 ints)': lambda i: tuple(range(i, i + 20)),
+    'frozen dataclass': lambda i: Point(i, -i, f'p{i}', ('a', 'b', 'c')),
+}
+
+# name -> (make the operand from the values, the operation)
+OPERATIONS = {
+    '-= (10%)': (lambda values: set(values[::10]), orderedset.__isub__),
+    '&= (90%)': (lambda values: set(values) - set(values[::10]), orderedset.__iand__),
+    '^= (10% common)': (lambda values: set(values[::10]), orderedset.__ixor__),
+    'discard_many (10%)': (lambda values: values[::10], orderedset.discard_many),
+    'update (10% present)': (
+        lambda values: orderedset(values[::10], thread_safe=False),
+        orderedset.update,
+    ),
+}
+
+
+def measure(values, make_operand, operation):
+    operand = make_operand(values)
+    total = 0.0
+    for _ in range(REPEAT):
+        obj = orderedset(values, thread_safe=False)
+        total += timeit.timeit(lambda: operation(obj, operand), number=1)
+    return total / REPEAT
+
+
+def main():
+    for element_name, make in ELEMENTS.items():
+        values = [make(i) for i in range(N)]
+        print(f'{element_name}, n = {N}:')
+        for operation_name, (make_operand, operation) in OPERATIONS.items():
+            time = measure(values, make_operand, operation)
+            print(f'    {operation_name:<24}{time * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
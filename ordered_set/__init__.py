@@ -1,28 +1,65 @@
 # noqa: D104
 
+from bisect import bisect_left, bisect_right
 from collections.abc import (
     Callable,
+    Collection,
+    Container,
     Hashable,
     Iterable,
     Iterator,
+    Mapping,
     Sequence,
     Set,
-    MutableSequence,
+    MutableMapping,
     MutableSet,
 )
+from contextlib import AbstractContextManager, nullcontext
 from copy import copy, deepcopy
-from operator import eq, ne, lt, gt, le, ge
+from itertools import chain, compress, filterfalse, islice
+from operator import eq, ne, lt, gt, le, ge, not_
 from os import PathLike
 from pathlib import Path
 from reprlib import recursive_repr
 from threading import RLock
+from types import FunctionType
 from typing import Optional, TypeAlias, TypeVar, Generic, overload
 
 from typing_extensions import Self, override
 
-from ordered_set._common import ComparisonResult, coerce_iterable_to_collection
+from ordered_set._common import (
+    ComparisonResult,
+    check_index_in_range,
+    coerce_iterable_to_collection,
+    normalize_index,
+)
+from ordered_set._intstorage import int64list, int64set
+from ordered_set._locking import rwlock
+from ordered_set._numpy import orderednumericset
+from ordered_set._storage import (
+    BackendSpec,
+    ListBackend,
+    blockedlist,
+    get_backend,
+    indexedlist,
+    register_backend,
+    tombstonedlist,
+)
 
-__all__ = ('orderedfrozenset', 'orderedset')
+__all__ = (
+    'orderedfrozenset',
+    'orderedset',
+    'orderedintset',
+    'orderednumericset',
+    'sortedorderedset',
+    'orderedfrozendict',
+    'ordereddict',
+    'ListBackend',
+    'register_backend',
+    'blockedlist',
+    'indexedlist',
+    'tombstonedlist',
+)
 
 _PACKAGE_PATH: Path = Path(__file__).parent
 
@@ -45,21 +82,87 @@ __version__: str = _get_version()
 T = TypeVar('T', bound=Hashable)
 
 
+# A "lock" that does nothing, shared by all objects that need no locking
+# (immutable ones and the ones created with `thread_safe=False`). Entering
+# it still costs two calls of Python methods, so mutators that change one
+# element check for it and then call their implementations (`_discard()`
+# for `discard()` and so on) directly; operations on whole sets enter it.
+_NO_LOCK: AbstractContextManager = nullcontext()
+
+# Backends that shift the elements on removal: they remove many elements
+# faster by rebuilding the list once (in O(n)) than one by one (in O(n)
+# each), unless there are at most `_REMOVE_ONE_BY_ONE_MAX` of them.
+_SHIFTING_BACKENDS: tuple[type, ...] = (list, int64list)
+_REMOVE_ONE_BY_ONE_MAX: int = 4
+
+# Backends that do not change on reads, so that threads can share
+# a reader-writer lock to read them.
+_SHARED_READ_BACKENDS: tuple[type, ...] = (list, int64list)
+
+
+# `isinstance(obj, Set)` with the common types checked first: checks against
+# an ABC are slow for its virtual subclasses (like ordered sets).
+def _is_set(obj: object) -> bool:
+    return isinstance(obj, (set, frozenset, _orderedset_base)) or isinstance(obj, Set)
+
+
 # XXX: ?
 class _orderedset_base(Generic[T]):
 
-    __slots__ = ('_data_lock', '_set', '_list')
+    # `_data_lock` is held by operations that change the object,
+    # `_read_lock` - by (non-trivial) operations that only read it. Both
+    # are the same `RLock` unless a reader-writer lock is used.
+    __slots__ = ('_data_lock', '_read_lock', '_set', '_list')
 
     _SET_CTR: type
     _LIST_CTR: type
 
-    def __init__(self):
-        self._data_lock: RLock = RLock()    # XXX: RLock
+    # Whether `_set` and `_list` store the elements unboxed (so they do not
+    # refer to the same objects; see `orderedintset`).
+    _UNBOXED: bool = False
+
+    def __init__(self, *, thread_safe: bool = True, rw_lock: bool = False):
+        self._data_lock: AbstractContextManager
+        self._read_lock: AbstractContextManager
+        self._init_locks(thread_safe, rw_lock)
         self._set: Set
         self._list: Sequence
 
+    def _init_locks(self, thread_safe: bool = True, rw_lock: bool = False) -> None:
+        if rw_lock:
+            if not thread_safe:
+                raise ValueError('A reader-writer lock requires thread_safe=True')
+            lock = rwlock()
+            self._data_lock = lock.write
+            self._read_lock = lock.read
+        else:
+            self._data_lock = self._read_lock = (RLock() if thread_safe else _NO_LOCK)
+
+    @property
+    def thread_safe(self) -> bool:
+        return (self._data_lock is not _NO_LOCK)
+
+    @property
+    def rw_lock(self) -> bool:
+        return (self._data_lock is not self._read_lock)
+
+    # Counters of the reader-writer lock (see `rwlock.stats()`) or `None`.
+    def lock_stats(self) -> Optional[dict[str, int]]:
+        if not self.rw_lock:
+            return None
+        return self._data_lock._lock.stats()   # type: ignore
+
+    # An empty object of the same type with the same locking.
+    def _new_empty(self) -> Self:
+        return type(self)()
+
+    # Brings `_set` and `_list` to the types `_SET_CTR` and `_LIST_CTR`
+    # where that matters (see `orderedfrozenset._freeze_storage()`).
+    def _freeze_storage(self) -> None:
+        pass
+
     def _check(self) -> None:
-        with self._data_lock:
+        with self._read_lock:
             # is it optimal?
             if len(self._set ^ self._SET_CTR(self._list)) != 0:  # pragma: no cover
                 raise ValueError(
@@ -72,6 +175,9 @@ class _orderedset_base(Generic[T]):
                 raise RuntimeError(
                     'Inconsistency detected: set and list don\'t refer to same objects'
                 )
+            check_list = getattr(self._list, '_check', None)
+            if check_list is not None:
+                check_list()
 
     @classmethod
     def _from_iterable(cls, it: Iterable[T]) -> Self:
@@ -85,13 +191,13 @@ class _orderedset_base(Generic[T]):
         type_name = type(self).__name__
         init_str = ''
         if len(self) > 0:
-            iterable_type = (list if isinstance(self._list, list) else tuple)
+            iterable_type = (list if issubclass(self._LIST_CTR, list) else tuple)
             init_str = repr(iterable_type(self))
         return f'{type_name}({init_str})'
 
     def copy(self) -> Self:
-        obj = type(self)()
-        with self._data_lock:
+        obj = self._new_empty()
+        with self._read_lock:
             obj._set = copy(self._set)
             obj._list = copy(self._list)
         if __debug__:
@@ -102,8 +208,8 @@ class _orderedset_base(Generic[T]):
         return self.copy()
 
     def __deepcopy__(self, memo: object) -> Self:
-        obj = type(self)()
-        with self._data_lock:
+        obj = self._new_empty()
+        with self._read_lock:
             obj._set = deepcopy(self._set, memo)
             obj._list = deepcopy(self._list, memo)
         if __debug__:
@@ -127,12 +233,38 @@ class _orderedset_base(Generic[T]):
     def __getitem__(self, index: slice) -> Self:
         ...
 
+    # Slicing returns a copy (an ordered set of the same type), like
+    # slicing a `list` does, and not a view (see `slice_view()`): code
+    # written for earlier versions relies on the result being an independent,
+    # mutable, hashable (for frozen sets) and picklable ordered set that
+    # stays valid after `self` changes, which a view is not.
     def __getitem__(self, index):
         if isinstance(index, slice):
             if index == slice(None):
                 return self.copy()
-            return self._from_iterable(self._list[index])
-        return self._list[index]
+            if self._reads_lock_free():
+                return self._from_unique_values(self._list[index])
+            with self._read_lock:
+                return self._from_unique_values(self._list[index])
+        return self._list_getitem(index)
+
+    # Indexing and `index()` read the list in one call, so they need
+    # no lock if the list does not change on reads (see
+    # `_SHARED_READ_BACKENDS`), unless a reader-writer lock is used.
+    # Otherwise they take the lock for reading.
+    def _reads_lock_free(self) -> bool:
+        lock = self._read_lock
+        return (
+            lock is _NO_LOCK
+            or (lock is self._data_lock and type(self._list) in _SHARED_READ_BACKENDS)
+        )
+
+    # `self._list[index]`, locked if needed (see `_reads_lock_free()`).
+    def _list_getitem(self, index):
+        if self._reads_lock_free():
+            return self._list[index]
+        with self._read_lock:
+            return self._list[index]
 
     def __reversed__(self) -> Iterator[T]:
         return reversed(self._list)
@@ -141,17 +273,39 @@ class _orderedset_base(Generic[T]):
         index_args_extra = []
         if stop is not None:
             index_args_extra.append(stop)
-        return self._list.index(value, start, *index_args_extra)
+        if self._reads_lock_free():
+            return self._list.index(value, start, *index_args_extra)
+        with self._read_lock:
+            return self._list.index(value, start, *index_args_extra)
 
     def count(self, value: T) -> int:
         return int(value in self._set)  # 0 or 1
 
+    # Read-only views of the set and the list of this object, for APIs that
+    # want a `Set` or a `Sequence` (without copying the elements).
+    def as_set(self) -> '_orderedset_set_view[T]':
+        return _orderedset_set_view(self)
+
+    def as_sequence(self) -> '_orderedset_sequence_view[T]':
+        return _orderedset_sequence_view(self)
+
+    # A read-only view of `self[start:stop:step]` that does not copy
+    # the elements. It is invalidated by changes of this object.
+    def slice_view(
+        self,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+        step: Optional[int] = None,
+    ) -> '_orderedset_slice_view[T]':
+        return _orderedset_slice_view(self, range(len(self))[start:stop:step])
+
     ComparisonOpMethod: TypeAlias = Callable[[Self, object], ComparisonResult]
 
     def __eq__(self, other: object) -> ComparisonResult:
         # "ordered set" in this implementation is not an instance
         # of any built-in collection type.
         # So the cases for built-in collections here are rather arbitrary.
+        self._freeze_storage()
         if isinstance(other, _orderedset_base):
             other_list = other._list
             if not isinstance(other_list, self._LIST_CTR):
@@ -184,8 +338,12 @@ class _orderedset_base(Generic[T]):
     @staticmethod
     def _make_cmp_op(op) -> ComparisonOpMethod:
         def op_new(self, other: object) -> ComparisonResult:
+            self._freeze_storage()
             if isinstance(other, _orderedset_base):
+                other._freeze_storage()
                 other = other._list
+                if not isinstance(other, (list, tuple)):
+                    other = list(other)     # a non-builtin backend
             # `() != []`:
             if isinstance(other, (list if issubclass(self._LIST_CTR, list) else tuple)):
                 return op(self._list, other)
@@ -232,45 +390,385 @@ class _orderedset_base(Generic[T]):
     # of `type(a)`.
     # <https://docs.python.org/3/reference/datamodel.html#object.__radd__>
 
+    # The operators build the result in one pass over each operand,
+    # without intermediate ordered sets, from the storage of ordered operands.
+
+    # The `Set` for membership tests and the values in the order of iteration.
+    @staticmethod
+    def _unwrap(other: Iterable[T]) -> tuple[Container[T], Iterable[T]]:
+        if isinstance(other, _orderedset_base):
+            return (other._set, other._list)
+        return (other, other)
+
+    # The common elements of the set and `other_set`, found in C (iterating
+    # over the smaller set) if both are built-in sets, otherwise `None`.
+    # If there are no common elements or only those, operators skip
+    # filtering the list (and hashing its elements); otherwise it is
+    # filtered by the smaller set of common elements.
+    def _builtin_common(self, other_set: Container[T]) -> Optional[Set[T]]:
+        if isinstance(self._set, (set, frozenset)) and isinstance(other_set, (set, frozenset)):
+            return self._set & other_set
+        return None
+
     def __and__(self, other: Set[T]) -> Self:
-        return self._from_iterable(filter(lambda v: v in other, self))
+        other_set, _ = self._unwrap(other)
+        with self._read_lock:
+            common = self._builtin_common(other_set)
+            if common is not None:
+                if not common:
+                    return self._from_unique_values(())
+                if len(common) == len(self._set):
+                    return self._from_unique_values(self._list)
+                other_set = common
+            return self._from_unique_values(filter(other_set.__contains__, self._list))
 
     def __rand__(self, other: Set[T]) -> Self:
         return self.__and__(other)
 
     def __or__(self, other: Set[T]) -> Self:
-        obj = orderedset(self)
-        obj |= other    # calls __ior__
-        return self._from_iterable(obj)
+        if not _is_set(other):
+            return self.union(other)
+        # Common elements are taken from `other`, in its order.
+        other_set, other_values = self._unwrap(other)
+        with self._read_lock:
+            common = self._builtin_common(other_set)
+            if common is not None and not common:
+                return self._from_unique_values(chain(self._list, other_values))
+            return self._from_unique_values(chain(
+                filterfalse(other_set.__contains__, self._list),
+                other_values,
+            ))
 
     def __ror__(self, other: Set[T]) -> Self:
         return self.__or__(other)
 
     def __xor__(self, other: Set[T]) -> Self:
-        obj = orderedset(self)
-        obj ^= other    # calls __ixor__
-        return self._from_iterable(obj)
+        if not _is_set(other):
+            return NotImplemented
+        other_set, other_values = self._unwrap(other)
+        with self._read_lock:
+            common = self._builtin_common(other_set)
+            if common is not None and not common:
+                return self._from_unique_values(chain(self._list, other_values))
+            return self._from_unique_values(chain(
+                filterfalse(other_set.__contains__, self._list),
+                filterfalse(self._set.__contains__, other_values),
+            ))
 
     def __rxor__(self, other: Set[T]) -> Self:
         return self.__xor__(other)
 
-    def _difference(self, other: Set[T], *, swap: bool = False) -> Self:
-        a, b = self, other
-        if swap:
-            a, b = b, a
-        return self._from_iterable(filter(lambda v: v not in b, a))
-
     def __sub__(self, other: Set[T]) -> Self:
-        return self._difference(other)
+        other_set, _ = self._unwrap(other)
+        with self._read_lock:
+            common = self._builtin_common(other_set)
+            if common is not None:
+                if not common:
+                    return self._from_unique_values(self._list)
+                if len(common) == len(self._set):
+                    return self._from_unique_values(())
+                other_set = common
+            return self._from_unique_values(filterfalse(other_set.__contains__, self._list))
 
     def __rsub__(self, other: Set[T]) -> Self:
-        return self._difference(other, swap=True)
+        with self._read_lock:
+            values = filterfalse(self._set.__contains__, other)
+            if not _is_set(other):
+                # takes care of duplicates
+                return self._from_iterable(values)
+            return self._from_unique_values(values)
+
+    # The set of `other` (an ordered set or a `Set`) for the in-place
+    # operator `op`.
+    def _operand_set(self, other: object, op: str) -> Set[T]:
+        if isinstance(other, _orderedset_base):
+            return other._set
+        if not _is_set(other):
+            raise TypeError(
+                f'unsupported operand type(s) for {op}:'
+                f' {type(self).__name__!r} and {type(other).__name__!r}'
+            )
+        return other
+
+    # The elements of the set that are in / not in `other_set`, found in C
+    # for built-in sets (using the stored hashes if `other_set` is a built-in
+    # set, too). The difference consists of the stored objects.
+
+    def _set_intersection(self, other_set: Iterable[T]) -> Set[T]:
+        if isinstance(self._set, (set, frozenset)):
+            return self._set.intersection(other_set)
+        return self._set & other_set
+
+    def _set_difference(self, other_set: Iterable[T]) -> Set[T]:
+        if isinstance(self._set, (set, frozenset)):
+            return self._set.difference(other_set)
+        return self._set - other_set
+
+    # N-ary operations accept any iterables and work in one pass
+    # (the results are the same as those of the chained operators).
+
+    # An object of this type with the values, which must be unique
+    # (they are iterated once).
+    def _from_unique_values(self, values: Iterable[T]) -> Self:
+        return self._from_iterable(values)
+
+    # A `Set` with the same elements as `other`, for membership tests.
+    @staticmethod
+    def _as_set(other: Iterable[T]) -> Set[T]:
+        if isinstance(other, _orderedset_base):
+            return other._set
+        if _is_set(other):
+            return other
+        return set(other)
+
+    def union(self, *others: Iterable[T]) -> Self:
+        # This algorithm works in O(n_self + n_others): an element ends up
+        # at its last occurrence among all the operands.
+        with self._read_lock:
+            values = list(chain(self._list, *others))
+        return self._from_unique_values(reversed(dict.fromkeys(reversed(values))))
+
+    def intersection(self, *others: Iterable[T]) -> Self:
+        # This algorithm works in O(n_self + n_smallest): the common
+        # elements of the others are found starting from the smallest one.
+        if not others:
+            return self.copy()
+        return self._from_unique_values(self._filter_common(others))
+
+    def _filter_common(self, others: tuple[Iterable[T], ...]) -> list[T]:
+        sets = sorted(map(self._as_set, others), key=len)
+        common = set(sets[0])
+        if len(sets) > 1:
+            common.intersection_update(*sets[1:])
+        with self._read_lock:
+            return list(filter(common.__contains__, self._list))
+
+    def difference(self, *others: Iterable[T]) -> Self:
+        # This algorithm works in O(n_self n_others + sum of sizes
+        # of the others that are not sets).
+        sets = list(map(self._as_set, others))
+        with self._read_lock:
+            values = iter(self._list)
+            for set_ in sets:
+                values = filterfalse(set_.__contains__, values)
+            return self._from_unique_values(values)
 
 
 Sequence.register(_orderedset_base)  # type: ignore
 Set.register(_orderedset_base)  # type: ignore
 
 
+# A slice of an ordered set that reads the storage of the set: iteration,
+# `len()`, `in` and `index()` work in O(length of the slice) or faster,
+# without copying the elements. Any change of the set invalidates the view
+# (then its methods raise `RuntimeError`); `materialize()` copies
+# the elements into an ordered set of the type of the set.
+class _orderedset_slice_view(Generic[T]):
+
+    __slots__ = ('_parent', '_range', '_version')
+
+    def __init__(self, parent: _orderedset_base[T], range_: range):
+        self._parent: _orderedset_base[T] = parent
+        self._range: range = range_
+        # Immutable sets have no version.
+        self._version: int = getattr(parent, '_version', 0)
+
+    def _check_valid(self) -> None:
+        if getattr(self._parent, '_version', 0) != self._version:
+            raise RuntimeError(
+                f'{type(self._parent).__name__} changed after the slice view was created'
+            )
+
+    def _iter_range(self, range_: range) -> Iterator[T]:
+        self._check_valid()
+        parent = self._parent
+        it = map(parent._list_getitem, range_)
+        if isinstance(parent, _orderedset_versioned_mixin):
+            return self._iter_checked(parent._iter_versioned(it, self._version))
+        return it
+
+    def _iter_checked(self, it: Iterator[T]) -> Iterator[T]:
+        try:
+            yield from it
+        except IndexError:
+            # The list has shrunk since the iteration started.
+            self._check_valid()
+            raise
+
+    def __iter__(self) -> Iterator[T]:
+        return self._iter_range(self._range)
+
+    def __reversed__(self) -> Iterator[T]:
+        return self._iter_range(self._range[::-1])
+
+    def __len__(self) -> int:
+        self._check_valid()
+        return len(self._range)
+
+    def __bool__(self) -> bool:
+        return (len(self) > 0)
+
+    # Returns the position of the value in the parent or -1.
+    def _find(self, value: object) -> int:
+        range_ = self._range
+        parent = self._parent
+        with parent._read_lock:
+            self._check_valid()
+            if not range_ or value not in parent._set:
+                return -1
+            lo, hi = sorted((range_[0], range_[-1]))
+            # The elements are unique, so the search between the bounds
+            # of the slice finds the only occurrence.
+            try:
+                index = parent._list.index(value, lo, hi + 1)
+            except ValueError:
+                return -1
+        return (index if index in range_ else -1)
+
+    def __contains__(self, value: object) -> bool:
+        return (self._find(value) >= 0)
+
+    def __getitem__(self, index):
+        self._check_valid()
+        if isinstance(index, slice):
+            return type(self)(self._parent, self._range[index])
+        return self._parent._list_getitem(self._range[index])
+
+    def index(self, value: T, start: int = 0, stop: Optional[int] = None) -> int:
+        parent_index = self._find(value)
+        if parent_index < 0:
+            raise ValueError(f'{value!r} is not in list')
+        index = self._range.index(parent_index)
+        check_index_in_range(value, index, start, stop, len(self._range))
+        return index
+
+    def count(self, value: T) -> int:
+        return int(value in self)
+
+    # An ordered set with the elements of the view (the same as slicing
+    # the parent was when the view was created).
+    def materialize(self) -> _orderedset_base[T]:
+        parent = self._parent
+        with parent._read_lock:
+            self._check_valid()
+            return parent._from_unique_values(parent._list[self._slice()])
+
+    def _slice(self) -> slice:
+        range_ = self._range
+        if not range_:
+            return slice(0, 0)
+        # A range that ends at the first element has `stop == -1`.
+        stop = (range_.stop if range_.stop >= 0 else None)
+        return slice(range_.start, stop, range_.step)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self)!r})'
+
+    __hash__ = None     # type: ignore
+
+
+Sequence.register(_orderedset_slice_view)  # type: ignore
+
+
+class _orderedset_view_base(Generic[T]):
+
+    __slots__ = ('_parent',)
+
+    def __init__(self, parent: _orderedset_base[T]):
+        self._parent: _orderedset_base[T] = parent
+
+    def __len__(self) -> int:
+        return len(self._parent._set)
+
+    def __contains__(self, value: object) -> bool:
+        return (value in self._parent._set)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self)!r})'
+
+
+# A live view of the set of an ordered set (like `dict.keys()`). Set algebra
+# and comparisons run on the underlying set (for a `set` or a `frozenset`,
+# in C) and return objects of its type: `set` for mutable ordered sets,
+# `frozenset` for frozen ones.
+class _orderedset_set_view(_orderedset_view_base[T], Set[T]):
+
+    __slots__ = ()
+
+    # The underlying set of a view or an ordered set, the object otherwise.
+    @staticmethod
+    def _unwrap(other: object) -> object:
+        if isinstance(other, _orderedset_view_base):
+            other = other._parent
+        if isinstance(other, _orderedset_base):
+            return other._set
+        return other
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._parent._set)
+
+    @staticmethod
+    def _make_delegated_op(name: str, *, reflected: bool = False) -> Callable:
+        def op(self, other: object):
+            if not _is_set(other):
+                return NotImplemented
+            other = self._unwrap(other)
+            parent = self._parent
+            parent._freeze_storage()
+            with parent._read_lock:
+                set_ = parent._set
+                if reflected:
+                    # `other` is not a built-in set (it would have handled
+                    # the operation), so this coerces it.
+                    return getattr(type(set_)(other), name)(set_)
+                return getattr(set_, name)(other)
+        op.__name__ = name
+        return op
+
+    __eq__ = _make_delegated_op('__eq__')
+    __ne__ = _make_delegated_op('__ne__')
+    __lt__ = _make_delegated_op('__lt__')
+    __gt__ = _make_delegated_op('__gt__')
+    __le__ = _make_delegated_op('__le__')
+    __ge__ = _make_delegated_op('__ge__')
+    __and__ = _make_delegated_op('__and__')
+    __rand__ = _make_delegated_op('__and__', reflected=True)
+    __or__ = _make_delegated_op('__or__')
+    __ror__ = _make_delegated_op('__or__', reflected=True)
+    __xor__ = _make_delegated_op('__xor__')
+    __rxor__ = _make_delegated_op('__xor__', reflected=True)
+    __sub__ = _make_delegated_op('__sub__')
+    __rsub__ = _make_delegated_op('__sub__', reflected=True)
+
+    def isdisjoint(self, other: Iterable[object]) -> bool:
+        other = self._unwrap(other)
+        with self._parent._read_lock:
+            return self._parent._set.isdisjoint(other)
+
+    __hash__ = None     # type: ignore
+
+
+# A live view of the list of an ordered set. Membership tests use the set.
+class _orderedset_sequence_view(_orderedset_view_base[T], Sequence[T]):
+
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._parent)
+
+    def __reversed__(self) -> Iterator[T]:
+        return reversed(self._parent)
+
+    def __getitem__(self, index):
+        return self._parent._list_getitem(index)
+
+    def index(self, value: T, start: int = 0, stop: Optional[int] = None) -> int:
+        return self._parent.index(value, start, stop)
+
+    def count(self, value: T) -> int:
+        return self._parent.count(value)
+
+
 class _orderedset_from_unique_helper_mixin:
     @classmethod
     def _from_unique_make_exception_for_duplicate_values(cls) -> ValueError:
@@ -280,11 +778,17 @@ class _orderedset_from_unique_helper_mixin:
 
 class _orderedset_picklable_mixin(Generic[T]):
 
-    def __getstate__(self) -> tuple[Set[T], Sequence[T]]:
-        return (self._set, self._list)
-
-    def __setstate__(self, state: tuple[Set[T], Sequence[T]]):
-        set_, list_ = state
+    # The state includes the lock mode (`thread_safe`, `rw_lock`), so that
+    # it survives pickling; states without it (pickled by older versions)
+    # get the default locks.
+    def __getstate__(self) -> tuple[Set[T], Sequence[T], bool, bool]:
+        self._freeze_storage()
+        return (self._set, self._list, self.thread_safe, self.rw_lock)
+
+    def __setstate__(self, state: tuple[Set[T], Sequence[T], bool, bool]):
+        set_, list_, *lock_mode = state
+        # `__init__` is not called on unpickling.
+        self._init_locks(*lock_mode)
         self._set = set_
         self._list = list_
         # An inconsistency can only result from corrupt pickle data,
@@ -293,6 +797,29 @@ class _orderedset_picklable_mixin(Generic[T]):
         #self._check()
 
 
+# Every mutator of a mutable ordered set increments `_version`, so that
+# the iterators of `iter_checked()` (and slice views) detect changes.
+class _orderedset_versioned_mixin(Generic[T]):
+
+    _version: int = 0
+
+    # An iterator that raises `RuntimeError` (like those of `dict` do)
+    # if the set is changed during the iteration. It checks the version
+    # for every element, so it is several times slower than `iter()`
+    # (which is not checked).
+    def iter_checked(self, reverse: bool = False) -> Iterator[T]:
+        it = (reversed(self._list) if reverse else iter(self._list))
+        return self._iter_versioned(it, self._version)
+
+    def _iter_versioned(self, it: Iterator[T], version: int) -> Iterator[T]:
+        for value in it:
+            if self._version != version:
+                break
+            yield value
+        if self._version != version:
+            raise RuntimeError(f'{type(self).__name__} changed during iteration')
+
+
 class orderedfrozenset(
     _orderedset_picklable_mixin,
     _orderedset_from_unique_helper_mixin,
@@ -300,24 +827,66 @@ class orderedfrozenset(
     _orderedset_base
 ):
 
+    __slots__ = ('_hash',)
+
     _SET_CTR = frozenset
     _LIST_CTR = tuple
 
+    # An `orderedfrozenset` created from an `orderedset` with a list
+    # that does not change on reads (see `_SHARED_READ_BACKENDS`) shares
+    # its set and its list (see `orderedset.snapshot()`): until they are
+    # needed in their frozen form (by hashing, comparisons or pickling),
+    # they stay a `set` and a `list`. Other backends are copied.
     def __init__(self, iterable: Optional[Iterable[T]] = None):
         super().__init__()
+        self._hash: Optional[int] = None
         if iterable is not None:
             if not isinstance(iterable, _orderedset_base):
-                iterable = orderedset(iterable)    # takes care of duplicates
-            self._set = self._SET_CTR(iterable._set)
-            self._list = self._LIST_CTR(iterable._list)
+                # takes care of duplicates
+                iterable = orderedset(iterable, thread_safe=False)
+            if iterable._UNBOXED:
+                self._list = self._LIST_CTR(iterable._list)
+                self._set = self._SET_CTR(self._list)
+                return
+            if isinstance(iterable, orderedset) and iterable._shareable():
+                self._set, self._list = iterable._share()
+                return
+            with iterable._read_lock:
+                self._set = self._SET_CTR(iterable._set)
+                self._list = self._LIST_CTR(iterable._list)
         else:
             self._set = self._SET_CTR()
             self._list = self._LIST_CTR()
 
+    # Immutable, so it needs no lock.
+    @override
+    def _init_locks(self, thread_safe: bool = True, rw_lock: bool = False) -> None:
+        self._data_lock = self._read_lock = _NO_LOCK
+
+    @property
+    @override
+    def thread_safe(self) -> bool:
+        return True
+
+    @override
+    def _freeze_storage(self) -> None:
+        # Assigning the list last, other threads see the final types
+        # only when both attributes have them.
+        if not isinstance(self._list, self._LIST_CTR):
+            self._set = self._SET_CTR(self._set)
+            self._list = self._LIST_CTR(self._list)
+
     @classmethod
     def _from_iterable(cls, it: Iterable[T]) -> Self:
         return cls(it)
 
+    @override
+    def _from_unique_values(self, values: Iterable[T]) -> Self:
+        obj = type(self)()
+        obj._list = self._LIST_CTR(values)
+        obj._set = self._SET_CTR(obj._list)
+        return obj
+
     @classmethod
     def from_unique(cls, iterable: Iterable[T]) -> Self:
         collection = coerce_iterable_to_collection(iterable)
@@ -326,13 +895,24 @@ class orderedfrozenset(
             raise cls._from_unique_make_exception_for_duplicate_values()
         return obj
 
+    def __setstate__(self, state: tuple[Set[T], Sequence[T], bool, bool]):
+        super().__setstate__(state)
+        self._hash = None
+
+    # Equality is order-sensitive, so is the hash: it is the hash
+    # of the tuple of the elements (computed once), as this object is equal
+    # to that tuple.
     def __hash__(self) -> int:
-        assert (isinstance(self._set, frozenset) and isinstance(self._list, tuple))
-        return hash((self._set, self._list))
+        hash_ = self._hash
+        if hash_ is None:
+            self._freeze_storage()
+            hash_ = self._hash = hash(self._list)
+        return hash_
 
 
 # MutableSequence-like, MutableSet-like
 class orderedset(
+    _orderedset_versioned_mixin,
     _orderedset_picklable_mixin,
     _orderedset_from_unique_helper_mixin,
     _orderedset_base
@@ -341,28 +921,129 @@ class orderedset(
     _SET_CTR = set
     _LIST_CTR = list
 
-    def __init__(self, iterable: Optional[Iterable[T]] = None):
-        super().__init__()
+    # Whether `_set` and `_list` are shared with a snapshot (see
+    # `snapshot()`) and how many times they have been shared.
+    _shared: bool = False
+    _share_count: int = 0
+
+    # `backend` selects the type of the list that keeps the order
+    # of elements: a name of a registered backend or a class that implements
+    # `ListBackend`. Objects derived from this object by non-in-place
+    # operations use the default backend, copies keep the backend.
+    # `thread_safe=False` creates an object without a lock, for use
+    # by a single thread; `rw_lock=True` creates an object with
+    # a reader-writer lock, so that threads that only read it do not wait
+    # for each other. Derived objects and copies keep the locking.
+    def __init__(
+        self,
+        iterable: Optional[Iterable[T]] = None,
+        *,
+        backend: BackendSpec = None,
+        thread_safe: bool = True,
+        rw_lock: bool = False,
+    ):
+        super().__init__(thread_safe=thread_safe, rw_lock=rw_lock)
         # XXX: Types?? This is kinda broken.
         self._set: MutableSet
-        self._list: MutableSequence
+        self._list: ListBackend
+        list_ctr = get_backend(backend)
+        if rw_lock and list_ctr not in _SHARED_READ_BACKENDS:
+            # Other backends update their internal caches on reads.
+            raise ValueError(f'A reader-writer lock is not supported by {list_ctr.__name__}')
         if isinstance(iterable, _orderedset_base):
-            self._set = self._SET_CTR(iterable._set)
-            self._list = self._LIST_CTR(iterable._list)
+            self._list = list_ctr(iterable._list)
+            self._set = self._SET_CTR(self._list if iterable._UNBOXED else iterable._set)
             return
         self._set = self._SET_CTR()
-        self._list = self._LIST_CTR()
+        self._list = list_ctr()
         if iterable is not None:
             self.update(iterable)
 
-    @classmethod
-    def _from_iterable(cls, it: Iterable[T]) -> Self:
-        return cls(it)
+    def _new_list(self, iterable: Iterable[T]) -> ListBackend:
+        # keeps the backend
+        return type(self._list)(iterable)
+
+    # Copy-on-write: gives the object its own set and list instead of ones
+    # shared with a snapshot. Every mutator calls this (under the lock)
+    # before changing `_set` or `_list`.
+    def _unshare(self) -> None:
+        self._set = copy(self._set)
+        self._list = copy(self._list)
+        self._shared = False
+
+    # Whether the storage can be shared: other backends update their
+    # internal caches on reads, so readers of a shared one would race.
+    def _shareable(self) -> bool:
+        return (type(self._list) in _SHARED_READ_BACKENDS)
+
+    # Returns the set and the list to share them with an `orderedfrozenset`.
+    def _share(self) -> tuple[MutableSet, ListBackend]:
+        with self._data_lock:
+            self._shared = True
+            self._share_count += 1
+            return (self._set, self._list)
+
+    # An iterator over the elements as they are now, regardless of later
+    # changes. It shares the list with this object (like `snapshot()`
+    # does), so the list is copied only if this object is changed before
+    # the iteration ends; a list of another backend is copied at once.
+    def iter_snapshot(self) -> Iterator[T]:
+        with self._data_lock:
+            if not self._shareable():
+                return iter(list(self._list))
+            was_shared = self._shared
+            _, list_ = self._share()
+            share_count = self._share_count
+        return self._iter_shared(list_, was_shared, share_count)
+
+    def _iter_shared(
+        self, list_: ListBackend, was_shared: bool, share_count: int,
+    ) -> Iterator[T]:
+        try:
+            yield from list_
+        finally:
+            with self._data_lock:
+                # Nobody else shares the list, stop sharing it.
+                if (
+                    not was_shared and self._list is list_
+                    and self._share_count == share_count
+                ):
+                    self._shared = False
+
+    # An `orderedfrozenset` with the same elements, in O(1) (the same as
+    # `orderedfrozenset(self)`): it shares the set and the list with this
+    # object until this object is changed next time (then this object
+    # copies them). If this object is not needed anymore, this freezes it
+    # for free.
+    def snapshot(self) -> 'orderedfrozenset[T]':
+        return orderedfrozenset(self)
+
+    @override
+    def _new_empty(self) -> Self:
+        return type(self)(thread_safe=self.thread_safe, rw_lock=self.rw_lock)
+
+    @override
+    def _from_unique_values(self, values: Iterable[T]) -> Self:
+        obj = self._from_iterable(())
+        obj._list = obj._new_list(values)
+        obj._set = obj._SET_CTR(obj._list)
+        return obj
+
+    # Derived objects keep the locking.
+    def _from_iterable(self, it: Iterable[T]) -> Self:     # type: ignore
+        return type(self)(it, thread_safe=self.thread_safe, rw_lock=self.rw_lock)
 
     @classmethod
-    def from_unique(cls, iterable: Iterable[T]) -> Self:
+    def from_unique(
+        cls,
+        iterable: Iterable[T],
+        *,
+        backend: BackendSpec = None,
+        thread_safe: bool = True,
+        rw_lock: bool = False,
+    ) -> Self:
         collection = coerce_iterable_to_collection(iterable)
-        obj = cls(collection)
+        obj = cls(collection, backend=backend, thread_safe=thread_safe, rw_lock=rw_lock)
         if len(obj) != len(collection):
             raise cls._from_unique_make_exception_for_duplicate_values()
         return obj
@@ -378,59 +1059,151 @@ class orderedset(
         ...
 
     def __delitem__(self, index):
+        if self._data_lock is _NO_LOCK:
+            self._delitem(index)
+            return
         with self._data_lock:
-            if isinstance(index, slice):
-                self._set -= frozenset(self._list[index])
-            else:
-                self._set.remove(self._list[index])
-            del self._list[index]
+            self._delitem(index)
+
+    def _delitem(self, index):
+        if isinstance(index, slice):
+            values = frozenset(self._list[index])
+            if not values:
+                return
+        else:
+            values = (self._list[index],)   # may raise IndexError
+        self._version += 1
+        if self._shared:
+            self._unshare()
+        self._set.difference_update(values)
+        del self._list[index]
 
     # insert makes little sense and significantly increases complexity
 
     def insert_or_ignore(self, index: int, value: Hashable) -> None:
+        if self._data_lock is _NO_LOCK:
+            self._insert_or_ignore(index, value)
+            return
         with self._data_lock:
-            if value in self._set:
-                return
-            self._set.add(value)
-            self._list.insert(index, value)
+            self._insert_or_ignore(index, value)
+
+    def _insert_or_ignore(self, index: int, value: Hashable) -> None:
+        if value in self._set:
+            return
+        self._version += 1
+        if self._shared:
+            self._unshare()
+        self._set.add(value)
+        self._list.insert(index, value)
 
     def upsert(self, index: int, value: Hashable) -> None:
+        if self._data_lock is _NO_LOCK:
+            self._upsert(index, value)
+            return
         with self._data_lock:
-            if value in self._set:
-                self_len = len(self._list)
-                index_old = self._list.index(value)
-                _ = self._list.pop(index_old)
-                index %= ((self_len + 1) if index >= 0 else self_len)
-                if index > index_old:
-                    index -= 1
-            else:
-                self._set.add(value)
-            self._list.insert(index, value)
+            self._upsert(index, value)
+
+    def _upsert(self, index: int, value: Hashable) -> None:
+        self._version += 1
+        if self._shared:
+            self._unshare()
+        if value in self._set:
+            self_len = len(self._list)
+            index_old = self._list.index(value)
+            _ = self._list.pop(index_old)
+            index %= ((self_len + 1) if index >= 0 else self_len)
+            if index > index_old:
+                index -= 1
+            # The list refers to `value` now, so must the set.
+            self._set.remove(value)
+        self._set.add(value)
+        self._list.insert(index, value)
+
+    # Moves the elements of `other` (adding the absent ones) before
+    # the element that is at `index` now (like `list.insert()` does),
+    # skipping the elements of `other` themselves. The moved elements keep
+    # the order of their first occurrences in `other`.
+    def upsert_many(self, index: int, other: Iterable[T]) -> None:
+        # This algorithm works in O(n_old + n_new), rebuilding the list once.
+        with self._data_lock:
+            self._upsert_many(index, dict.fromkeys(other))
+
+    # Like `upsert_many()`, but raises `KeyError` (before moving anything)
+    # if any of the elements is absent.
+    def move_many(self, index: int, other: Iterable[T]) -> None:
+        with self._data_lock:
+            values = dict.fromkeys(other)
+            for value in values:
+                if value not in self._set:
+                    raise KeyError(value)
+            self._upsert_many(index, values)
+
+    def _upsert_many(self, index: int, values: dict[T, None]) -> None:
+        if not values:
+            return
+        self._version += 1
+        if self._shared:
+            self._unshare()
+        list_ = self._list
+        index = normalize_index(index, len(list_))
+        self._list = self._new_list(chain(
+            filterfalse(values.__contains__, islice(list_, index)),
+            values,
+            filterfalse(values.__contains__, islice(list_, index, None)),
+        ))
+        # The list refers to the objects from `values` now, so must the set.
+        self._set.difference_update(values)
+        self._set.update(values)
 
     # append makes little sense and significantly increases complexity
 
     def append_or_ignore(self, value: Hashable) -> None:
+        if self._data_lock is _NO_LOCK:
+            self._append_or_ignore(value)
+            return
         with self._data_lock:
-            if value in self._set:
-                return
-            self._set.add(value)
-            self._list.append(value)
+            self._append_or_ignore(value)
+
+    def _append_or_ignore(self, value: Hashable) -> None:
+        if value in self._set:
+            return
+        self._version += 1
+        if self._shared:
+            self._unshare()
+        self._set.add(value)
+        self._list.append(value)
 
     def uppend(self, value: Hashable) -> None:
+        if self._data_lock is _NO_LOCK:
+            self._uppend(value)
+            return
         with self._data_lock:
-            if value in self._set:
-                self._list.remove(value)
-            else:
-                self._set.add(value)
-            self._list.append(value)
+            self._uppend(value)
+
+    def _uppend(self, value: Hashable) -> None:
+        self._version += 1
+        if self._shared:
+            self._unshare()
+        if value in self._set:
+            self._list.remove(value)
+        else:
+            self._set.add(value)
+        self._list.append(value)
 
     def clear(self) -> None:
         with self._data_lock:
+            self._version += 1
+            if self._shared:
+                self._unshare()
             self._set.clear()
             self._list.clear()
 
     def reverse(self) -> None:
-        self._list.reverse()
+        with self._data_lock:
+            self._version += 1
+            if self._shared:
+                self._unshare()
+            self._list.reverse()
 
     # extend makes little sense and greatly increases complexity
     # (you've been warned)
@@ -438,49 +1211,204 @@ class orderedset(
     def extend_or_ignore(self, other: Iterable[T]) -> None:
         # This algorithm works in O(n_new).
         with self._data_lock:
-            for item in other:
-                self.append_or_ignore(item)
+            new_values = self._new_values(other)
+            if not new_values:
+                return
+            self._version += 1
+            if self._shared:
+                self._unshare()
+            self._list.extend(new_values)
+            self._set.update(new_values)
+
+    # Inserts the absent elements before `index` (like `list.insert()`
+    # does), in the order of their first occurrences, ignoring the present
+    # ones.
+    def insert_many_or_ignore(self, index: int, other: Iterable[T]) -> None:
+        # This algorithm works in O(n_old + n_new), splicing the list once.
+        with self._data_lock:
+            new_values = self._new_values(other)
+            if not new_values:
+                return
+            self._version += 1
+            if self._shared:
+                self._unshare()
+            list_ = self._list
+            if len(new_values) == 1:
+                list_.insert(index, new_values[0])
+            else:
+                index = normalize_index(index, len(list_))
+                if isinstance(list_, list):
+                    list_[index:index] = new_values
+                else:
+                    self._list = self._new_list(
+                        chain(islice(list_, index), new_values, islice(list_, index, None))
+                    )
+            self._set.update(new_values)
+
+    # The elements of `other` that are absent from this set, without
+    # repetitions, in the order of their first occurrences. O(n_new).
+    def _new_values(self, other: Iterable[T]) -> Sequence[T]:
+        return self._checked_values(
+            list(filterfalse(self._set.__contains__, dict.fromkeys(other)))
+        )
+
+    # The values to add, checked (and possibly converted) so that adding
+    # them cannot fail halfway: this raises before anything is changed.
+    # Any set and list accept any hashable values (see `orderedintset`).
+    def _checked_values(self, values: Collection[T]) -> Collection[T]:
+        return values
 
+    # Present elements move to the end; repeated elements of `other` end up
+    # in the order of their last occurrences (as if `uppend()` was called
+    # for each element).
     def update(self, other: Iterable[T]) -> None:
-        if not isinstance(other, Set):
-            # This algorithm works in O(n_new n_common).
-            with self._data_lock:
-                for item in other:
-                    self.uppend(item)
+        if other is self:
+            # Every element would be moved to the end, in the same order.
             return
         # This algorithm works in O(n_old + n_new).
-        # O(n_new) (or O(n_old)?) (or O(n_old + n_new), if we consider
-        # the copying):
-        intersection = self._set & other
+        if not _is_set(other):
+            # O(n_new): keep the last occurrences (in C).
+            if not isinstance(other, (list, tuple)):
+                other = list(other)
+            other = dict.fromkeys(reversed(dict.fromkeys(reversed(other)))).keys()
+        if len(other) == 0:
+            return
+        other_set = (other._set if isinstance(other, _orderedset_base) else other)
+        values = self._checked_values(other)
         with self._data_lock:
+            # O(min(n_old, n_new)):
+            intersection = self._set_intersection(other_set)
+            self._version += 1
+            if self._shared:
+                self._unshare()
             # O(n_old):
-            self._list = self._LIST_CTR(
-                filter(lambda v: v not in intersection, self._list)
-            )
-            self._list.extend(other)    # all values in `other` must be unique
+            self._remove_from_list(intersection)
+            self._list.extend(values)   # all values in `other` must be unique
             # O(n_new):
-            self._set |= other
+            if intersection:
+                # The list refers to the common objects from `other` now,
+                # so must the set.
+                self._set.difference_update(intersection)
+            self._set.update(values)
 
     def pop(self, index: int = -1) -> Hashable:
+        if self._data_lock is _NO_LOCK:
+            return self._pop(index)
         with self._data_lock:
-            value = self._list.pop(index)   # may raise IndexError
-            self._set.remove(value)
+            return self._pop(index)
+
+    def _pop(self, index: int) -> Hashable:
+        if not -len(self._list) <= index < len(self._list):
+            raise IndexError('pop index out of range')
+        self._version += 1
+        if self._shared:
+            self._unshare()
+        value = self._list.pop(index)
+        self._set.remove(value)
         return value
 
     def remove(self, value: Hashable) -> None:
+        if self._data_lock is _NO_LOCK:
+            self._remove(value)
+            return
         with self._data_lock:
-            self._set.remove(value)  # may raise KeyError
-            self._list.remove(value)
+            self._remove(value)
+
+    def _remove(self, value: Hashable) -> None:
+        if value not in self._set:
+            raise KeyError(value)
+        self._version += 1
+        if self._shared:
+            self._unshare()
+        self._set.remove(value)
+        self._list.remove(value)
 
     # add makes no sense
 
     def discard(self, value: Hashable) -> None:
+        if self._data_lock is _NO_LOCK:
+            self._discard(value)
+            return
         with self._data_lock:
-            try:
-                self._set.remove(value)
-            except KeyError:
+            self._discard(value)
+
+    def _discard(self, value: Hashable) -> None:
+        if value not in self._set:
+            return
+        self._version += 1
+        if self._shared:
+            self._unshare()
+        self._set.remove(value)
+        self._list.remove(value)
+
+    # Like `update()` for each of the others in turn.
+    def update_many(self, *others: Iterable[T]) -> None:
+        self.update(others[0] if len(others) == 1 else chain(*others))
+
+    def intersection_update(self, *others: Iterable[T]) -> None:
+        if not others:
+            return
+        with self._data_lock:
+            values = self._filter_common(others)
+            if len(values) == len(self._list):
                 return
-            self._list.remove(value)
+            self._version += 1
+            if self._shared:
+                self._unshare()
+            self._list = self._new_list(values)
+            self._set = self._SET_CTR(self._list)
+
+    def difference_update(self, *others: Iterable[T]) -> None:
+        self.discard_many(others[0] if len(others) == 1 else chain(*others))
+
+    # Removes the present elements in O(n_old + n_removed), rebuilding
+    # the list once.
+    def discard_many(self, other: Iterable[T]) -> None:
+        with self._data_lock:
+            self._remove_present(set(filter(self._set.__contains__, other)))
+
+    # Like `discard_many()`, but raises `KeyError` (before removing
+    # anything) if any of the elements is missing. Repeated elements
+    # are removed once.
+    def remove_many(self, other: Iterable[T]) -> None:
+        with self._data_lock:
+            values = set(other)
+            for value in values:
+                if value not in self._set:
+                    raise KeyError(value)
+            self._remove_present(values)
+
+    # All the values must be present.
+    def _remove_present(self, values: Set[T]) -> None:
+        if not values:
+            return
+        self._version += 1
+        if self._shared:
+            self._unshare()
+        self._remove_from_list(values)
+        self._set.difference_update(values)
+
+    # Removes the values (which must be present in the set, too) from
+    # the list only, rebuilding it once if there are several values.
+    def _remove_from_list(self, values: Set[T]) -> None:
+        list_ = self._list
+        if len(values) <= _REMOVE_ONE_BY_ONE_MAX or not isinstance(list_, _SHIFTING_BACKENDS):
+            # Backends that do not shift the elements remove each one
+            # in O(1) or O(log n).
+            for value in values:
+                list_.remove(value)
+            return
+        if not self._UNBOXED and isinstance(type(list_[0]).__hash__, FunctionType):
+            # The elements are hashed by Python code (like frozen dataclasses
+            # are), so they are found by identity if the values are the objects
+            # in the list (that is usual).
+            ids = set(map(id, values))
+            selectors = list(map(ids.__contains__, map(id, list_)))
+            if selectors.count(True) == len(values):
+                self._list = self._new_list(compress(list_, map(not_, selectors)))
+                return
+        # O(n_old) hashes:
+        self._list = self._new_list(filterfalse(values.__contains__, list_))
 
     # When an in-place method for a binary arithmetic operation
     # is not available, a functional method is called instead. So in `a X= b`
@@ -488,79 +1416,813 @@ class orderedset(
     # <https://docs.python.org/3/reference/datamodel.html#object.__iadd__>
 
     def __iand__(self, other: Set[T]) -> Self:
+        other_set = self._operand_set(other, '&=')
         with self._data_lock:
-            self._set &= other  # may raise TypeError
-            self._list = self._LIST_CTR(filter(lambda v: v in other, self._list))
+            removed = self._set_difference(other_set)
+            if not removed:
+                return self
+            self._version += 1
+            if self._shared:
+                self._unshare()
+            self._remove_from_list(removed)
+            self._set -= removed
         return self
 
-    def __or__(self, other: Set[T]) -> Self:
-        obj = self.copy()
-        obj |= other    # calls __ior__
-        return obj
-
-    #def __ror__(self, other: Set[T]) -> Self:
-    #    return self.__or__(other)
-
     def __ior__(self, other: Set[T]) -> Self:
         self.update(other)
         return self
 
-    def __xor__(self, other: Set[T]) -> Self:
-        obj = self.copy()
-        obj ^= other    # calls __ixor__
-        return obj
-
-    #def __rxor__(self, other: Set[T]) -> Self:
-    #    return self.__xor__(other)
-
+    # Common elements are removed, new elements are added to the end
+    # in the order of iteration of `other`.
     def _symmetric_difference_update(self, other: Set[T]) -> None:
-        if isinstance(other, _orderedset_base):
-            # This algorithm works in O(n_new n_common).
-            with self._data_lock:
-                for item in other:
-                    try:
-                        self._set.remove(item)
-                    except KeyError:
-                        self._set.add(item)
-                        self._list.append(item)
-                    else:
-                        self._list.remove(item)
+        if other is self:
+            self.clear()
             return
-        if isinstance(other, Set):  # pragma: no branch
-            # This algorithm works in O(n_old + n_new). But it disregards
-            # the order the elements are retrieved from the `other` set.
-            # O(n_old) (or O(n_old + n_new), if we consider the copying):
-            new_difference = other - self._set
-            with self._data_lock:
+        if not _is_set(other):
+            raise TypeError(
+                f'Cannot XOR a {type(self).__name__} with a {type(other).__name__},'
+                ' a set type is required'
+            )
+        # This algorithm works in O(n_old + n_new).
+        other_set: Set[T] = other
+        other_values: Iterable[T] = other
+        if isinstance(other, _orderedset_base):
+            other_set = other._set
+            other_values = other._list
+        with self._data_lock:
+            # O(n_new):
+            new_values = self._new_values(other_values)
+            has_common = (len(new_values) < len(other_set))
+            if not (new_values or has_common):
+                return
+            self._version += 1
+            if self._shared:
+                self._unshare()
+            if has_common:
                 # O(n_new):
-                self._set ^= other
+                common = self._set_intersection(other_set)
                 # O(n_old):
-                self._list = self._LIST_CTR(
-                    filter(lambda v: v not in other, self._list)
-                )
-                # Here we disregard the order of iteration of `other`,
-                # using `new_difference` instead:
-                self._list.extend(new_difference)
-            return
-        raise TypeError(    # pragma: no cover
-            f'Cannot XOR a {type(self).__name__} with a {type(other).__name__},'
-            ' a set type is required'
-        )
+                self._remove_from_list(common)
+                self._set.difference_update(common)
+            self._list.extend(new_values)
+            self._set.update(new_values)
 
     def __ixor__(self, other: Set[T]) -> Self:
         self._symmetric_difference_update(other)
         return self
 
-    def __sub__(self, other: Set[T]) -> Self:
-        return self._from_iterable(filter(lambda v: v not in other, self))
+    def __isub__(self, other: Set[T]) -> Self:
+        other_set = self._operand_set(other, '-=')
+        with self._data_lock:
+            common = self._set_intersection(other_set)
+            if not common:
+                return self
+            self._version += 1
+            if self._shared:
+                self._unshare()
+            self._remove_from_list(common)
+            self._set.difference_update(common)
+        return self
 
-    #def __rsub__(self, other: Set[T]) -> Self:
-    #    return self.__sub__(other)
+
+# MutableSet-like. The order of elements is the order of their keys
+# (the elements themselves by default); elements with equal keys are kept
+# in the order of insertion. Positional insertion and moving of elements
+# make no sense here.
+class sortedorderedset(
+    _orderedset_versioned_mixin,
+    _orderedset_from_unique_helper_mixin,
+    _orderedset_base
+):
+
+    __slots__ = ('_key',)
+
+    _SET_CTR = set
+    _LIST_CTR = list
+
+    def __init__(
+        self,
+        iterable: Optional[Iterable[T]] = None,
+        *,
+        key: Optional[Callable[[T], object]] = None,
+        thread_safe: bool = True,
+        rw_lock: bool = False,
+    ):
+        super().__init__(thread_safe=thread_safe, rw_lock=rw_lock)
+        self._set: MutableSet
+        self._list: list
+        self._key: Optional[Callable[[T], object]] = key
+        if isinstance(iterable, sortedorderedset) and iterable._key is key:
+            self._set = self._SET_CTR(iterable._set)
+            self._list = self._LIST_CTR(iterable._list)
+            return
+        self._set = self._SET_CTR()
+        self._list = self._LIST_CTR()
+        if iterable is not None:
+            self.update(iterable)
+
+    @override
+    def _check(self) -> None:
+        super()._check()
+        with self._read_lock:
+            keys = (self._list if self._key is None else list(map(self._key, self._list)))
+            if any(k_next < k for k, k_next in zip(keys, keys[1:])):  # pragma: no cover
+                raise ValueError('Inconsistency detected: the list is not sorted')
+
+    @property
+    def key(self) -> Optional[Callable[[T], object]]:
+        return self._key
+
+    @override
+    def _new_empty(self) -> Self:
+        return type(self)(key=self._key, thread_safe=self.thread_safe, rw_lock=self.rw_lock)
+
+    # Derived objects keep the key and the locking.
+    def _from_iterable(self, it: Iterable[T]) -> Self:     # type: ignore
+        return type(self)(
+            it, key=self._key, thread_safe=self.thread_safe, rw_lock=self.rw_lock,
+        )
+
+    @classmethod
+    def from_unique(
+        cls,
+        iterable: Iterable[T],
+        *,
+        key: Optional[Callable[[T], object]] = None,
+        thread_safe: bool = True,
+        rw_lock: bool = False,
+    ) -> Self:
+        collection = coerce_iterable_to_collection(iterable)
+        obj = cls(collection, key=key, thread_safe=thread_safe, rw_lock=rw_lock)
+        if len(obj) != len(collection):
+            raise cls._from_unique_make_exception_for_duplicate_values()
+        return obj
+
+    @override
+    def copy(self) -> Self:
+        obj = self._new_empty()
+        with self._read_lock:
+            obj._set = copy(self._set)
+            obj._list = copy(self._list)
+        return obj
+
+    @override
+    def __deepcopy__(self, memo: object) -> Self:
+        obj = self._new_empty()
+        with self._read_lock:
+            obj._set = deepcopy(self._set, memo)
+            obj._list = deepcopy(self._list, memo)
+        return obj
+
+    # Like that of the other ordered sets, the state includes the lock mode.
+    def __getstate__(
+        self,
+    ) -> tuple[Set[T], Sequence[T], Optional[Callable[[T], object]], bool, bool]:
+        return (self._set, self._list, self._key, self.thread_safe, self.rw_lock)
+
+    def __setstate__(
+        self,
+        state: tuple[Set[T], Sequence[T], Optional[Callable[[T], object]], bool, bool],
+    ):
+        set_, list_, key, *lock_mode = state
+        self._init_locks(*lock_mode)
+        self._set = set_
+        self._list = list_
+        self._key = key
+
+    # Searching by a key works in O(log n).
+
+    def bisect_key_left(self, key: object) -> int:
+        return bisect_left(self._list, key, key=self._key)
+
+    def bisect_key_right(self, key: object) -> int:
+        return bisect_right(self._list, key, key=self._key)
+
+    def _key_of(self, value: T) -> object:
+        return (value if self._key is None else self._key(value))
+
+    def bisect_left(self, value: T) -> int:
+        return self.bisect_key_left(self._key_of(value))
+
+    def bisect_right(self, value: T) -> int:
+        return self.bisect_key_right(self._key_of(value))
+
+    bisect = bisect_right
+
+    def irange_key(
+        self,
+        min_key: object = None,
+        max_key: object = None,
+        inclusive: tuple[bool, bool] = (True, True),
+        reverse: bool = False,
+    ) -> Iterator[T]:
+        # `None` means no bound.
+        with self._read_lock:
+            start = 0
+            if min_key is not None:
+                start = (
+                    self.bisect_key_left(min_key) if inclusive[0]
+                    else self.bisect_key_right(min_key)
+                )
+            stop = len(self._list)
+            if max_key is not None:
+                stop = (
+                    self.bisect_key_right(max_key) if inclusive[1]
+                    else self.bisect_key_left(max_key)
+                )
+            values = self._list[start:stop]
+        return (reversed(values) if reverse else iter(values))
+
+    def irange(
+        self,
+        minimum: Optional[T] = None,
+        maximum: Optional[T] = None,
+        inclusive: tuple[bool, bool] = (True, True),
+        reverse: bool = False,
+    ) -> Iterator[T]:
+        return self.irange_key(
+            (None if minimum is None else self._key_of(minimum)),
+            (None if maximum is None else self._key_of(maximum)),
+            inclusive,
+            reverse,
+        )
+
+    @override
+    def index(self, value: T, start: int = 0, stop: Optional[int] = None) -> int:
+        if self._read_lock is _NO_LOCK:
+            return self._index(value, start, stop)
+        with self._read_lock:
+            return self._index(value, start, stop)
+
+    def _index(self, value: T, start: int = 0, stop: Optional[int] = None) -> int:
+        # This algorithm works in O(log n + n_equal_keys).
+        if value not in self._set:
+            raise ValueError(f'{value!r} is not in list')
+        key = self._key_of(value)
+        list_ = self._list
+        index = self.bisect_key_left(key)
+        index_stop = self.bisect_key_right(key)
+        while index < index_stop and list_[index] != value:
+            index += 1
+        check_index_in_range(value, index, start, stop, len(list_))
+        return index
+
+    # __setitem__ does not make sense
+
+    @overload
+    def __delitem__(self, index: int) -> None:
+        ...
+
+    @overload
+    def __delitem__(self, index: slice) -> None:
+        ...
+
+    def __delitem__(self, index):
+        if self._data_lock is _NO_LOCK:
+            self._delitem(index)
+            return
+        with self._data_lock:
+            self._delitem(index)
+
+    def _delitem(self, index):
+        if isinstance(index, slice):
+            self._set -= frozenset(self._list[index])
+        else:
+            self._set.remove(self._list[index])   # may raise IndexError
+        del self._list[index]
+        self._version += 1
+
+    def add(self, value: T) -> None:
+        if self._data_lock is _NO_LOCK:
+            self._add(value)
+            return
+        with self._data_lock:
+            self._add(value)
+
+    def _add(self, value: T) -> None:
+        # This algorithm works in O(log n) (plus the cost of shifting
+        # the elements of the list).
+        if value in self._set:
+            return
+        # Comparing the keys may raise, so the position is found first.
+        index = bisect_right(self._list, self._key_of(value), key=self._key)
+        self._version += 1
+        self._set.add(value)
+        self._list.insert(index, value)
+
+    def update(self, other: Iterable[T]) -> None:
+        with self._data_lock:
+            new_values = [v for v in dict.fromkeys(other) if v not in self._set]
+            if len(new_values) == 1:
+                self._add(new_values[0])
+                return
+            if not new_values:
+                return
+            # O((n_old + n_new) log n_new); sorting is stable and merges
+            # sorted runs, so elements with equal keys stay in order.
+            # Comparing the keys may raise, so the set is changed after.
+            values = sorted(chain(self._list, new_values), key=self._key)
+            self._version += 1
+            self._set.update(new_values)
+            self._list = values
+
+    def clear(self) -> None:
+        with self._data_lock:
+            self._version += 1
+            self._set.clear()
+            self._list.clear()
+
+    def pop(self, index: int = -1) -> T:
+        if self._data_lock is _NO_LOCK:
+            return self._pop(index)
+        with self._data_lock:
+            return self._pop(index)
+
+    def _pop(self, index: int) -> T:
+        value = self._list.pop(index)   # may raise IndexError
+        self._version += 1
+        self._set.remove(value)
+        return value
+
+    def remove(self, value: T) -> None:
+        if self._data_lock is _NO_LOCK:
+            self._remove(value)
+            return
+        with self._data_lock:
+            self._remove(value)
+
+    def _remove(self, value: T) -> None:
+        if value not in self._set:
+            raise KeyError(value)
+        del self._list[self._index(value)]
+        self._version += 1
+        self._set.remove(value)
+
+    def discard(self, value: T) -> None:
+        if self._data_lock is _NO_LOCK:
+            self._discard(value)
+            return
+        with self._data_lock:
+            self._discard(value)
+
+    def _discard(self, value: T) -> None:
+        if value in self._set:
+            self._remove(value)
+
+    def __iand__(self, other: Set[T]) -> Self:
+        other_set = self._operand_set(other, '&=')
+        with self._data_lock:
+            removed = self._set_difference(other_set)
+            if not removed:
+                return self
+            self._version += 1
+            self._set -= removed
+            self._list = self._LIST_CTR(filter(self._set.__contains__, self._list))
+        return self
+
+    def __ior__(self, other: Set[T]) -> Self:
+        self.update(other)
+        return self
+
+    def __ixor__(self, other: Set[T]) -> Self:
+        with self._data_lock:
+            new_values = [v for v in other if v not in self._set]
+            self.__isub__(other)
+            self.update(new_values)
+        return self
 
     def __isub__(self, other: Set[T]) -> Self:
+        other_set = self._operand_set(other, '-=')
         with self._data_lock:
-            self._set -= other  # may raise TypeError   # type: ignore
-            self._list = self._LIST_CTR(
-                filter(lambda v: v not in other, self._list)
-            )   # type: ignore
+            common = self._set_intersection(other_set)
+            if not common:
+                return self
+            self._version += 1
+            self._set -= common
+            self._list = self._LIST_CTR(filter(self._set.__contains__, self._list))
         return self
+
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+# Views of ordered dicts support positional access (`d.items()[i]`).
+class _ordereddict_view_base(Generic[K, V]):
+
+    __slots__ = ('_mapping',)
+
+    def __init__(self, mapping: '_ordereddict_base[K, V]'):
+        self._mapping = mapping
+
+    def __len__(self) -> int:
+        return len(self._mapping)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self)!r})'
+
+
+# Set algebra on keys is delegated to the ordered set of keys, so
+# the results are ordered sets (of the same mutability as the dict).
+class _ordereddict_keys_view(_ordereddict_view_base[K, V]):
+
+    __slots__ = ()
+
+    @staticmethod
+    def _unwrap(other: object) -> object:
+        if isinstance(other, _ordereddict_keys_view):
+            return other._mapping._keys
+        return other
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._mapping._keys)
+
+    def __reversed__(self) -> Iterator[K]:
+        return reversed(self._mapping._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return (key in self._mapping._data)
+
+    def __getitem__(self, index):
+        return self._mapping._keys[index]
+
+    def index(self, key: K, start: int = 0, stop: Optional[int] = None) -> int:
+        return self._mapping.index(key, start, stop)
+
+    def count(self, key: K) -> int:
+        return int(key in self._mapping._data)
+
+    @staticmethod
+    def _make_delegated_op(name: str) -> Callable:
+        def op(self, other: object):
+            return getattr(self._mapping._keys, name)(self._unwrap(other))
+        op.__name__ = name
+        return op
+
+    __eq__ = _make_delegated_op('__eq__')
+    __ne__ = _make_delegated_op('__ne__')
+    __lt__ = _make_delegated_op('__lt__')
+    __gt__ = _make_delegated_op('__gt__')
+    __le__ = _make_delegated_op('__le__')
+    __ge__ = _make_delegated_op('__ge__')
+    __and__ = _make_delegated_op('__and__')
+    __rand__ = _make_delegated_op('__rand__')
+    __or__ = _make_delegated_op('__or__')
+    __ror__ = _make_delegated_op('__ror__')
+    __xor__ = _make_delegated_op('__xor__')
+    __rxor__ = _make_delegated_op('__rxor__')
+    __sub__ = _make_delegated_op('__sub__')
+    __rsub__ = _make_delegated_op('__rsub__')
+    isdisjoint = _make_delegated_op('isdisjoint')
+
+    __hash__ = None     # type: ignore
+
+
+# The mixin methods of `Sequence` (`index()`, `count()`) work in O(n).
+class _ordereddict_values_view(_ordereddict_view_base[K, V], Sequence[V]):
+
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[V]:
+        data = self._mapping._data
+        return (data[k] for k in self._mapping._keys)
+
+    def __reversed__(self) -> Iterator[V]:
+        data = self._mapping._data
+        return (data[k] for k in reversed(self._mapping._keys))
+
+    def __contains__(self, value: object) -> bool:
+        return any((v is value or v == value) for v in self._mapping._data.values())
+
+    def __getitem__(self, index):
+        data = self._mapping._data
+        if isinstance(index, slice):
+            return [data[k] for k in self._mapping._keys[index]]
+        return data[self._mapping._keys[index]]
+
+
+# Set algebra and comparisons are the mixin methods of `Set`; the results
+# of set algebra are built-in sets (like those of `dict.items()`).
+class _ordereddict_items_view(
+    _ordereddict_view_base[K, V],
+    Set[tuple[K, V]],
+    Sequence[tuple[K, V]],
+):
+
+    __slots__ = ()
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[tuple[K, V]]) -> set[tuple[K, V]]:
+        return set(it)
+
+    def __iter__(self) -> Iterator[tuple[K, V]]:
+        data = self._mapping._data
+        return ((k, data[k]) for k in self._mapping._keys)
+
+    def __reversed__(self) -> Iterator[tuple[K, V]]:
+        data = self._mapping._data
+        return ((k, data[k]) for k in reversed(self._mapping._keys))
+
+    def __contains__(self, item: object) -> bool:
+        try:
+            key, value = item    # type: ignore
+        except (TypeError, ValueError):
+            return False
+        data = self._mapping._data
+        try:
+            value_present = data[key]
+        except (KeyError, TypeError):
+            return False
+        return (value_present is value or value_present == value)
+
+    def __getitem__(self, index):
+        data = self._mapping._data
+        if isinstance(index, slice):
+            return [(k, data[k]) for k in self._mapping._keys[index]]
+        key = self._mapping._keys[index]
+        return (key, data[key])
+
+    def index(self, item: tuple[K, V], start: int = 0, stop: Optional[int] = None) -> int:
+        if item not in self:
+            raise ValueError(f'{item!r} is not in list')
+        return self._mapping.index(item[0], start, stop)
+
+    def count(self, item: object) -> int:
+        return int(item in self)
+
+
+Set.register(_ordereddict_keys_view)    # type: ignore
+Sequence.register(_ordereddict_keys_view)   # type: ignore
+
+
+# An ordered dict keeps its keys in an ordered set (so the order of keys
+# is stored by the same engine as the order of elements of `orderedset`)
+# and the values in a plain `dict`.
+class _ordereddict_base(Mapping[K, V]):
+
+    __slots__ = ('_data_lock', '_keys', '_data')
+
+    def __init__(self):
+        self._data_lock: AbstractContextManager = self._new_lock()
+        self._keys: _orderedset_base[K]
+        self._data: dict[K, V]
+
+    @classmethod
+    def _new_lock(cls) -> AbstractContextManager:
+        return RLock()
+
+    def _check(self) -> None:
+        with self._data_lock:
+            self._keys._check()
+            if self._keys._set != self._data.keys():    # pragma: no cover
+                raise ValueError(
+                    'Inconsistency detected: some keys are present only among the ordered'
+                    ' keys or only in the dict'
+                )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._keys)
+
+    def __reversed__(self) -> Iterator[K]:
+        return reversed(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return (key in self._data)
+
+    def __getitem__(self, key: K) -> V:
+        return self._data[key]
+
+    def index(self, key: K, start: int = 0, stop: Optional[int] = None) -> int:
+        return self._keys.index(key, start, stop)
+
+    def keys(self) -> _ordereddict_keys_view[K, V]:
+        return _ordereddict_keys_view(self)
+
+    def values(self) -> _ordereddict_values_view[K, V]:
+        return _ordereddict_values_view(self)
+
+    def items(self) -> _ordereddict_items_view[K, V]:
+        return _ordereddict_items_view(self)
+
+    @recursive_repr()
+    def __repr__(self) -> str:
+        type_name = type(self).__name__
+        init_str = ''
+        if len(self) > 0:
+            init_str = repr(list(self.items()))
+        return f'{type_name}({init_str})'
+
+    # Like `collections.OrderedDict`, comparison of two ordered dicts
+    # is order-sensitive, comparison with a `dict` is not.
+    def __eq__(self, other: object) -> ComparisonResult:
+        if isinstance(other, _ordereddict_base):
+            return (self._data == other._data and list(self._keys) == list(other._keys))
+        if isinstance(other, dict):
+            return (self._data == other)
+        return NotImplemented
+
+    @override
+    def __ne__(self, other: object) -> ComparisonResult:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return (not result)
+
+    def __reduce__(self):
+        return (type(self), (list(self.items()),))
+
+    def copy(self) -> Self:
+        return type(self)(self)
+
+    def __copy__(self) -> Self:
+        return self.copy()
+
+    @classmethod
+    def fromkeys(cls, iterable: Iterable[K], value: Optional[V] = None) -> Self:
+        return cls((k, value) for k in iterable)
+
+
+# MutableMapping-like. New keys are added to the end, assigning to present
+# keys keeps their positions (like `dict` does); `uppend()` also moves
+# a present key to the end.
+class ordereddict(_ordereddict_base[K, V], MutableMapping[K, V]):
+
+    __slots__ = ()
+
+    # `backend` selects the backend of the ordered set of keys (see
+    # `orderedset`). The default is `'indexed'`, so that `index()` works
+    # in O(1) amortized (at the cost of a map from keys to positions).
+    def __init__(
+        self,
+        other: Optional[Mapping[K, V] | Iterable[tuple[K, V]]] = None,
+        *,
+        backend: BackendSpec = None,
+    ):
+        super().__init__()
+        if backend is None:
+            backend = 'indexed'
+        self._keys: orderedset[K] = orderedset(backend=backend)
+        self._data = {}
+        if other is not None:
+            self.update(other)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        with self._data_lock:
+            if key not in self._data:
+                self._keys.append_or_ignore(key)
+            self._data[key] = value
+
+    def __delitem__(self, key: K) -> None:
+        with self._data_lock:
+            del self._data[key]     # may raise KeyError
+            self._keys.remove(key)
+
+    def uppend(self, key: K, value: V) -> None:
+        with self._data_lock:
+            self._keys.uppend(key)
+            self._data[key] = value
+
+    def move(self, key: K, index: int) -> None:
+        with self._data_lock:
+            if key not in self._data:
+                raise KeyError(key)
+            self._keys.upsert(index, key)
+
+    def popitem(self, index: int = -1) -> tuple[K, V]:
+        with self._data_lock:
+            key = self._keys.pop(index)     # may raise IndexError
+            return (key, self._data.pop(key))
+
+    def clear(self) -> None:
+        with self._data_lock:
+            self._keys.clear()
+            self._data.clear()
+
+    def reverse(self) -> None:
+        self._keys.reverse()
+
+    def update(self, other: Mapping[K, V] | Iterable[tuple[K, V]] = ()) -> None:
+        with self._data_lock:
+            if isinstance(other, Mapping):
+                other = other.items()
+            for key, value in other:
+                self[key] = value
+
+    def __or__(self, other: Mapping[K, V]) -> Self:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        obj = self.copy()
+        obj.update(other)
+        return obj
+
+    def __ior__(self, other: Mapping[K, V] | Iterable[tuple[K, V]]) -> Self:
+        self.update(other)
+        return self
+
+    @override
+    def copy(self) -> Self:
+        obj = type(self)()
+        with self._data_lock:
+            obj._keys = self._keys.copy()
+            obj._data = self._data.copy()
+        return obj
+
+
+# The keys are stored in a tuple, so the map from keys to their positions
+# (used by `index()`) is built on the first call, as is the hash.
+class orderedfrozendict(_ordereddict_base[K, V], Hashable):
+
+    __slots__ = ('_positions', '_hash')
+
+    def __init__(self, other: Optional[Mapping[K, V] | Iterable[tuple[K, V]]] = None):
+        super().__init__()
+        self._positions: Optional[dict[K, int]] = None
+        self._hash: Optional[int] = None
+        if isinstance(other, orderedfrozendict):
+            self._keys = other._keys
+            self._data = other._data
+            self._positions = other._positions
+            self._hash = other._hash
+            return
+        obj: ordereddict[K, V] = ordereddict(other)
+        self._keys: orderedfrozenset[K] = orderedfrozenset(obj._keys)
+        self._data = obj._data
+
+    @override
+    def index(self, key: K, start: int = 0, stop: Optional[int] = None) -> int:
+        positions = self._positions
+        if positions is None:
+            positions = self._positions = {k: i for i, k in enumerate(self._keys)}
+        try:
+            index = positions[key]
+        except (KeyError, TypeError):
+            raise ValueError(f'{key!r} is not in list') from None
+        check_index_in_range(key, index, start, stop, len(positions))
+        return index
+
+    def __hash__(self) -> int:
+        hash_ = self._hash
+        if hash_ is None:
+            hash_ = self._hash = hash((self._keys, frozenset(self._data.items())))
+        return hash_
+
+    # Immutable, so it needs no lock.
+    @override
+    @classmethod
+    def _new_lock(cls) -> AbstractContextManager:
+        return _NO_LOCK
+
+
+# MutableSequence-like, MutableSet-like. Elements are 64-bit signed integers
+# stored unboxed: the order in an `array.array`, membership in a hash table
+# over another `array.array` (about 16 to 40 bytes per element in total,
+# instead of about 100 for `orderedset`). Operations on elements are slower
+# than those of `orderedset` (the hash table is implemented in Python).
+class orderedintset(orderedset):
+
+    __slots__ = ()
+
+    _SET_CTR = int64set
+    _UNBOXED = True
+
+    def __init__(
+        self,
+        iterable: Optional[Iterable[int]] = None,
+        *,
+        thread_safe: bool = True,
+        rw_lock: bool = False,
+    ):
+        super().__init__(iterable, backend=int64list, thread_safe=thread_safe, rw_lock=rw_lock)
+
+    @classmethod
+    def from_unique(     # type: ignore
+        cls,
+        iterable: Iterable[int],
+        *,
+        thread_safe: bool = True,
+        rw_lock: bool = False,
+    ) -> Self:
+        collection = coerce_iterable_to_collection(iterable)
+        obj = cls(collection, thread_safe=thread_safe, rw_lock=rw_lock)
+        if len(obj) != len(collection):
+            raise cls._from_unique_make_exception_for_duplicate_values()
+        return obj
+
+    # Integers that do not fit into 64 bits and other values are rejected
+    # before the set is changed (the list would take a part of them).
+    @override
+    def _checked_values(self, values: Collection[int]) -> Collection[int]:     # type: ignore
+        return int64list(values)
+
+    @override
+    def _check(self) -> None:
+        with self._read_lock:
+            if len(self._set) != len(self._list):   # pragma: no cover
+                raise ValueError('Inconsistency detected: the list has duplicate elements')
+            if not all(map(self._set.__contains__, self._list)):  # pragma: no cover
+                raise ValueError(
+                    'Inconsistency detected: some elements are present only in the list'
+                )
@@ -1,6 +1,6 @@
 from collections.abc import Iterable, Collection
 from types import NotImplementedType
-from typing import TypeAlias, TypeVar
+from typing import Optional, TypeAlias, TypeVar
 
 
 ComparisonResult: TypeAlias = bool | NotImplementedType
@@ -15,3 +15,22 @@ def coerce_iterable_to_collection(
     if not isinstance(iterable, Collection):
         iterable = list(iterable)
     return iterable
+
+
+def normalize_index(index: int, length: int, *, clamp: bool = True) -> int:
+    if index < 0:
+        index += length
+        if clamp and index < 0:
+            index = 0
+    elif clamp and index > length:
+        index = length
+    return index
+
+
+def check_index_in_range(
+    value: object, index: int, start: int, stop: Optional[int], length: int,
+) -> None:
+    start = normalize_index(start, length)
+    stop = (length if stop is None else normalize_index(stop, length))
+    if not (start <= index < stop):
+        raise ValueError(f'{value!r} is not in list')
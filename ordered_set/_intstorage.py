@@ -0,0 +1,239 @@
+from array import array
+from collections.abc import Iterable, Iterator, MutableSet
+from operator import eq, ne, lt, gt, le, ge
+
+from ordered_set._common import normalize_index
+
+
+# Containers for `orderedintset` that store 64-bit signed integers unboxed,
+# in `array.array` buffers: 8 bytes per element for the list and 8 bytes
+# per slot of the hash table (with 1.33 to 2.67 slots per element while
+# the set grows).
+
+_TYPECODE = 'q'
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+_MASK64 = (1 << 64) - 1
+# Fibonacci hashing: the golden ratio as a 64-bit fraction.
+_MULT = 0x9E3779B97F4A7C15
+
+# Markers of free slots of the hash table. Real elements with these values
+# are kept aside, in a tiny built-in set.
+_EMPTY = _INT64_MIN
+_DELETED = _INT64_MIN + 1
+
+
+def _check_int64(value: object) -> None:
+    if not isinstance(value, int):
+        raise TypeError(f'An integer is required, got {type(value).__name__}')
+    if not (_INT64_MIN <= value <= _INT64_MAX):
+        raise OverflowError(f'{value!r} does not fit into a 64-bit signed integer')
+
+
+# A list of 64-bit signed integers that implements `ListBackend`.
+class int64list(array):
+
+    __slots__ = ()
+
+    def __new__(cls, iterable: Iterable[int] = ()):
+        if not isinstance(iterable, (array, list, tuple)):
+            iterable = list(iterable)
+        return super().__new__(cls, _TYPECODE, iterable)
+
+    def __copy__(self):
+        return type(self)(self)
+
+    def __deepcopy__(self, memo: object):
+        return type(self)(self)
+
+    def copy(self):
+        return type(self)(self)
+
+    def __reduce_ex__(self, protocol: int):
+        return (type(self), (array(_TYPECODE, self),))
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.tolist()!r})'
+
+    def __reversed__(self) -> Iterator[int]:
+        return iter(self[::-1])
+
+    def clear(self) -> None:
+        del self[:]
+
+    @staticmethod
+    def _make_cmp_op(op):
+        def op_new(self, other: object) -> bool:
+            if isinstance(other, array):
+                return op(self.tolist(), other.tolist())
+            if isinstance(other, list):
+                return op(self.tolist(), other)
+            return NotImplemented
+        return op_new
+
+    __eq__ = _make_cmp_op(eq)
+    __ne__ = _make_cmp_op(ne)
+    __lt__ = _make_cmp_op(lt)
+    __gt__ = _make_cmp_op(gt)
+    __le__ = _make_cmp_op(le)
+    __ge__ = _make_cmp_op(ge)
+
+    __hash__ = None     # type: ignore
+
+    def insert(self, index: int, value: int) -> None:
+        # `array.insert` does not clamp large negative indices like `list`
+        # does; make it consistent.
+        super().insert(normalize_index(index, len(self)), value)
+
+
+# A set of 64-bit signed integers: a hash table with open addressing
+# (linear probing) over an `array.array`.
+class int64set(MutableSet):
+
+    __slots__ = ('_table', '_mask', '_shift', '_len', '_filled', '_special')
+
+    MAX_LOAD: float = 0.75
+
+    def __init__(self, iterable: Iterable[int] = ()):
+        self._table: array
+        self._mask: int
+        self._shift: int
+        self._len: int = 0
+        self._filled: int = 0   # slots that are not empty
+        self._special: set[int] = set()
+        self._allocate(8)
+        for value in iterable:
+            self.add(value)
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[int]):
+        return cls(it)
+
+    def _allocate(self, capacity: int) -> None:
+        self._table = array(_TYPECODE, (_EMPTY,)) * capacity
+        self._mask = capacity - 1
+        self._shift = 64 - (capacity.bit_length() - 1)
+        self._filled = 0
+        self._len = 0
+
+    # Rebuilds the table, dropping deleted slots.
+    def _resize(self, capacity: int) -> None:
+        values = [v for v in self._table if v > _DELETED]
+        self._allocate(capacity)
+        insert = self._insert_new
+        for value in values:
+            insert(value)
+
+    def _slot(self, value: int) -> int:
+        return ((value * _MULT) & _MASK64) >> self._shift
+
+    # Returns the slot of the value or -1.
+    def _find(self, value: int) -> int:
+        table = self._table
+        mask = self._mask
+        i = ((value * _MULT) & _MASK64) >> self._shift
+        while True:
+            v = table[i]
+            if v == value:
+                return i
+            if v == _EMPTY:
+                return -1
+            i = (i + 1) & mask
+
+    # The value must be absent and not special.
+    def _insert_new(self, value: int) -> None:
+        table = self._table
+        mask = self._mask
+        i = self._slot(value)
+        while table[i] > _DELETED:
+            i = (i + 1) & mask
+        if table[i] == _EMPTY:
+            self._filled += 1
+        table[i] = value
+        self._len += 1
+
+    def __len__(self) -> int:
+        return self._len + len(self._special)
+
+    def __iter__(self) -> Iterator[int]:
+        yield from self._special
+        for value in self._table:
+            if value > _DELETED:
+                yield value
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, int) or not (_INT64_MIN <= value <= _INT64_MAX):
+            return False
+        if value <= _DELETED:
+            return (value in self._special)
+        return (self._find(value) >= 0)
+
+    def add(self, value: int) -> None:
+        _check_int64(value)
+        if value <= _DELETED:
+            self._special.add(value)
+            return
+        if self._find(value) >= 0:
+            return
+        self._insert_new(value)
+        capacity = len(self._table)
+        if self._filled > self.MAX_LOAD * capacity:
+            # Grow if the table is crowded with elements, otherwise only
+            # drop deleted slots.
+            self._resize(capacity * 2 if self._len > self.MAX_LOAD * capacity / 2 else capacity)
+
+    def discard(self, value: int) -> None:
+        if not isinstance(value, int) or not (_INT64_MIN <= value <= _INT64_MAX):
+            return
+        if value <= _DELETED:
+            self._special.discard(value)
+            return
+        i = self._find(value)
+        if i < 0:
+            return
+        self._table[i] = _DELETED
+        self._len -= 1
+        capacity = len(self._table)
+        if capacity > 8 and self._len < capacity * self.MAX_LOAD / 8:
+            self._resize(capacity // 2)
+
+    def remove(self, value: int) -> None:
+        if value not in self:
+            raise KeyError(value)
+        self.discard(value)
+
+    def update(self, iterable: Iterable[int]) -> None:
+        for value in iterable:
+            self.add(value)
+
+    def difference_update(self, iterable: Iterable[int]) -> None:
+        for value in iterable:
+            self.discard(value)
+
+    def clear(self) -> None:
+        self._special.clear()
+        self._allocate(8)
+
+    def __copy__(self):
+        obj = type(self)()
+        obj._table = array(_TYPECODE, self._table)
+        obj._mask = self._mask
+        obj._shift = self._shift
+        obj._len = self._len
+        obj._filled = self._filled
+        obj._special = self._special.copy()
+        return obj
+
+    def copy(self):
+        return self.__copy__()
+
+    def __deepcopy__(self, memo: object):
+        return self.__copy__()
+
+    def __reduce__(self):
+        return (type(self), (array(_TYPECODE, self),))
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({sorted(self)!r})'
@@ -0,0 +1,148 @@
+from threading import Condition, Lock, get_ident
+from typing import Optional
+
+
+# A reentrant reader-writer lock. Any number of threads can hold it
+# for reading at the same time; a thread holding it for writing excludes
+# all other threads. Waiting writers take precedence over new readers
+# (so writers are not starved). The writer can also acquire the lock
+# for reading; a reader cannot upgrade to writing (that raises
+# `RuntimeError` instead of deadlocking).
+#
+# The lock counts acquisitions (see `stats()`).
+class rwlock:
+
+    __slots__ = (
+        '_cond',
+        '_readers',
+        '_writer',
+        '_writer_depth',
+        '_writers_waiting',
+        '_reads',
+        '_writes',
+        '_shared_reads',
+        '_read_waits',
+        '_write_waits',
+        'read',
+        'write',
+    )
+
+    def __init__(self):
+        self._cond: Condition = Condition(Lock())
+        self._readers: dict[int, int] = {}   # thread identifier -> depth
+        self._writer: Optional[int] = None
+        self._writer_depth: int = 0
+        self._writers_waiting: int = 0
+        self._reads: int = 0
+        self._writes: int = 0
+        self._shared_reads: int = 0
+        self._read_waits: int = 0
+        self._write_waits: int = 0
+        # context managers
+        self.read: _rwlock_read = _rwlock_read(self)
+        self.write: _rwlock_write = _rwlock_write(self)
+
+    def acquire_read(self) -> None:
+        me = get_ident()
+        with self._cond:
+            self._reads += 1
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            depth = self._readers.get(me, 0)
+            if depth == 0:
+                if self._writer is not None or self._writers_waiting > 0:
+                    self._read_waits += 1
+                    while self._writer is not None or self._writers_waiting > 0:
+                        self._cond.wait()
+                if self._readers:
+                    self._shared_reads += 1
+            self._readers[me] = depth + 1
+
+    def release_read(self) -> None:
+        me = get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth -= 1
+                return
+            depth = self._readers[me] - 1   # may raise KeyError
+            if depth > 0:
+                self._readers[me] = depth
+                return
+            del self._readers[me]
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        me = get_ident()
+        with self._cond:
+            self._writes += 1
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            if me in self._readers:
+                raise RuntimeError(
+                    'Cannot acquire a lock for writing while holding it for reading'
+                )
+            if self._writer is not None or self._readers:
+                self._write_waits += 1
+                self._writers_waiting += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._cond.wait()
+                finally:
+                    self._writers_waiting -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        with self._cond:
+            if self._writer != get_ident():
+                raise RuntimeError('Cannot release a lock for writing that is not held')
+            self._writer_depth -= 1
+            if self._writer_depth == 0:
+                self._writer = None
+                self._cond.notify_all()
+
+    # Counters of acquisitions:
+    # * `reads`, `writes`: acquisitions for reading and for writing;
+    # * `shared_reads`: acquisitions for reading while another thread was
+    #   reading (an exclusive lock would have made them wait);
+    # * `read_waits`, `write_waits`: acquisitions that had to wait.
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                'reads': self._reads,
+                'writes': self._writes,
+                'shared_reads': self._shared_reads,
+                'read_waits': self._read_waits,
+                'write_waits': self._write_waits,
+            }
+
+
+class _rwlock_read:
+
+    __slots__ = ('_lock',)
+
+    def __init__(self, lock: rwlock):
+        self._lock: rwlock = lock
+
+    def __enter__(self) -> None:
+        self._lock.acquire_read()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._lock.release_read()
+
+
+class _rwlock_write:
+
+    __slots__ = ('_lock',)
+
+    def __init__(self, lock: rwlock):
+        self._lock: rwlock = lock
+
+    def __enter__(self) -> None:
+        self._lock.acquire_write()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._lock.release_write()
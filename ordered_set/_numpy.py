@@ -0,0 +1,376 @@
+from collections.abc import Callable, Iterable, Iterator, Set
+from operator import eq, ne, lt, gt, le, ge
+from threading import RLock
+from typing import Any, Optional
+
+from typing_extensions import Self
+
+from ordered_set._common import ComparisonResult, check_index_in_range
+
+
+# NumPy is imported when the first `orderednumericset` is created (so that
+# importing the package does not import it).
+np: Any = None
+
+_NUMPY_MISSING_MESSAGE = (
+    'orderednumericset requires NumPy; install the extra "numpy"'
+    ' (asrelo-ordered-set[numpy])'
+)
+
+# Kinds of dtypes of numbers: boolean, signed and unsigned integers, floats.
+_NUMERIC_KINDS = 'biuf'
+
+
+def _import_numpy() -> None:
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:     # pragma: no cover
+            raise ImportError(_NUMPY_MISSING_MESSAGE) from None
+        np = numpy
+
+
+# Whether the object is an ordered set of this package (other than
+# `orderednumericset`).
+def _is_ordered_set(obj: object) -> bool:
+    from ordered_set import _orderedset_base
+    return isinstance(obj, _orderedset_base)
+
+
+# An ordered set of numbers stored in a one-dimensional NumPy array.
+# Bulk operations (the constructor, `update()`, `extend_or_ignore()`,
+# set algebra) are vectorized (`np.isin`, `np.unique`) and follow
+# the order semantics of `orderedset` for ordered operands: new elements
+# go to the end (and, for `update()`, so do present elements). Operations
+# on single elements work in O(n) (but in C). Membership and `index()` are
+# served from a sorted copy of the array that is built lazily, in O(log n).
+# NaN values are not supported.
+class orderednumericset:
+
+    __slots__ = ('_data_lock', '_array', '_sorted', '_sorted_order')
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None, *, dtype: Any = None):
+        _import_numpy()
+        self._data_lock: RLock = RLock()
+        self._array: np.ndarray = np.empty(0, dtype=(float if dtype is None else dtype))
+        self._sorted: Optional[np.ndarray] = None
+        self._sorted_order: Optional[np.ndarray] = None
+        if iterable is not None:
+            array = self._as_array(iterable)
+            if dtype is not None:
+                array = array.astype(dtype, copy=False)
+            self._set_array(self._unique_last(array))
+
+    @classmethod
+    def _from_array(cls, array: 'np.ndarray') -> Self:
+        obj = cls(dtype=array.dtype)
+        obj._array = array
+        return obj
+
+    @staticmethod
+    def _as_array(other: Iterable[Any]) -> 'np.ndarray':
+        if isinstance(other, orderednumericset):
+            return other._array
+        if not isinstance(other, np.ndarray):
+            if not isinstance(other, (list, tuple)):
+                other = list(other)
+            other = np.asarray(other)
+        if other.dtype.kind not in _NUMERIC_KINDS:
+            # Also integers that do not fit into 64 bits (`object` dtype).
+            raise TypeError(f'Numbers are required, got an array of dtype {other.dtype}')
+        if other.ndim != 1:
+            other = other.ravel()
+        return other
+
+    # The operand as an array of the dtype of this set, so that bulk
+    # operations that add elements do not change the dtype. Casting
+    # within a kind (like from `float64` to `float32`) is allowed, but
+    # not across kinds (like from floats to integers), nor casts that
+    # change integer values.
+    def _as_array_of_dtype(self, other: Iterable[Any]) -> 'np.ndarray':
+        array = self._as_array(other)
+        dtype = self._array.dtype
+        if array.dtype == dtype:
+            return array
+        try:
+            array_cast = array.astype(dtype, casting='same_kind')
+        except TypeError:
+            raise TypeError(
+                f'Cannot add values of dtype {array.dtype} to a set of dtype {dtype}'
+            ) from None
+        if (
+            dtype.kind in 'iu'
+            and not np.can_cast(array.dtype, dtype)
+            and not np.array_equal(array_cast, array)
+        ):
+            raise OverflowError(f'Values do not fit into dtype {dtype}')
+        return array_cast
+
+    # Keeps first occurrences of values, in order.
+    @staticmethod
+    def _unique_first(array: 'np.ndarray') -> 'np.ndarray':
+        _, indices = np.unique(array, return_index=True)
+        if len(indices) == len(array):
+            return array
+        return array[np.sort(indices)]
+
+    # Keeps last occurrences of values, in order.
+    @staticmethod
+    def _unique_last(array: 'np.ndarray') -> 'np.ndarray':
+        _, indices_reversed = np.unique(array[::-1], return_index=True)
+        if len(indices_reversed) == len(array):
+            return array
+        return array[np.sort((len(array) - 1) - indices_reversed)]
+
+    def _set_array(self, array: 'np.ndarray') -> None:
+        self._array = array
+        self._sorted = None
+        self._sorted_order = None
+
+    def _ensure_sorted(self) -> None:
+        if self._sorted is None:
+            # O(n log n):
+            order = np.argsort(self._array, kind='stable')
+            self._sorted_order = order
+            self._sorted = self._array[order]
+
+    # Returns the position of the value in the sorted array or -1.
+    def _find_sorted(self, value: Any) -> int:
+        self._ensure_sorted()
+        sorted_ = self._sorted
+        i = int(np.searchsorted(sorted_, value))
+        if i < len(sorted_) and sorted_[i] == value:
+            return i
+        return -1
+
+    def _check(self) -> None:
+        if self._array.ndim != 1:   # pragma: no cover
+            raise ValueError('Inconsistency detected: the array is not one-dimensional')
+        if len(np.unique(self._array)) != len(self._array):    # pragma: no cover
+            raise ValueError('Inconsistency detected: the array has duplicate elements')
+
+    @property
+    def dtype(self) -> 'np.dtype':
+        return self._array.dtype
+
+    # A read-only view of the array with the elements.
+    def to_numpy(self) -> 'np.ndarray':
+        view = self._array.view()
+        view.flags.writeable = False
+        return view
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> 'np.ndarray':
+        if dtype is not None:
+            return self._array.astype(dtype)
+        return self._array.copy()
+
+    def __repr__(self) -> str:
+        type_name = type(self).__name__
+        if len(self._array) == 0:
+            return f'{type_name}()'
+        return f'{type_name}({self._array.tolist()!r})'
+
+    def copy(self) -> Self:
+        with self._data_lock:
+            return self._from_array(self._array.copy())
+
+    def __copy__(self) -> Self:
+        return self.copy()
+
+    def __deepcopy__(self, memo: object) -> Self:
+        return self.copy()
+
+    def __reduce__(self):
+        return (type(self)._from_array, (self._array.copy(),))
+
+    def __bool__(self) -> bool:
+        return (len(self._array) > 0)
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._array)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return iter(self._array[::-1])
+
+    def __contains__(self, value: object) -> bool:
+        with self._data_lock:
+            try:
+                return (self._find_sorted(value) >= 0)
+            except TypeError:
+                return False
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_array(self._array[index].copy())
+        return self._array[index]
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        with self._data_lock:
+            i = self._find_sorted(value)
+            if i < 0:
+                raise ValueError(f'{value!r} is not in list')
+            index = int(self._sorted_order[i])     # type: ignore
+            check_index_in_range(value, index, start, stop, len(self._array))
+            return index
+
+    def count(self, value: Any) -> int:
+        return int(value in self)
+
+    # Comparisons follow those of `orderedset`: with ordered sets and lists
+    # they compare the sequences of elements, with built-in sets they
+    # compare the sets.
+    @staticmethod
+    def _make_cmp_op(op: Callable[[Any, Any], bool]) -> Callable:
+        def op_new(self, other: object) -> ComparisonResult:
+            if isinstance(other, orderednumericset):
+                if op is eq:
+                    return bool(np.array_equal(self._array, other._array))
+                if op is ne:
+                    return not np.array_equal(self._array, other._array)
+                return op(self._array.tolist(), other._array.tolist())
+            if _is_ordered_set(other):
+                return op(self._array.tolist(), list(other))   # type: ignore
+            if isinstance(other, list):
+                return op(self._array.tolist(), other)
+            if isinstance(other, (set, frozenset)):
+                return op(set(self._array.tolist()), other)
+            return NotImplemented
+        return op_new
+
+    __eq__ = _make_cmp_op(eq)
+    __ne__ = _make_cmp_op(ne)
+    __lt__ = _make_cmp_op(lt)
+    __gt__ = _make_cmp_op(gt)
+    __le__ = _make_cmp_op(le)
+    __ge__ = _make_cmp_op(ge)
+
+    __hash__ = None     # type: ignore
+
+    def isdisjoint(self, other: Iterable[Any]) -> bool:
+        return not bool(np.isin(self._as_array(other), self._array).any())
+
+    def is_set_equal(self, other: Iterable[Any]) -> bool:
+        other_array = self._as_array(other)
+        return (
+            len(np.unique(other_array)) == len(self._array)
+            and bool(np.isin(other_array, self._array).all())
+        )
+
+    # Bulk operations
+
+    def __and__(self, other: Iterable[Any]) -> Self:
+        array = self._array
+        return self._from_array(array[np.isin(array, self._as_array(other))])
+
+    def __or__(self, other: Iterable[Any]) -> Self:
+        obj = self.copy()
+        obj.update(other)
+        return obj
+
+    def __xor__(self, other: Iterable[Any]) -> Self:
+        obj = self.copy()
+        obj ^= other
+        return obj
+
+    def __sub__(self, other: Iterable[Any]) -> Self:
+        array = self._array
+        return self._from_array(array[~np.isin(array, self._as_array(other))])
+
+    # Reflected methods are called for operands that are not ordered sets
+    # of numbers (like built-in sets); the results are, in the order of
+    # `self` for `&` and `|` (like those of `orderedset`).
+
+    def __rand__(self, other: Iterable[Any]) -> Self:
+        return self.__and__(other)
+
+    def __ror__(self, other: Iterable[Any]) -> Self:
+        return self.__or__(other)
+
+    def __rxor__(self, other: Iterable[Any]) -> Self:
+        return self.__xor__(other)
+
+    def __rsub__(self, other: Iterable[Any]) -> Self:
+        other_array = self._unique_last(self._as_array_of_dtype(other))
+        return self._from_array(other_array[~np.isin(other_array, self._array)])
+
+    def __iand__(self, other: Iterable[Any]) -> Self:
+        with self._data_lock:
+            array = self._array
+            self._set_array(array[np.isin(array, self._as_array(other))])
+        return self
+
+    def __ior__(self, other: Iterable[Any]) -> Self:
+        self.update(other)
+        return self
+
+    def __ixor__(self, other: Iterable[Any]) -> Self:
+        with self._data_lock:
+            array = self._array
+            other_array = self._unique_first(self._as_array_of_dtype(other))
+            self._set_array(np.concatenate((
+                array[~np.isin(array, other_array)],
+                other_array[~np.isin(other_array, array)],
+            )))
+        return self
+
+    def __isub__(self, other: Iterable[Any]) -> Self:
+        with self._data_lock:
+            array = self._array
+            self._set_array(array[~np.isin(array, self._as_array(other))])
+        return self
+
+    def update(self, other: Iterable[Any]) -> None:
+        # Present elements move to the end, in the order of `other`
+        # (of their last occurrences in `other`).
+        with self._data_lock:
+            array = self._array
+            other_array = self._unique_last(self._as_array_of_dtype(other))
+            self._set_array(np.concatenate((
+                array[~np.isin(array, other_array)],
+                other_array,
+            )))
+
+    def extend_or_ignore(self, other: Iterable[Any]) -> None:
+        with self._data_lock:
+            array = self._array
+            other_array = self._unique_first(self._as_array_of_dtype(other))
+            self._set_array(np.concatenate((
+                array,
+                other_array[~np.isin(other_array, array)],
+            )))
+
+    # Operations on single elements
+
+    def append_or_ignore(self, value: Any) -> None:
+        self.extend_or_ignore((value,))
+
+    def uppend(self, value: Any) -> None:
+        self.update((value,))
+
+    def discard(self, value: Any) -> None:
+        with self._data_lock:
+            if value in self:
+                self._set_array(self._array[self._array != value])
+
+    def remove(self, value: Any) -> None:
+        with self._data_lock:
+            if value not in self:
+                raise KeyError(value)
+            self._set_array(self._array[self._array != value])
+
+    def pop(self, index: int = -1) -> Any:
+        with self._data_lock:
+            value = self._array[index]  # may raise IndexError
+            self._set_array(np.delete(self._array, index))
+        return value
+
+    def clear(self) -> None:
+        with self._data_lock:
+            self._set_array(self._array[:0].copy())
+
+
+Set.register(orderednumericset)     # type: ignore
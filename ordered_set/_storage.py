@@ -0,0 +1,810 @@
+from collections.abc import Hashable, Iterable, Iterator, MutableSequence
+from itertools import chain, islice
+from operator import eq, ne, lt, gt, le, ge
+from typing import Optional, Protocol, TypeVar, Union, runtime_checkable
+
+from typing_extensions import Self, override
+
+from ordered_set._common import check_index_in_range, normalize_index
+
+
+T = TypeVar('T', bound=Hashable)
+
+
+# The protocol of a list that keeps the order of elements of an `orderedset`
+# (a backend). `orderedset` keeps membership in its own set and never puts
+# duplicates into the list, so a backend may rely on all values being unique
+# and hashable. Lists are created from iterables: this is also how
+# `orderedset` filters the list in bulk (it builds a new list of the same
+# type from a filtered iterator). A list must compare equal to a `list`
+# with the same elements in the same order (and should support other
+# comparisons with `list` objects). `copy.copy()` must copy a list like
+# its method `copy()` does. A backend may also define a method `_check`
+# that raises an exception if the backend detects an inconsistency
+# in itself.
+@runtime_checkable
+class ListBackend(Protocol[T]):
+
+    def __init__(self, iterable: Iterable[T] = ...) -> None:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    def __iter__(self) -> Iterator[T]:
+        ...
+
+    def __reversed__(self) -> Iterator[T]:
+        ...
+
+    def __contains__(self, value: object) -> bool:
+        ...
+
+    # `index` may be an `int` or a `slice`, a slice results in an iterable.
+    def __getitem__(self, index):
+        ...
+
+    def __delitem__(self, index) -> None:
+        ...
+
+    def copy(self) -> Self:
+        ...
+
+    def index(self, value: T, start: int = 0, stop: Optional[int] = None) -> int:
+        ...
+
+    def append(self, value: T) -> None:
+        ...
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        ...
+
+    def insert(self, index: int, value: T) -> None:
+        ...
+
+    def pop(self, index: int = -1) -> T:
+        ...
+
+    def remove(self, value: T) -> None:
+        ...
+
+    def reverse(self) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+
+# A list that maintains a map from values to their positions.
+# The map is rebuilt lazily: it is only guaranteed to be correct
+# for the prefix of the list of length `_valid`. Operations that shift
+# elements (insertion, deletion in the middle, reversal) only shrink
+# the valid prefix; the next lookup restores the map for the rest
+# of the list, which costs no more than the memmove that caused it.
+# All values are expected to be unique (as in `orderedset`).
+class indexedlist(list):
+
+    __slots__ = ('_positions', '_valid')
+
+    def __init__(self, iterable: Iterable[T] = ()):
+        super().__init__(iterable)
+        self._positions: dict = {}
+        self._valid: int = 0
+
+    def _check(self) -> None:
+        self._ensure_positions()
+        if len(self._positions) != len(self):   # pragma: no cover
+            raise ValueError('Inconsistency detected: the index map has stale entries')
+        for i, value in enumerate(self):
+            if self._positions.get(value) != i:     # pragma: no cover
+                raise ValueError('Inconsistency detected: the index map is out of date')
+
+    def _ensure_positions(self) -> None:
+        self_len = len(self)
+        if self._valid < self_len:
+            # O(n - valid):
+            self._positions.update(
+                zip(list.__getitem__(self, slice(self._valid, None)), range(self._valid, self_len))
+            )
+            self._valid = self_len
+
+    def _invalidate_from(self, index: int) -> None:
+        if index < self._valid:
+            self._valid = index
+
+    def _normalize_index(self, index: int, *, clamp: bool = True) -> int:
+        return normalize_index(index, len(self), clamp=clamp)
+
+    def _forget(self, values: Iterable[T]) -> None:
+        positions = self._positions
+        for value in values:
+            positions.pop(value, None)
+
+    def __copy__(self):
+        obj = type(self)(self)
+        obj._positions = self._positions.copy()
+        obj._valid = self._valid
+        return obj
+
+    def copy(self):
+        return self.__copy__()
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+    def __contains__(self, value: object) -> bool:
+        self._ensure_positions()
+        try:
+            return (value in self._positions)
+        except TypeError:   # unhashable
+            return False
+
+    def index(self, value: T, start: int = 0, stop: Optional[int] = None) -> int:
+        self._ensure_positions()
+        try:
+            index = self._positions[value]
+        except (KeyError, TypeError):
+            raise ValueError(f'{value!r} is not in list') from None
+        check_index_in_range(value, index, start, stop, len(self))
+        return index
+
+    def count(self, value: T) -> int:
+        return int(value in self)
+
+    def append(self, value: T) -> None:
+        index = len(self)
+        super().append(value)
+        if self._valid == index:
+            self._positions[value] = index
+            self._valid += 1
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        index = len(self)
+        super().extend(iterable)
+        if self._valid == index:
+            self._ensure_positions()
+
+    def __iadd__(self, iterable: Iterable[T]):
+        self.extend(iterable)
+        return self
+
+    def __imul__(self, n: int):
+        raise TypeError(f'{type(self).__name__} cannot hold duplicate values')
+
+    def insert(self, index: int, value: T) -> None:
+        index = self._normalize_index(index)
+        super().insert(index, value)
+        self._invalidate_from(index)
+
+    def pop(self, index: int = -1) -> T:
+        index = self._normalize_index(index, clamp=False)
+        value = super().pop(index)  # may raise IndexError
+        self._positions.pop(value, None)
+        self._invalidate_from(index)
+        return value
+
+    def remove(self, value: T) -> None:
+        del self[self.index(value)]
+
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice):
+            values = list.__getitem__(self, index)
+            start = (min(range(len(self))[index], default=len(self)))
+            super().__delitem__(index)
+            self._forget(values)
+            self._invalidate_from(start)
+            return
+        index = self._normalize_index(index, clamp=False)
+        value = list.__getitem__(self, index)   # may raise IndexError
+        super().__delitem__(index)
+        self._positions.pop(value, None)
+        self._invalidate_from(index)
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            values_old = list.__getitem__(self, index)
+            range_ = range(len(self))[index]
+            # An empty slice with step 1 inserts values at its start.
+            start = (
+                min(range_) if range_
+                else min(range_.start, len(self)) if range_.step == 1 else len(self)
+            )
+        else:
+            index = self._normalize_index(index, clamp=False)
+            values_old = (list.__getitem__(self, index),)
+            start = index
+        super().__setitem__(index, value)
+        self._forget(values_old)
+        self._invalidate_from(start)
+
+    def clear(self) -> None:
+        super().clear()
+        self._positions.clear()
+        self._valid = 0
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._valid = 0
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._valid = 0
+
+
+# Common parts of list-like backends that are not `list` subclasses.
+# Such lists compare with each other and with `list` objects like
+# `list` objects do.
+class _liststorage(MutableSequence):
+
+    __slots__ = ()
+
+    # Returns a `list` with the elements, possibly an internal one.
+    def _as_list(self) -> list:
+        raise NotImplementedError()
+
+    def copy(self):
+        return self.__copy__()
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self)!r})'
+
+    __hash__ = None     # type: ignore
+
+    @staticmethod
+    def _make_cmp_op(op):
+        def op_new(self, other: object) -> bool:
+            if isinstance(other, _liststorage):
+                other = other._as_list()
+            if isinstance(other, list):
+                return op(self._as_list(), other)
+            return NotImplemented
+        return op_new
+
+    __eq__ = _make_cmp_op(eq)
+    __ne__ = _make_cmp_op(ne)
+    __lt__ = _make_cmp_op(lt)
+    __gt__ = _make_cmp_op(gt)
+    __le__ = _make_cmp_op(le)
+    __ge__ = _make_cmp_op(ge)
+
+    def count(self, value: T) -> int:
+        return int(value in self)
+
+
+_HOLE = object()
+
+
+# A list that does not shift elements on removal. A removed element leaves
+# a hole (a tombstone) in its slot; a map from values to their slots makes
+# removal by value O(1). Holes are skipped by iteration; the list is
+# compacted when the share of holes exceeds `MAX_HOLE_RATIO`, or earlier,
+# when an operation needs positions of elements (like access by index
+# in the middle of the list), so removal works in O(1) amortized.
+# Holes at the start of the list are tracked by `_head`, holes at the end
+# are never left behind, so operations on both ends never need compaction.
+# All values are expected to be unique (as in `orderedset`).
+class tombstonedlist(_liststorage):
+
+    __slots__ = ('_slots', '_slot_of', '_len', '_head')
+
+    MAX_HOLE_RATIO: float = 0.5
+
+    def __init__(self, iterable: Iterable[T] = ()):
+        self._slots: list = list(iterable)
+        self._slot_of: dict = dict(zip(self._slots, range(len(self._slots))))
+        self._len: int = len(self._slots)
+        self._head: int = 0
+
+    def _check(self) -> None:
+        live = [v for v in self._slots if v is not _HOLE]
+        if len(live) != self._len:  # pragma: no cover
+            raise ValueError('Inconsistency detected: wrong count of elements')
+        if self._slots and self._slots[-1] is _HOLE:    # pragma: no cover
+            raise ValueError('Inconsistency detected: holes at the end of the list')
+        if self._len > 0 and (
+            self._slots[self._head] is _HOLE
+            or any(v is not _HOLE for v in self._slots[:self._head])
+        ):  # pragma: no cover
+            raise ValueError('Inconsistency detected: wrong position of the head')
+        if len(self._slot_of) != self._len or any(
+            self._slots[self._slot_of[v]] is not v for v in live
+        ):  # pragma: no cover
+            raise ValueError('Inconsistency detected: the slot map is out of date')
+
+    @property
+    def _holes(self) -> int:
+        return len(self._slots) - self._len
+
+    def _reindex(self, start: int = 0) -> None:
+        self._slot_of.update(
+            zip(self._slots[start:], range(start, len(self._slots)))
+        )
+
+    def _compact(self) -> None:
+        if len(self._slots) == self._len:
+            return
+        # O(n):
+        self._slots = [v for v in self._slots if v is not _HOLE]
+        self._head = 0
+        self._reindex()
+
+    @override
+    def _as_list(self) -> list:
+        self._compact()
+        return self._slots
+
+    def _remove_slot(self, slot: int) -> None:
+        slots = self._slots
+        self._len -= 1
+        if self._len == 0:
+            slots.clear()
+            self._head = 0
+            return
+        if slot == len(slots) - 1:
+            slots.pop()
+            while slots[-1] is _HOLE:
+                slots.pop()
+            return
+        slots[slot] = _HOLE
+        if slot == self._head:
+            head = slot + 1
+            while slots[head] is _HOLE:
+                head += 1
+            self._head = head
+        if self._holes > self.MAX_HOLE_RATIO * len(slots):
+            self._compact()
+
+    # Returns the slot of an element at a normalized index.
+    def _slot_at(self, index: int) -> int:
+        if index == 0:
+            return self._head
+        if index == self._len - 1:
+            return len(self._slots) - 1
+        if self._holes != self._head:
+            self._compact()
+        return index + self._head
+
+    def __copy__(self):
+        obj = type(self)()
+        obj._slots = self._slots.copy()
+        obj._slot_of = self._slot_of.copy()
+        obj._len = self._len
+        obj._head = self._head
+        return obj
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[T]:
+        if len(self._slots) == self._len:
+            return iter(self._slots)
+        return (v for v in self._slots[self._head:] if v is not _HOLE)
+
+    def __reversed__(self) -> Iterator[T]:
+        if len(self._slots) == self._len:
+            return reversed(self._slots)
+        return (v for v in reversed(self._slots[self._head:]) if v is not _HOLE)
+
+    def __contains__(self, value: object) -> bool:
+        try:
+            return (value in self._slot_of)
+        except TypeError:   # unhashable
+            return False
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._as_list()[index]
+        index = normalize_index(index, self._len, clamp=False)
+        if not (0 <= index < self._len):
+            raise IndexError('list index out of range')
+        slot = self._slot_at(index)    # may compact the list
+        return self._slots[slot]
+
+    def __setitem__(self, index, value) -> None:
+        slots = self._as_list()
+        values_old = (slots[index] if isinstance(index, slice) else (slots[index],))
+        slots[index] = value
+        for value_old in values_old:
+            del self._slot_of[value_old]
+        self._len = len(slots)
+        self._reindex()
+
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice):
+            slots = self._as_list()
+            values = slots[index]
+            del slots[index]
+            for value in values:
+                del self._slot_of[value]
+            self._len = len(slots)
+            self._reindex(min(range(len(slots) + len(values))[index], default=0))
+            return
+        _ = self.pop(index)
+
+    def index(self, value: T, start: int = 0, stop: Optional[int] = None) -> int:
+        try:
+            slot = self._slot_of[value]
+        except (KeyError, TypeError):
+            raise ValueError(f'{value!r} is not in list') from None
+        if self._holes != self._head:
+            self._compact()
+            slot = self._slot_of[value]
+        index = slot - self._head
+        check_index_in_range(value, index, start, stop, self._len)
+        return index
+
+    def append(self, value: T) -> None:
+        self._slot_of[value] = len(self._slots)
+        self._slots.append(value)
+        self._len += 1
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        slots = self._slots
+        start = len(slots)
+        slots.extend(iterable)
+        self._len += len(slots) - start
+        self._reindex(start)
+
+    def insert(self, index: int, value: T) -> None:
+        index = normalize_index(index, self._len)
+        if index == self._len:
+            self.append(value)
+            return
+        if index == 0 and self._head > 0:
+            self._head -= 1
+            self._slots[self._head] = value
+            self._slot_of[value] = self._head
+            self._len += 1
+            return
+        slots = self._as_list()
+        slots.insert(index, value)
+        self._len += 1
+        self._reindex(index)
+
+    def pop(self, index: int = -1) -> T:
+        index = normalize_index(index, self._len, clamp=False)
+        if not (0 <= index < self._len):
+            raise IndexError('pop index out of range')
+        slot = self._slot_at(index)    # may compact the list
+        value = self._slots[slot]
+        del self._slot_of[value]
+        self._remove_slot(slot)
+        return value
+
+    def remove(self, value: T) -> None:
+        try:
+            slot = self._slot_of.pop(value)
+        except (KeyError, TypeError):
+            raise ValueError(f'{value!r} is not in list') from None
+        self._remove_slot(slot)
+
+    def clear(self) -> None:
+        self._slots.clear()
+        self._slot_of.clear()
+        self._len = 0
+        self._head = 0
+
+    def reverse(self) -> None:
+        slots = self._as_list()
+        slots.reverse()
+        self._reindex()
+
+
+# A list split into blocks (like a B-tree with a single level of leaves).
+# Lengths of blocks are tracked by a Fenwick tree, so finding the block
+# for an index and updating lengths work in O(log(n / LOAD)); a map from
+# values to their blocks finds an element by value. Positional insertion,
+# deletion and `pop()` anywhere work in O(log(n / LOAD) + LOAD). Blocks
+# are split when they grow over `2 * LOAD` elements and merged with
+# a neighbour when they shrink under `LOAD // 4` elements.
+# All values are expected to be unique (as in `orderedset`).
+class blockedlist(_liststorage):
+
+    __slots__ = ('_blocks', '_len', '_tree', '_block_of', '_block_index')
+
+    LOAD: int = 512
+
+    def __init__(self, iterable: Iterable[T] = ()):
+        self._blocks: list[list] = []
+        self._len: int = 0
+        self._tree: list[int] = [0]
+        self._block_of: dict = {}
+        self._block_index: dict[int, int] = {}
+        self.extend(iterable)
+
+    def _check(self) -> None:
+        if sum(map(len, self._blocks)) != self._len:   # pragma: no cover
+            raise ValueError('Inconsistency detected: wrong count of elements')
+        if not all(self._blocks):   # pragma: no cover
+            raise ValueError('Inconsistency detected: empty blocks')
+        for i, block in enumerate(self._blocks):
+            if self._prefix(i) != sum(map(len, self._blocks[:i])):  # pragma: no cover
+                raise ValueError('Inconsistency detected: the tree of lengths is out of date')
+            if self._block_index[id(block)] != i:   # pragma: no cover
+                raise ValueError('Inconsistency detected: the block index is out of date')
+            for value in block:
+                if self._block_of[value] is not block:  # pragma: no cover
+                    raise ValueError('Inconsistency detected: the block map is out of date')
+        if len(self._block_of) != self._len:    # pragma: no cover
+            raise ValueError('Inconsistency detected: the block map has stale entries')
+
+    # O(n / LOAD):
+    def _rebuild_index(self) -> None:
+        blocks = self._blocks
+        tree = [0]
+        tree.extend(map(len, blocks))
+        tree_len = len(tree)
+        for i in range(1, tree_len):
+            j = i + (i & -i)
+            if j < tree_len:
+                tree[j] += tree[i]
+        self._tree = tree
+        self._block_index = {id(block): i for i, block in enumerate(blocks)}
+
+    def _tree_add(self, block_index: int, delta: int) -> None:
+        tree = self._tree
+        tree_len = len(tree)
+        i = block_index + 1
+        while i < tree_len:
+            tree[i] += delta
+            i += (i & -i)
+
+    # Returns the count of elements in blocks before the block.
+    def _prefix(self, block_index: int) -> int:
+        tree = self._tree
+        result = 0
+        i = block_index
+        while i > 0:
+            result += tree[i]
+            i -= (i & -i)
+        return result
+
+    # Returns the index of the block and the offset in the block
+    # of an element at a normalized index (`0 <= index < len(self)`).
+    def _locate(self, index: int) -> tuple[int, int]:
+        tree = self._tree
+        tree_len = len(tree)
+        pos = 0
+        step = 1 << (tree_len - 1).bit_length()
+        while step:
+            pos_next = pos + step
+            if pos_next < tree_len and tree[pos_next] <= index:
+                pos = pos_next
+                index -= tree[pos_next]
+            step >>= 1
+        return (pos, index)
+
+    def _new_blocks(self, values: list) -> list[list]:
+        load = self.LOAD
+        blocks = [values[i:(i + load)] for i in range(0, len(values), load)]
+        block_of = self._block_of
+        for block in blocks:
+            block_of.update(dict.fromkeys(block, block))
+        return blocks
+
+    # Restores the bounds of the length of a block after it has changed.
+    def _fix_block(self, block_index: int) -> None:
+        blocks = self._blocks
+        block = blocks[block_index]
+        block_len = len(block)
+        if block_len > 2 * self.LOAD:
+            blocks[block_index:(block_index + 1)] = self._new_blocks(block)
+            self._rebuild_index()
+        elif block_len < self.LOAD // 4 and len(blocks) > 1:
+            if block_index == len(blocks) - 1:
+                block_index -= 1
+            values = blocks[block_index] + blocks[block_index + 1]
+            blocks[block_index:(block_index + 2)] = self._new_blocks(values)
+            self._rebuild_index()
+
+    @override
+    def _as_list(self) -> list:
+        return list(chain.from_iterable(self._blocks))
+
+    def _set_order(self, values: list) -> None:
+        self._block_of.clear()
+        self._blocks = self._new_blocks(values)
+        self._len = len(values)
+        self._rebuild_index()
+
+    def __copy__(self):
+        return type(self)(self)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self._blocks)
+
+    def __reversed__(self) -> Iterator[T]:
+        return chain.from_iterable(map(reversed, reversed(self._blocks)))
+
+    def __contains__(self, value: object) -> bool:
+        try:
+            return (value in self._block_of)
+        except TypeError:   # unhashable
+            return False
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                if start >= stop:
+                    return []
+                block_index, offset = self._locate(start)
+                it = chain.from_iterable(islice(self._blocks, block_index, None))
+                return list(islice(it, offset, (offset + stop - start)))
+            return self._as_list()[index]
+        index = normalize_index(index, self._len, clamp=False)
+        if not (0 <= index < self._len):
+            raise IndexError('list index out of range')
+        block_index, offset = self._locate(index)
+        return self._blocks[block_index][offset]
+
+    def __setitem__(self, index, value) -> None:
+        values = self._as_list()
+        values[index] = value
+        self._set_order(values)
+
+    def __delitem__(self, index) -> None:
+        if not isinstance(index, slice):
+            _ = self.pop(index)
+            return
+        range_ = range(self._len)[index]
+        if range_.step == -1:
+            range_ = range_[::-1]
+        if len(range_) == 0:
+            return
+        if range_.step != 1:
+            values = self._as_list()
+            del values[index]
+            self._set_order(values)
+            return
+        # O(log(n / LOAD) + n_deleted + n / LOAD):
+        blocks = self._blocks
+        block_of = self._block_of
+        block_index, offset = self._locate(range_.start)
+        remaining = len(range_)
+        while remaining > 0:
+            block = blocks[block_index]
+            stop = min(len(block), (offset + remaining))
+            for value in block[offset:stop]:
+                del block_of[value]
+            del block[offset:stop]
+            remaining -= stop - offset
+            if block:
+                block_index += 1
+            else:
+                del blocks[block_index]
+            offset = 0
+        self._len -= len(range_)
+        self._rebuild_index()
+        if 0 < block_index < len(blocks):
+            self._fix_block(block_index - 1)
+
+    def index(self, value: T, start: int = 0, stop: Optional[int] = None) -> int:
+        try:
+            block = self._block_of[value]
+        except (KeyError, TypeError):
+            raise ValueError(f'{value!r} is not in list') from None
+        index = self._prefix(self._block_index[id(block)]) + block.index(value)
+        check_index_in_range(value, index, start, stop, self._len)
+        return index
+
+    def append(self, value: T) -> None:
+        blocks = self._blocks
+        if not blocks:
+            blocks.append([])
+            self._rebuild_index()
+        block_index = len(blocks) - 1
+        block = blocks[block_index]
+        block.append(value)
+        self._block_of[value] = block
+        self._len += 1
+        self._tree_add(block_index, 1)
+        self._fix_block(block_index)
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        values = list(iterable)
+        if not values:
+            return
+        blocks = self._blocks
+        if blocks and len(blocks[-1]) < self.LOAD:
+            values = blocks.pop() + values
+        blocks.extend(self._new_blocks(values))
+        self._len = sum(map(len, blocks))
+        self._rebuild_index()
+
+    def insert(self, index: int, value: T) -> None:
+        index = normalize_index(index, self._len)
+        if index == self._len:
+            self.append(value)
+            return
+        block_index, offset = self._locate(index)
+        block = self._blocks[block_index]
+        block.insert(offset, value)
+        self._block_of[value] = block
+        self._len += 1
+        self._tree_add(block_index, 1)
+        self._fix_block(block_index)
+
+    def _pop_at(self, block_index: int, offset: int) -> T:
+        block = self._blocks[block_index]
+        value = block.pop(offset)
+        del self._block_of[value]
+        self._len -= 1
+        if block:
+            self._tree_add(block_index, -1)
+            self._fix_block(block_index)
+        else:
+            del self._blocks[block_index]
+            self._rebuild_index()
+        return value
+
+    def pop(self, index: int = -1) -> T:
+        index = normalize_index(index, self._len, clamp=False)
+        if not (0 <= index < self._len):
+            raise IndexError('pop index out of range')
+        block_index, offset = self._locate(index)
+        return self._pop_at(block_index, offset)
+
+    def remove(self, value: T) -> None:
+        try:
+            block = self._block_of[value]
+        except (KeyError, TypeError):
+            raise ValueError(f'{value!r} is not in list') from None
+        block_index = self._block_index[id(block)]
+        _ = self._pop_at(block_index, block.index(value))
+
+    def clear(self) -> None:
+        self._blocks.clear()
+        self._block_of.clear()
+        self._len = 0
+        self._rebuild_index()
+
+    def reverse(self) -> None:
+        self._blocks.reverse()
+        for block in self._blocks:
+            block.reverse()
+        self._rebuild_index()
+
+
+_BACKENDS: dict[str, type] = {
+    'list': list,
+    'indexed': indexedlist,
+    'tombstoned': tombstonedlist,
+    'blocked': blockedlist,
+}
+
+DEFAULT_BACKEND = 'list'
+
+
+BackendSpec = Union[str, type[ListBackend], None]
+
+
+def register_backend(name: str, class_: type[ListBackend]) -> None:
+    if not (isinstance(class_, type) and issubclass(class_, ListBackend)):
+        raise TypeError(f'{class_!r} does not implement the protocol of a backend')
+    _BACKENDS[name] = class_
+
+
+def get_backend(backend: BackendSpec) -> type[ListBackend]:
+    if backend is None:
+        backend = DEFAULT_BACKEND
+    if isinstance(backend, str):
+        try:
+            return _BACKENDS[backend]
+        except KeyError:
+            raise ValueError(
+                f'Unknown backend {backend!r},'
+                f' expected one of: {", ".join(map(repr, _BACKENDS))}'
+            ) from None
+    if isinstance(backend, type) and issubclass(backend, ListBackend):
+        return backend
+    raise TypeError(
+        f'A backend must be a name of a backend or a class that implements'
+        f' the protocol of a backend, got {backend!r}'
+    )
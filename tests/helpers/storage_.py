@@ -0,0 +1,9 @@
+from ordered_set import blockedlist
+
+
+# Splits and merges blocks even with small data.
+class smallblockedlist(blockedlist):
+
+    __slots__ = ()
+
+    LOAD = 4
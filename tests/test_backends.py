@@ -0,0 +1,253 @@
+import pytest
+
+from ordered_set import ListBackend, orderedset, register_backend
+
+from .helpers import move_within_seq
+from .helpers.ordered_set_ import check_orderedset_invariants
+from .helpers.storage_ import smallblockedlist
+
+
+BACKENDS = ('list', 'indexed', 'tombstoned', 'blocked', smallblockedlist)
+
+DATA = (1, 2, 5, 4, 3, 8, 7)
+
+
+def backend_parametrize_id(backend):
+    return (backend if isinstance(backend, str) else backend.__name__)
+
+
+def parametrize_backends(argname):
+    return pytest.mark.parametrize(argname, BACKENDS, ids=backend_parametrize_id)
+
+
+@parametrize_backends('backend')
+def test_init(backend):
+    obj = orderedset('abracadabra', backend=backend)
+    assert list(obj) == list('cdbra')
+    check_orderedset_invariants(obj)
+
+
+def test_init_unknown_backend():
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = orderedset(backend='no such backend')
+
+
+@pytest.mark.parametrize('backend', (tuple, set, 42))
+def test_init_invalid_backend(backend):
+    with pytest.raises(TypeError):
+        _ = orderedset(backend=backend)
+
+
+def test_register_backend():
+    register_backend('small blocked', smallblockedlist)
+    obj = orderedset(DATA, backend='small blocked')
+    assert isinstance(obj._list, smallblockedlist)
+    assert list(obj) == list(DATA)
+    check_orderedset_invariants(obj)
+    with pytest.raises(TypeError):
+        register_backend('tuple', tuple)
+
+
+@parametrize_backends('backend')
+def test_backend_implements_protocol(backend):
+    obj = orderedset(DATA, backend=backend)
+    assert isinstance(obj._list, ListBackend)
+
+
+@parametrize_backends('backend')
+def test_from_unique(backend):
+    obj = orderedset.from_unique(DATA, backend=backend)
+    assert list(obj) == list(DATA)
+    check_orderedset_invariants(obj)
+
+
+@parametrize_backends('backend')
+def test_copy_keeps_backend(backend):
+    obj = orderedset(DATA, backend=backend)
+    copy_ = obj.copy()
+    assert type(copy_._list) is type(obj._list)
+    assert copy_ == obj
+    check_orderedset_invariants(copy_)
+
+
+@parametrize_backends('backend')
+@pytest.mark.parametrize('op', (
+    lambda obj: obj | {0},
+    lambda obj: obj & {DATA[0]},
+    lambda obj: obj ^ {0},
+    lambda obj: obj - {DATA[0]},
+    lambda obj: obj[1:],
+))
+def test_derived_default_backend(backend, op):
+    obj = orderedset(DATA, backend=backend)
+    derived = op(obj)
+    assert type(derived._list) is list
+    check_orderedset_invariants(derived)
+
+
+@parametrize_backends('backend')
+@pytest.mark.parametrize(
+    ('start', 'stop'),
+    ((0, None), (2, None), (-3, None), (0, 3), (1, -1), (-100, 100), (4, 2)),
+)
+def test_index(backend, start, stop):
+    obj = orderedset.from_unique(DATA)
+    obj = orderedset(obj, backend=backend)
+    for val in DATA:
+        try:
+            expected = DATA.index(val, start, *(() if stop is None else (stop,)))
+        except ValueError:
+            with pytest.raises(ValueError):  # noqa: PT011
+                _ = obj.index(val, start, stop)
+        else:
+            assert obj.index(val, start, stop) == expected
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = obj.index(0)
+
+
+@parametrize_backends('backend')
+def test_index_after_mutations(backend):
+    data = list(DATA)
+    obj = orderedset(DATA, backend=backend)
+
+    def check():
+        assert list(obj) == data
+        for i, val in enumerate(data):
+            assert obj.index(val) == i
+        check_orderedset_invariants(obj)
+
+    obj.upsert(1, 7)
+    move_within_seq(data, data.index(7), 1)
+    check()
+    obj.uppend(2)
+    move_within_seq(data, data.index(2), len(data))
+    check()
+    del obj[2]
+    del data[2]
+    check()
+    del obj[1:3]
+    del data[1:3]
+    check()
+    obj.insert_or_ignore(0, 10)
+    data.insert(0, 10)
+    check()
+    assert obj.pop(0) == data.pop(0)
+    check()
+    assert obj.pop() == data.pop()
+    check()
+    obj.reverse()
+    data.reverse()
+    check()
+    obj.append_or_ignore(11)
+    data.append(11)
+    check()
+    obj &= {1, 3, 8, 11}
+    data = [v for v in data if v in {1, 3, 8, 11}]
+    check()
+    obj |= (3, 12)
+    data = [v for v in data if v != 3] + [3, 12]
+    check()
+    obj ^= orderedset((12, 13))
+    data = [v for v in data if v != 12] + [13]
+    check()
+    obj -= {1}
+    data.remove(1)
+    check()
+    obj.remove(8)
+    data.remove(8)
+    check()
+    obj.discard(11)
+    data.remove(11)
+    check()
+    obj.extend_or_ignore((20, 21, 22, 23))
+    data.extend((20, 21, 22, 23))
+    check()
+    obj.insert_many_or_ignore(1, (24, 20, 25))
+    data[1:1] = (24, 25)
+    check()
+    obj.remove_many((24, 25))
+    data.remove(24)
+    data.remove(25)
+    check()
+    obj.upsert_many(1, (21, 26))
+    data = data[:1] + [21, 26] + [v for v in data[1:] if v != 21]
+    check()
+    obj.move_many(-1, (26,))
+    data.remove(26)
+    data.insert(-1, 26)
+    check()
+    obj.discard_many((21, 0, 23))
+    data = [v for v in data if v not in {21, 23}]
+    check()
+    obj.remove_many((20,))
+    data.remove(20)
+    check()
+    obj.clear()
+    data.clear()
+    check()
+
+
+@parametrize_backends('backend')
+def test_churn(backend):
+    data = list(range(100))
+    obj = orderedset(data, backend=backend)
+    for i in range(0, 100, 3):
+        obj.discard(i)
+        data.remove(i)
+    for i in range(1, 50, 4):
+        obj.uppend(i)
+        if i in data:
+            data.remove(i)
+        data.append(i)
+    assert len(obj) == len(data)
+    assert list(obj) == data
+    assert list(reversed(obj)) == list(reversed(data))
+    assert [obj[i] for i in range(-len(data), len(data))] == data * 2
+    assert list(obj[5:20:3]) == data[5:20:3]
+    check_orderedset_invariants(obj)
+
+
+@pytest.mark.parametrize('backend', ('tombstoned', 'blocked'))
+@pytest.mark.parametrize(
+    'mutation',
+    (
+        lambda obj: obj.update({1, 3, 5, 7, 9, 11}),
+        lambda obj: obj.discard_many((1, 3, 5, 7, 9, 11)),
+        lambda obj: obj.__isub__({1, 3, 5, 7, 9, 11}),
+        lambda obj: obj.__ixor__({1, 3, 5, 7, 9, 11}),
+    ),
+)
+def test_remove_many_in_place(backend, mutation):
+    # Backends that do not shift elements remove them one by one instead
+    # of rebuilding the list.
+    obj = orderedset(range(20), backend=backend)
+    list_ = obj._list
+    mutation(obj)
+    assert obj._list is list_
+    check_orderedset_invariants(obj)
+
+
+@parametrize_backends('backend')
+def test_drain(backend):
+    data = list(range(50))
+    obj = orderedset(data, backend=backend)
+    while data:
+        assert obj.pop(0) == data.pop(0)
+        assert obj[0] == data[0] if data else len(obj) == 0
+        if len(data) > 1:
+            assert obj.pop() == data.pop()
+        check_orderedset_invariants(obj)
+    assert list(obj) == []
+
+
+@parametrize_backends('backend')
+def test_compare(backend):
+    obj = orderedset((1, 2, 3, 4), backend=backend)
+    obj.remove(2)
+    other = orderedset((1, 3, 4))
+    assert obj == other
+    assert other == obj
+    assert obj == [1, 3, 4]
+    assert obj < [1, 3, 5]
+    assert obj <= other
+    assert other >= obj
@@ -3,7 +3,7 @@ import operator
 
 import pytest
 
-from ordered_set import orderedfrozenset
+from ordered_set import orderedfrozenset, orderedset
 
 from .helpers import BUILTIN_SET_TYPES, fixture_params_product, FixtureRequestMockObj
 from .helpers.ordered_set_ import ORDERED_SET_TYPES
@@ -175,3 +175,27 @@ class TestSetOps:
     def test_sub(fixture_objects_data_pair_and_object):
         data_a, data_b, obj = fixture_objects_data_pair_and_object
         assert_binary_op_consistency(operator.sub, data_a, data_b, obj)
+
+
+@pytest.mark.parametrize('op', (operator.and_, operator.or_, operator.xor, operator.sub))
+@pytest.mark.parametrize('other', (
+    orderedfrozenset((4, 3, 0)),
+    orderedset((4, 3, 0)),
+    frozenset({4, 3, 0}),
+))
+def test_frozen_ops_build_frozen_storage(op, other):
+    obj = orderedfrozenset((1, 2, 3, 4))
+    result = op(obj, other)
+    assert type(result) is orderedfrozenset
+    assert type(result._list) is tuple
+    assert type(result._set) is frozenset
+    result._check()
+    assert list(result) == list(op(orderedset(obj), other))
+
+
+@pytest.mark.parametrize('cls', (orderedset, orderedfrozenset))
+def test_rsub_iterable_with_duplicates(cls):
+    result = [1, 1, 5, 2, 5] - cls((2,))
+    assert type(result) is cls
+    assert result == cls((1, 5))
+    result._check()
@@ -174,3 +174,61 @@ class TestSetOps:
         data_a -= data_b
         obj -= data_b
         assert obj == data_a
+
+
+# Equal elements that are different objects: the set and the list
+# of the result must refer to the same objects.
+@pytest.mark.parametrize('op', ('__iand__', '__ior__', '__ixor__', '__isub__'))
+def test_inplace_ops_equal_objects(op):
+    obj = orderedset(int(f'100{i}') for i in range(6))
+    other = {int(f'100{i}') for i in range(0, 8, 2)}
+    getattr(obj, op)(other)
+    obj._check()
+
+
+@pytest.mark.parametrize(
+    ('data', 'other', 'expected'),
+    (
+        ((1, 2, 3, 4), (5, 3, 1, 6), (2, 4, 5, 6)),
+        ((1, 2, 3), (3, 2, 1), ()),
+        ((), (2, 1), (2, 1)),
+        ((1, 2), (), (1, 2)),
+    ),
+)
+@pytest.mark.parametrize('other_transform', (orderedset, orderedfrozenset, dict.fromkeys))
+def test_ixor_keeps_order_of_other(data, other, expected, other_transform):
+    obj = orderedset(data)
+    other = other_transform(other)
+    if isinstance(other, dict):
+        other = other.keys()
+    obj ^= other
+    assert tuple(obj) == expected
+    obj._check()
+
+
+# Operands that are ordered sets or built-in sets with no common elements
+# or only common ones.
+@pytest.mark.parametrize('cls', (orderedset, orderedfrozenset))
+@pytest.mark.parametrize('other_transform', (set, orderedset, orderedfrozenset))
+@pytest.mark.parametrize(
+    ('other', 'and_', 'or_', 'xor', 'sub'),
+    (
+        ((5, 6), (), (1, 2, 3, 5, 6), (1, 2, 3, 5, 6), (1, 2, 3)),
+        ((3, 1, 2), (1, 2, 3), (3, 1, 2), (), ()),
+        ((2, 1, 2, 3, 0), (1, 2, 3), (1, 2, 3, 0), (0,), ()),
+        ((3,), (3,), (1, 2, 3), (1, 2), (1, 2)),
+    ),
+)
+def test_ops_common_elements(cls, other_transform, other, and_, or_, xor, sub):
+    obj = cls((1, 2, 3))
+    other = other_transform(other)
+    for result, expected in (
+        (obj & other, and_), (obj | other, or_), (obj ^ other, xor), (obj - other, sub),
+    ):
+        assert type(result) is cls
+        result._check()
+        if other_transform is set:
+            assert set(result) == set(expected)
+        else:
+            assert tuple(result) == expected
+    assert tuple(obj) == (1, 2, 3)
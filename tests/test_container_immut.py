@@ -1,4 +1,5 @@
 import itertools
+import pickle
 
 import pytest
 
@@ -46,6 +47,27 @@ def test_frozen_hashable():
     _ = hash(obj)
 
 
+def test_frozen_hash_cached():
+    obj = orderedfrozenset((1, 3, 2, 2))
+    assert obj._hash is None
+    hash_ = hash(obj)
+    assert obj._hash == hash_
+    assert hash(obj) == hash_
+    assert hash(pickle.loads(pickle.dumps(obj))) == hash_
+    assert hash(obj.copy()) == hash_
+
+
+def test_frozen_hash_order_sensitive():
+    obj = orderedfrozenset((1, 3, 2))
+    assert hash(obj) == hash(orderedfrozenset((1, 3, 2)))
+    # Equal objects must have equal hashes, unequal ones should not.
+    assert obj != orderedfrozenset((1, 2, 3))
+    assert hash(obj) != hash(orderedfrozenset((1, 2, 3)))
+    assert obj == (1, 3, 2)
+    assert hash(obj) == hash((1, 3, 2))
+    assert {obj: 1}.get((1, 3, 2)) == 1
+
+
 @parametrize_ordered_set_types('class_')
 def test_iterable_empty(class_):
     obj = class_()
@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 
 from ordered_set import orderedfrozenset, orderedset
@@ -281,6 +283,90 @@ class TestExtendOrIgnore:
         check_orderedset_invariants(obj)
 
 
+@pytest.mark.parametrize(
+    ('index', 'update', 'expected'),
+    (
+        (0, (), (1, 2, 3)),
+        (0, (2, 3), (1, 2, 3)),
+        (0, (4, 5, 4), (4, 5, 1, 2, 3)),
+        (1, (4, 2, 5), (1, 4, 5, 2, 3)),
+        (-1, (4, 5), (1, 2, 4, 5, 3)),
+        (3, (4,), (1, 2, 3, 4)),
+        (100, (4, 5), (1, 2, 3, 4, 5)),
+        (-100, (4, 5), (4, 5, 1, 2, 3)),
+    ),
+)
+def test_insert_many_or_ignore(index, update, expected):
+    obj = orderedset((1, 2, 3))
+    obj.insert_many_or_ignore(index, iter(update))
+    assert tuple(obj) == expected
+    check_orderedset_invariants(obj)
+    obj_expected = orderedset((1, 2, 3))
+    for offset, item in enumerate(v for v in update if v not in {1, 2, 3}):
+        obj_expected.insert_or_ignore(
+            (index + offset if index >= 0 else max(index + 3, 0) + offset), item,
+        )
+    assert obj == obj_expected
+
+
+@pytest.mark.parametrize(
+    ('index', 'update', 'expected'),
+    (
+        (0, (), (1, 2, 3, 4)),
+        (0, (3, 4), (3, 4, 1, 2)),
+        (0, (4, 5, 4, 3), (4, 5, 3, 1, 2)),
+        (2, (1, 5), (2, 1, 5, 3, 4)),
+        (2, (3, 2), (1, 3, 2, 4)),
+        (-1, (1, 5), (2, 3, 1, 5, 4)),
+        (4, (1,), (2, 3, 4, 1)),
+        (100, (2, 5), (1, 3, 4, 2, 5)),
+        (-100, (4, 5), (4, 5, 1, 2, 3)),
+    ),
+)
+def test_upsert_many(index, update, expected):
+    obj = orderedset((1, 2, 3, 4))
+    obj.upsert_many(index, iter(update))
+    assert tuple(obj) == expected
+    check_orderedset_invariants(obj)
+
+
+def test_upsert_many_single_like_upsert():
+    for index in range(-4, 5):
+        for val in (1, 3, 4, 5):
+            obj = orderedset((1, 2, 3, 4))
+            obj.upsert_many(index, (val,))
+            obj_expected = orderedset((1, 2, 3, 4))
+            obj_expected.upsert(index, val)
+            assert obj == obj_expected
+
+
+@pytest.mark.parametrize(
+    'mutation',
+    (
+        lambda obj, value: obj.upsert(0, value),
+        lambda obj, value: obj.upsert_many(0, (value,)),
+        lambda obj, value: obj.move_many(0, (value,)),
+    ),
+)
+def test_upsert_equal_objects(mutation):
+    obj = orderedset((int('1001'), int('1002')))
+    value = int('1002')
+    mutation(obj, value)
+    assert obj[0] is value
+    obj._check()
+    obj.copy()._check()
+
+
+def test_move_many():
+    obj = orderedset((1, 2, 3, 4))
+    obj.move_many(0, (4, 3))
+    assert tuple(obj) == (4, 3, 1, 2)
+    with pytest.raises(KeyError):
+        obj.move_many(0, (1, 5))
+    assert tuple(obj) == (4, 3, 1, 2)
+    check_orderedset_invariants(obj)
+
+
 class TestUpdate:
 
     @pytest.mark.parametrize('update_transform', (None, orderedfrozenset))
@@ -332,6 +418,33 @@ class TestUpdate:
         assert set(obj_list[head_length:]) == update
         check_orderedset_invariants(obj)
 
+    @pytest.mark.parametrize(
+        ('data', 'update', 'expected'),
+        (
+            ((1, 2, 3), (3, 4, 3), (1, 2, 4, 3)),
+            ((1, 2, 3), (1, 4, 2, 1, 4), (3, 2, 1, 4)),
+            ((), (5, 6, 5, 7, 6), (5, 7, 6)),
+        ),
+    )
+    @staticmethod
+    def test_update_repeats_last_occurrence(data, update, expected):
+        obj = orderedset.from_unique(data)
+        obj.update(iter(update))
+        assert tuple(obj) == expected
+        check_orderedset_invariants(obj)
+        obj_expected = orderedset.from_unique(data)
+        for item in update:
+            obj_expected.uppend(item)
+        assert obj == obj_expected
+
+    @pytest.mark.parametrize('op', (orderedset.update, orderedset.__ior__))
+    @staticmethod
+    def test_update_self(op):
+        obj = orderedset((3, 1, 2))
+        op(obj, obj)
+        assert tuple(obj) == (3, 1, 2)
+        check_orderedset_invariants(obj)
+
 
 @smth_test_sequence_mutation_synched_add_fixtures(data_attr='DATA')
 class TestPop:
@@ -398,3 +511,70 @@ class TestDiscard:
         object_.discard(val)
         assert tuple(object_) == cls.DATA
         check_orderedset_invariants(object_)
+
+
+@pytest.mark.parametrize(
+    ('vals', 'result'),
+    (
+        ((), (1, 2, 5, 4, 3)),
+        ((5,), (1, 2, 4, 3)),
+        ((5, 0, 1, 5), (2, 4, 3)),
+        ((8, 0), (1, 2, 5, 4, 3)),
+        (iter((3, 2, 1, 4, 5)), ()),
+    ),
+)
+def test_discard_many(vals, result):
+    object_ = orderedset((1, 2, 5, 4, 3))
+    object_.discard_many(vals)
+    assert tuple(object_) == result
+    check_orderedset_invariants(object_)
+
+
+@pytest.mark.parametrize(
+    ('vals', 'result'),
+    (
+        ((), (1, 2, 5, 4, 3)),
+        ((5,), (1, 2, 4, 3)),
+        ((5, 1, 5), (2, 4, 3)),
+    ),
+)
+def test_remove_many(vals, result):
+    object_ = orderedset((1, 2, 5, 4, 3))
+    object_.remove_many(vals)
+    assert tuple(object_) == result
+    check_orderedset_invariants(object_)
+
+
+@pytest.mark.parametrize('vals', ((0,), (5, 0, 1), (1, 2, 5, 4, 3, 8)))
+def test_remove_many_absent(vals):
+    object_ = orderedset((1, 2, 5, 4, 3))
+    with pytest.raises(KeyError):
+        object_.remove_many(vals)
+    assert tuple(object_) == (1, 2, 5, 4, 3)
+    check_orderedset_invariants(object_)
+
+
+@dataclasses.dataclass(frozen=True)
+class _PythonHashed:
+    value: int
+
+
+# Elements hashed by Python code are removed from the list by identity when
+# possible; equal objects that are not the elements are removed, too.
+@pytest.mark.parametrize('same_objects', (True, False))
+@pytest.mark.parametrize('operation', (
+    lambda obj, vals: obj.discard_many(vals),
+    lambda obj, vals: obj.remove_many(vals),
+    lambda obj, vals: obj.__isub__(set(vals)),
+    lambda obj, vals: obj.__ixor__(set(vals)),
+    lambda obj, vals: obj.__iand__(set(obj) - set(vals)),
+))
+def test_remove_python_hashed(operation, same_objects):
+    elements = [_PythonHashed(v) for v in (1, 2, 5, 4, 3)]
+    object_ = orderedset(elements)
+    vals = [elements[1], elements[3]]
+    if not same_objects:
+        vals = [_PythonHashed(v.value) for v in vals]
+    operation(object_, vals)
+    assert [v.value for v in object_] == [1, 5, 3]
+    check_orderedset_invariants(object_)
@@ -0,0 +1,123 @@
+from itertools import islice
+
+import pytest
+
+from ordered_set import orderedfrozenset, orderedintset, orderedset, sortedorderedset
+
+from .helpers.ordered_set_ import check_orderedset_invariants
+from .test_backends import parametrize_backends
+
+
+MUTABLE_TYPES = (orderedset, sortedorderedset, orderedintset)
+
+MUTATIONS = (
+    lambda obj: obj.discard(2),
+    lambda obj: obj.remove(2),
+    lambda obj: obj.pop(),
+    lambda obj: obj.__delitem__(0),
+    lambda obj: obj.clear(),
+    lambda obj: obj.update((5,)),
+    lambda obj: obj.__iand__({1, 3}),
+    lambda obj: obj.__isub__({1}),
+    lambda obj: obj.__ixor__({1, 5}),
+)
+
+
+@pytest.mark.parametrize('class_', MUTABLE_TYPES)
+@pytest.mark.parametrize('mutation', MUTATIONS)
+def test_iter_fail_fast(class_, mutation):
+    obj = class_((3, 1, 2))
+    for reverse in (False, True):
+        obj_copy = obj.copy()
+        it = obj_copy.iter_checked(reverse)
+        next(it)
+        mutation(obj_copy)
+        with pytest.raises(RuntimeError):
+            list(it)
+
+
+@pytest.mark.parametrize('class_', MUTABLE_TYPES)
+def test_iter_no_op_mutations(class_):
+    obj = class_((3, 1, 2))
+    values = []
+    for value in obj.iter_checked():
+        values.append(value)
+        obj.discard(10)
+        obj.update(())
+    assert values == list(obj)
+
+
+def test_iter_fail_fast_on_last_element():
+    obj = orderedset((3, 1, 2))
+    it = obj.iter_checked()
+    assert list(islice(it, 3)) == [3, 1, 2]
+    obj.uppend(3)
+    with pytest.raises(RuntimeError, match='changed during iteration'):
+        next(it)
+
+
+@pytest.mark.parametrize('class_', (orderedfrozenset, *MUTABLE_TYPES))
+def test_iter_plain(class_):
+    obj = class_((3, 1, 2))
+    assert type(iter(obj)) is type(iter(obj._list))
+    assert type(reversed(obj)) is type(reversed(obj._list))
+
+
+@pytest.mark.parametrize('class_', MUTABLE_TYPES)
+@pytest.mark.parametrize('mutation', (
+    lambda obj: obj.remove(10),
+    lambda obj: obj.pop(10),
+    lambda obj: obj.__delitem__(10),
+))
+def test_failed_mutation_keeps_iterators(class_, mutation):
+    obj = class_((3, 1, 2))
+    it = obj.iter_checked()
+    next(it)
+    with pytest.raises((KeyError, IndexError)):
+        mutation(obj)
+    assert len(list(it)) == 2
+
+
+def test_sorted_isub_disjoint_keeps_iterators():
+    obj = sortedorderedset((3, 1, 2))
+    it = obj.iter_checked()
+    next(it)
+    obj -= {5}
+    assert list(it) == [2, 3]
+
+
+def test_xor_with_self():
+    obj = orderedset((3, 1, 2))
+    obj ^= obj
+    assert not obj
+
+
+@parametrize_backends('backend')
+def test_iter_snapshot(backend):
+    obj = orderedset((3, 1, 2), backend=backend)
+    it = obj.iter_snapshot()
+    assert next(it) == 3
+    obj.discard(1)
+    obj.uppend(3)
+    assert list(it) == [1, 2]
+    assert list(obj) == [2, 3]
+    check_orderedset_invariants(obj)
+
+
+def test_iter_snapshot_no_copy():
+    obj = orderedset((3, 1, 2))
+    list_ = obj._list
+    assert list(obj.iter_snapshot()) == [3, 1, 2]
+    # the iteration has ended, the list is not shared anymore
+    obj.uppend(3)
+    assert obj._list is list_
+
+
+def test_iter_snapshot_keeps_snapshots():
+    obj = orderedset((3, 1, 2))
+    it = obj.iter_snapshot()
+    next(it)
+    snapshot = obj.snapshot()
+    list(it)
+    obj.uppend(3)
+    assert snapshot == orderedfrozenset((3, 1, 2))
@@ -0,0 +1,289 @@
+import sys
+import threading
+import time
+from copy import copy, deepcopy
+
+import pytest
+
+import ordered_set
+from ordered_set import (
+    orderedfrozendict,
+    orderedfrozenset,
+    orderedintset,
+    orderedset,
+    sortedorderedset,
+)
+
+from ordered_set._locking import rwlock
+
+from .helpers.ordered_set_ import check_orderedset_invariants
+from .helpers.pickle_ import pickle_roundtrip
+from .test_backends import parametrize_backends
+
+
+MUTABLE_TYPES = (orderedset, sortedorderedset, orderedintset)
+
+
+@pytest.mark.parametrize('class_', MUTABLE_TYPES)
+def test_thread_safe_default(class_):
+    obj = class_((3, 1, 2))
+    assert obj.thread_safe
+    assert obj._data_lock is not class_((1,))._data_lock
+
+
+@pytest.mark.parametrize('class_', MUTABLE_TYPES)
+def test_not_thread_safe(class_):
+    obj = class_((3, 1, 2), thread_safe=False)
+    assert not obj.thread_safe
+    obj.update((4,))
+    obj.discard(1)
+    obj |= (5, 3)
+    obj -= {2}
+    assert set(obj) == {3, 4, 5}
+    check_orderedset_invariants(obj)
+    assert class_.from_unique((1, 2), thread_safe=False).thread_safe is False
+
+
+class _FailingLock:
+
+    def __enter__(self):
+        raise AssertionError('the lock is entered')
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+@pytest.mark.parametrize('class_', MUTABLE_TYPES)
+def test_not_thread_safe_single_element_ops_skip_lock(class_, monkeypatch):
+    obj = class_((3, 1, 2, 4, 5), thread_safe=False)
+    lock = _FailingLock()
+    monkeypatch.setattr(ordered_set, '_NO_LOCK', lock)
+    obj._data_lock = obj._read_lock = lock
+    assert not obj.thread_safe
+    obj.discard(1)
+    obj.remove(2)
+    assert obj.pop(0) == 3
+    del obj[0]
+    if class_ is sortedorderedset:
+        obj.add(6)
+    else:
+        obj.append_or_ignore(6)
+        obj.insert_or_ignore(0, 7)
+        obj.upsert(0, 6)
+        obj.uppend(7)
+    assert set(obj) == {5, 6} | ({7} if class_ is not sortedorderedset else set())
+    monkeypatch.undo()
+    obj._data_lock = obj._read_lock = ordered_set._NO_LOCK
+    check_orderedset_invariants(obj)
+
+
+@pytest.mark.parametrize('class_', (orderedset, orderedintset, orderedfrozenset))
+def test_index_and_slicing_lock_free(class_):
+    obj = class_((3, 1, 2))
+    obj._data_lock = obj._read_lock = _FailingLock()
+    assert obj.index(2) == 2
+    assert list(obj[1:]) == [1, 2]
+
+
+def test_rw_lock_index_and_slicing_read_locked():
+    obj = orderedset((3, 1, 2), rw_lock=True)
+    reads = obj.lock_stats()['reads']
+    assert obj.index(2) == 2
+    assert list(obj[1:]) == [1, 2]
+    assert obj.lock_stats()['reads'] == reads + 2
+
+
+@pytest.mark.parametrize('class_', MUTABLE_TYPES)
+def test_not_thread_safe_kept(class_):
+    obj = class_((3, 1, 2), thread_safe=False)
+    derived = (copy(obj), deepcopy(obj), obj.copy(), obj[1:], obj | (4,), obj & (1,), obj - (1,))
+    for obj_derived in derived:
+        assert not obj_derived.thread_safe
+        check_orderedset_invariants(obj_derived)
+
+
+@pytest.mark.parametrize('class_', (orderedset, sortedorderedset, orderedintset))
+@pytest.mark.parametrize(
+    ('thread_safe', 'rw_lock'), ((False, False), (True, False), (True, True)),
+)
+def test_pickle_keeps_lock_mode(class_, thread_safe, rw_lock):
+    # unpickled objects lock like the pickled ones
+    obj = pickle_roundtrip(class_((1, 2), thread_safe=thread_safe, rw_lock=rw_lock))
+    assert obj.thread_safe is thread_safe
+    assert obj.rw_lock is rw_lock
+    assert obj == class_((1, 2))
+    obj.update((3,))
+    obj._check()
+
+
+def test_pickle_state_without_lock_mode():
+    # states pickled by older versions get the default locks
+    obj = orderedset.__new__(orderedset)
+    obj.__setstate__(({1, 2}, [1, 2]))
+    assert obj.thread_safe
+    assert not obj.rw_lock
+    assert obj == orderedset((1, 2))
+
+
+def test_frozen_lock_free():
+    obj = orderedfrozenset((3, 1, 2))
+    assert obj.thread_safe
+    assert obj._data_lock is orderedfrozenset((1,))._data_lock
+    assert obj._data_lock is pickle_roundtrip(obj)._data_lock
+    assert obj.copy()._data_lock is obj._data_lock
+    obj_dict = orderedfrozendict({'a': 1})
+    assert obj_dict._data_lock is obj._data_lock
+
+
+@pytest.mark.parametrize('class_', MUTABLE_TYPES)
+def test_rw_lock(class_):
+    obj = class_((3, 1, 2), rw_lock=True)
+    assert obj.thread_safe
+    assert obj.rw_lock
+    assert not class_((1,)).rw_lock
+    assert class_((1,)).lock_stats() is None
+    obj.update((4, 1))
+    assert obj.index(4) == list(obj).index(4)
+    derived = (obj.copy(), deepcopy(obj), obj[1:], obj | (5,))
+    for obj_derived in derived:
+        assert obj_derived.rw_lock
+        check_orderedset_invariants(obj_derived)
+    stats = obj.lock_stats()
+    assert stats['writes'] >= 1
+    assert stats['reads'] >= 3
+
+
+def test_rw_lock_invalid():
+    with pytest.raises(ValueError, match='requires thread_safe=True'):
+        orderedset(rw_lock=True, thread_safe=False)
+    with pytest.raises(ValueError, match='not supported by indexedlist'):
+        orderedset(rw_lock=True, backend='indexed')
+
+
+def test_rwlock_reentrant():
+    lock = rwlock()
+    with lock.write:
+        with lock.write:
+            with lock.read:
+                pass
+    with lock.read:
+        with lock.read:
+            with pytest.raises(RuntimeError):
+                lock.acquire_write()
+    with pytest.raises(RuntimeError):
+        lock.release_write()
+    assert lock.stats()['writes'] == 3
+
+
+def test_rwlock_shared_reads():
+    lock = rwlock()
+    n_threads = 4
+    barrier = threading.Barrier(n_threads)
+
+    def read():
+        with lock.read:
+            # all readers hold the lock at the same time
+            barrier.wait(timeout=5)
+
+    threads = [threading.Thread(target=read) for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = lock.stats()
+    assert stats['reads'] == n_threads
+    assert stats['shared_reads'] == n_threads - 1
+    assert stats['read_waits'] == 0
+
+
+def test_rwlock_writer_excludes_readers():
+    lock = rwlock()
+    events = []
+
+    def read():
+        with lock.read:
+            events.append('read')
+
+    thread = threading.Thread(target=read)
+    with lock.write:
+        thread.start()
+        # the reader counts the wait before it starts waiting
+        deadline = time.monotonic() + 5
+        while lock.stats()['read_waits'] == 0:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        events.append('write')
+    thread.join()
+    assert events == ['write', 'read']
+    assert lock.stats()['read_waits'] == 1
+
+
+def test_rw_lock_concurrent_use():
+    obj = orderedset(range(100), rw_lock=True)
+    errors = []
+
+    def read():
+        try:
+            for _ in range(200):
+                obj_copy = obj.copy()
+                check_orderedset_invariants(obj_copy)
+                _ = obj[10:20]
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+
+    def write():
+        for i in range(200):
+            obj.uppend(i % 100)
+            obj.discard(100 + i)
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    threads.append(threading.Thread(target=write))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    check_orderedset_invariants(obj)
+
+
+@parametrize_backends('backend')
+def test_concurrent_indexing(backend):
+    # Some backends change their internal state on reads (like compacting
+    # the list), so indexing must not run alongside a writer.
+    obj = orderedset(range(2000), backend=backend)
+    errors = []
+    done = threading.Event()
+
+    def read(i):
+        try:
+            while not done.is_set():
+                _ = obj[i]
+                _ = obj.index(1999)
+                _ = obj[i:i + 3]
+                i = (i + 7) % 1000
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+
+    def write():
+        try:
+            for i in range(2000):
+                obj.discard(i % 997)
+                obj.append_or_ignore(i % 997)
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+        finally:
+            done.set()
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=read, args=(i,)) for i in range(3)]
+        threads.append(threading.Thread(target=write))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    assert not errors
+    check_orderedset_invariants(obj)
@@ -0,0 +1,75 @@
+import random
+from functools import reduce
+from operator import and_, or_, sub
+
+import pytest
+
+from ordered_set import orderedfrozenset, orderedintset, orderedset, sortedorderedset
+
+from .helpers.ordered_set_ import check_orderedset_invariants
+
+
+TYPES = (orderedset, orderedfrozenset, sortedorderedset, orderedintset)
+
+
+def random_operands(seed):
+    rnd = random.Random(seed)
+    data = [rnd.randrange(30) for _ in range(rnd.randrange(20))]
+    others = [
+        orderedset(rnd.randrange(30) for _ in range(rnd.randrange(25)))
+        for _ in range(rnd.randrange(1, 5))
+    ]
+    return data, others
+
+
+@pytest.mark.parametrize('class_', TYPES)
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize(
+    ('method', 'op'),
+    (('union', or_), ('intersection', and_), ('difference', sub)),
+)
+def test_nary_like_chained(class_, seed, method, op):
+    data, others = random_operands(seed)
+    obj = class_(data)
+    result = getattr(obj, method)(*others)
+    expected = reduce(op, others, obj)
+    assert type(result) is class_
+    assert list(result) == list(expected)
+    assert list(obj) == list(class_(data))
+    check_orderedset_invariants(result)
+
+
+@pytest.mark.parametrize('class_', TYPES)
+def test_nary_no_others(class_):
+    obj = class_((3, 1, 2))
+    for method in ('union', 'intersection', 'difference'):
+        result = getattr(obj, method)()
+        assert result == obj
+        assert result is not obj
+
+
+@pytest.mark.parametrize('class_', TYPES)
+def test_nary_iterables(class_):
+    obj = class_((3, 1, 2, 5))
+    assert list(obj.union([4, 1, 4], iter((2,)))) == list(class_((3, 5, 1, 4, 2)))
+    assert list(obj.intersection([1, 2, 7], iter((5, 2, 1)))) == list(class_((1, 2)))
+    assert list(obj.difference([1], iter((2,)))) == list(class_((3, 5)))
+
+
+@pytest.mark.parametrize('class_', (orderedset, orderedintset))
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize(
+    ('method', 'method_inplace'),
+    (
+        ('union', 'update_many'),
+        ('intersection', 'intersection_update'),
+        ('difference', 'difference_update'),
+    ),
+)
+def test_nary_inplace(class_, seed, method, method_inplace):
+    data, others = random_operands(seed)
+    obj = class_(data)
+    expected = getattr(obj, method)(*others)
+    assert getattr(obj, method_inplace)(*others) is None
+    assert obj == expected
+    check_orderedset_invariants(obj)
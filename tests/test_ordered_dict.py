@@ -0,0 +1,203 @@
+from collections.abc import Mapping, MutableMapping, Sequence, Set
+from copy import copy, deepcopy
+
+import pytest
+
+from ordered_set import orderedfrozendict, ordereddict, orderedfrozenset, orderedset
+
+from .helpers.pickle_ import pickle_roundtrip
+
+
+ITEMS = (('a', 1), ('b', 2), ('c', 3), ('d', 4))
+
+ORDERED_DICT_TYPES = (orderedfrozendict, ordereddict)
+
+
+def parametrize_ordered_dict_types(argname):
+    return pytest.mark.parametrize(argname, ORDERED_DICT_TYPES)
+
+
+@parametrize_ordered_dict_types('class_')
+def test_init(class_):
+    obj = class_(ITEMS)
+    assert list(obj.items()) == list(ITEMS)
+    assert class_(dict(ITEMS)) == obj
+    assert len(class_()) == 0
+    obj._check()
+
+
+@parametrize_ordered_dict_types('class_')
+def test_mapping(class_):
+    obj = class_(ITEMS)
+    assert isinstance(obj, Mapping)
+    assert obj['b'] == 2
+    assert obj.get('z', 0) == 0
+    assert 'c' in obj
+    assert 'z' not in obj
+    assert list(reversed(obj)) == ['d', 'c', 'b', 'a']
+
+
+@parametrize_ordered_dict_types('class_')
+def test_positional_access(class_):
+    obj = class_(ITEMS)
+    assert obj.keys()[1] == 'b'
+    assert obj.values()[-1] == 4
+    assert obj.items()[2] == ('c', 3)
+    assert obj.items()[1:3] == [('b', 2), ('c', 3)]
+    assert obj.values()[::2] == [1, 3]
+    assert obj.index('c') == 2
+    assert obj.items().index(('d', 4)) == 3
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = obj.items().index(('d', 5))
+
+
+@parametrize_ordered_dict_types('class_')
+def test_index(class_):
+    obj = class_(ITEMS)
+    assert obj.keys().index('b', 1, 2) == 1
+    for key, start, stop in (('b', 2, None), ('b', 0, 1), ('z', 0, None), ([], 0, None)):
+        with pytest.raises(ValueError, match='is not in list'):
+            obj.index(key, start, stop)
+    if class_ is ordereddict:
+        obj.move('d', 0)
+        del obj['b']
+        assert [obj.index(key) for key in 'dac'] == [0, 1, 2]
+
+
+@parametrize_ordered_dict_types('class_')
+def test_items_view_is_set_and_sequence(class_):
+    items = class_(ITEMS).items()
+    assert isinstance(items, Set)
+    assert isinstance(items, Sequence)
+    assert items == set(ITEMS)
+    assert items <= {*ITEMS, ('z', 0)}
+    assert not (items < set(ITEMS))
+    assert (items & {('b', 2), ('c', 0)}) == {('b', 2)}
+    assert (items | {('z', 0)}) == {*ITEMS, ('z', 0)}
+    assert (items - {('b', 2)}) == set(ITEMS) - {('b', 2)}
+    assert ({('b', 2), ('z', 0)} - items) == {('z', 0)}
+    assert items.isdisjoint([('a', 2), 'a', ([], 1)])
+    assert not items.isdisjoint({('a', 1)})
+    assert items.count(('c', 3)) == 1
+    assert items.count(('c', 4)) == 0
+
+
+@parametrize_ordered_dict_types('class_')
+def test_values_view_is_sequence(class_):
+    values = class_(ITEMS).values()
+    assert isinstance(values, Sequence)
+    assert values.index(3) == 2
+    assert values.count(3) == 1
+    assert values.count(5) == 0
+    assert list(reversed(values)) == [4, 3, 2, 1]
+
+
+@parametrize_ordered_dict_types('class_')
+def test_keys_set_algebra(class_):
+    obj = class_(ITEMS)
+    keys_type = (orderedset if class_ is ordereddict else orderedfrozenset)
+    result = obj.keys() & {'d', 'b', 'z'}
+    assert isinstance(result, keys_type)
+    assert list(result) == ['b', 'd']
+    assert list(obj.keys() - {'a'}) == ['b', 'c', 'd']
+    assert list(obj.keys() | orderedset(('z', 'a'))) == ['b', 'c', 'd', 'z', 'a']
+    assert list(obj.keys() ^ class_((('a', 0), ('y', 0))).keys()) == ['b', 'c', 'd', 'y']
+    assert ({'a', 'q'} & obj.keys()) == {'a'}
+    assert obj.keys() == {'a', 'b', 'c', 'd'}
+    keys_seq_type = (list if class_ is ordereddict else tuple)
+    assert obj.keys() == keys_seq_type('abcd')
+    assert obj.keys() != keys_seq_type('bacd')
+    assert obj.keys().isdisjoint({'x'})
+
+
+def test_setitem_keeps_position():
+    obj = ordereddict(ITEMS)
+    obj['b'] = 20
+    obj['e'] = 5
+    assert list(obj.items()) == [('a', 1), ('b', 20), ('c', 3), ('d', 4), ('e', 5)]
+    obj._check()
+
+
+def test_uppend():
+    obj = ordereddict(ITEMS)
+    obj.uppend('b', 20)
+    obj.uppend('e', 5)
+    assert list(obj.items()) == [('a', 1), ('c', 3), ('d', 4), ('b', 20), ('e', 5)]
+    obj._check()
+
+
+def test_move():
+    obj = ordereddict(ITEMS)
+    obj.move('d', 0)
+    assert list(obj) == ['d', 'a', 'b', 'c']
+    obj.move('d', len(obj))
+    assert list(obj) == ['a', 'b', 'c', 'd']
+    obj.move('a', -1)
+    assert list(obj) == ['b', 'c', 'a', 'd']
+    with pytest.raises(KeyError):
+        obj.move('z', 0)
+    obj._check()
+
+
+def test_delete():
+    obj = ordereddict(ITEMS)
+    assert isinstance(obj, MutableMapping)
+    del obj['b']
+    assert obj.pop('c') == 3
+    assert obj.popitem() == ('d', 4)
+    obj['e'] = 5
+    assert obj.popitem(0) == ('a', 1)
+    assert list(obj.items()) == [('e', 5)]
+    with pytest.raises(KeyError):
+        del obj['z']
+    obj.clear()
+    assert len(obj) == 0
+    obj._check()
+
+
+def test_update():
+    obj = ordereddict(ITEMS)
+    obj.update({'c': 30, 'e': 5})
+    obj |= (('f', 6),)
+    assert list(obj.items()) == [('a', 1), ('b', 2), ('c', 30), ('d', 4), ('e', 5), ('f', 6)]
+    merged = obj | {'a': 0}
+    assert merged['a'] == 0
+    assert obj['a'] == 1
+
+
+def test_backend():
+    obj = ordereddict(ITEMS, backend='tombstoned')
+    obj.uppend('a', 0)
+    assert list(obj) == ['b', 'c', 'd', 'a']
+    assert obj.index('a') == 3
+    obj._check()
+
+
+def test_equality():
+    assert ordereddict(ITEMS) == orderedfrozendict(ITEMS)
+    assert ordereddict(ITEMS) != ordereddict(reversed(ITEMS))
+    assert ordereddict(ITEMS) == dict(reversed(ITEMS))
+
+
+def test_hash():
+    obj = orderedfrozendict(ITEMS)
+    assert hash(obj) == hash(obj) == hash(orderedfrozendict(ITEMS))
+    assert hash(pickle_roundtrip(obj)) == hash(obj)
+    assert {orderedfrozendict(ITEMS): 1}[orderedfrozendict(ITEMS)] == 1
+    with pytest.raises(TypeError):
+        _ = hash(ordereddict(ITEMS))
+
+
+@parametrize_ordered_dict_types('class_')
+def test_fromkeys(class_):
+    assert list(class_.fromkeys('abc', 0).items()) == [('a', 0), ('b', 0), ('c', 0)]
+
+
+@pytest.mark.parametrize('copy_func', (copy, deepcopy, pickle_roundtrip))
+@parametrize_ordered_dict_types('class_')
+def test_copy(class_, copy_func):
+    obj = class_(ITEMS)
+    copy_ = copy_func(obj)
+    assert copy_ == obj
+    assert type(copy_) is class_
+    copy_._check()
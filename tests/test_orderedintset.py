@@ -0,0 +1,151 @@
+import random
+from copy import copy, deepcopy
+
+import pytest
+
+from ordered_set import orderedintset, orderedset
+
+from .helpers.ordered_set_ import check_orderedset_invariants
+from .helpers.pickle_ import pickle_roundtrip
+
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+DATA = (5, 3, 9, 1, 3, 7, INT64_MIN, INT64_MAX, INT64_MIN + 1, 0, -1)
+
+
+def test_init():
+    obj = orderedintset(DATA)
+    assert list(obj) == list(orderedset(DATA))
+    assert len(obj) == len(set(DATA))
+    for val in DATA:
+        assert val in obj
+    assert 2 not in obj
+    assert 'a' not in obj
+    assert (1 << 64) not in obj
+    check_orderedset_invariants(obj)
+
+
+@pytest.mark.parametrize(
+    ('val', 'exc_type'),
+    (
+        ('a', TypeError),
+        (1.5, TypeError),
+        ((INT64_MAX + 1), OverflowError),
+        ((INT64_MIN - 1), OverflowError),
+    ),
+)
+def test_invalid_values(val, exc_type):
+    obj = orderedintset((1, 2))
+    with pytest.raises(exc_type):
+        obj.uppend(val)
+    assert list(obj) == [1, 2]
+    check_orderedset_invariants(obj)
+
+
+@pytest.mark.parametrize(
+    ('val', 'exc_type'),
+    (
+        ('a', TypeError),
+        (1.5, TypeError),
+        ((INT64_MAX + 1), OverflowError),
+    ),
+)
+@pytest.mark.parametrize(
+    'method',
+    (
+        lambda obj, values: obj.update(values),
+        lambda obj, values: obj.update(set(values)),
+        lambda obj, values: obj.extend_or_ignore(values),
+        lambda obj, values: obj.insert_many_or_ignore(0, values),
+        lambda obj, values: obj.upsert_many(0, values),
+        lambda obj, values: obj.__ixor__(set(values)),
+    ),
+)
+def test_invalid_values_many(val, exc_type, method):
+    obj = orderedintset((1, 2))
+    with pytest.raises(exc_type):
+        method(obj, [3, val])
+    assert list(obj) == [1, 2]
+    check_orderedset_invariants(obj)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_random_operations(seed):
+    rng = random.Random(seed)
+    obj = orderedintset()
+    expected = orderedset()
+    for _ in range(3000):
+        val = rng.choice((rng.randrange(-300, 300), INT64_MIN, INT64_MIN + 1, INT64_MAX))
+        op = rng.randrange(6)
+        if op == 0:
+            obj.uppend(val)
+            expected.uppend(val)
+        elif op == 1:
+            obj.append_or_ignore(val)
+            expected.append_or_ignore(val)
+        elif op in (2, 3):
+            obj.discard(val)
+            expected.discard(val)
+        elif op == 4 and expected:
+            idx = rng.randrange(-len(expected), len(expected))
+            assert obj.pop(idx) == expected.pop(idx)
+        elif op == 5:
+            idx = rng.randint(-len(expected) - 1, len(expected) + 1)
+            obj.upsert(idx, val)
+            expected.upsert(idx, val)
+    assert list(obj) == list(expected)
+    assert list(reversed(obj)) == list(reversed(expected))
+    for val in expected:
+        assert obj.index(val) == expected.index(val)
+    check_orderedset_invariants(obj)
+
+
+def test_binary_ops():
+    obj1 = orderedintset((1, 2, 3, 4))
+    obj2 = orderedintset((3, 4, 5, 6))
+    for result, expected in (
+        ((obj1 & obj2), (3, 4)),
+        ((obj1 | obj2), (1, 2, 3, 4, 5, 6)),
+        ((obj1 ^ obj2), (1, 2, 5, 6)),
+        ((obj1 - obj2), (1, 2)),
+        ((obj1 & {2, 9}), (2,)),
+        (obj1[1:3], (2, 3)),
+    ):
+        assert isinstance(result, orderedintset)
+        assert tuple(result) == expected
+        check_orderedset_invariants(result)
+    assert obj1 == orderedset((1, 2, 3, 4))
+    assert obj1 == [1, 2, 3, 4]
+    assert obj1.is_set_equal({4, 3, 2, 1})
+
+
+def test_inplace_ops():
+    obj = orderedintset((1, 2, 3, 4))
+    obj &= {1, 2, 3}
+    obj |= (7, 1)
+    obj -= {2}
+    obj ^= {3, 8}
+    assert list(obj) == [7, 1, 8]
+    check_orderedset_invariants(obj)
+
+
+def test_compact():
+    obj = orderedintset(range(0, 30000, 3))
+    size = (
+        obj._list.buffer_info()[1] * obj._list.itemsize
+        + obj._set._table.buffer_info()[1] * obj._set._table.itemsize
+    )
+    assert size / len(obj) <= 32
+
+
+@pytest.mark.parametrize('copy_func', (copy, deepcopy, pickle_roundtrip))
+def test_copy(copy_func):
+    obj = orderedintset(DATA)
+    copy_ = copy_func(obj)
+    assert type(copy_) is orderedintset
+    assert copy_ == obj
+    copy_.uppend(5)
+    assert list(obj) == list(orderedset(DATA))
+    check_orderedset_invariants(copy_)
@@ -0,0 +1,187 @@
+import os
+import random
+import subprocess
+import sys
+from copy import copy, deepcopy
+
+import pytest
+
+from ordered_set import orderedfrozenset, orderednumericset, orderedset
+
+from .helpers.pickle_ import pickle_roundtrip
+
+np = pytest.importorskip('numpy')
+
+
+DATA = (5, 3, 9, 1, 3, 7, 0, -1, 9)
+
+
+def test_init():
+    obj = orderednumericset(DATA)
+    assert list(obj) == list(orderedset(DATA))
+    assert obj == list(orderedset(DATA))
+    assert len(obj) == len(set(DATA))
+    for val in DATA:
+        assert val in obj
+    assert 2 not in obj
+    obj._check()
+
+
+def test_init_dtype():
+    obj = orderednumericset(DATA, dtype=np.int32)
+    assert obj.dtype == np.int32
+    assert orderednumericset().dtype == np.float64
+    assert len(orderednumericset()) == 0
+
+
+@pytest.mark.parametrize(
+    'mutation',
+    (
+        lambda obj, values: obj.update(values),
+        lambda obj, values: obj.extend_or_ignore(values),
+        lambda obj, values: obj.__ior__(values),
+        lambda obj, values: obj.__ixor__(values),
+    ),
+)
+def test_mutation_keeps_dtype(mutation):
+    obj = orderednumericset((1, 2, 3), dtype=np.int32)
+    mutation(obj, np.array((4, 5), dtype=np.int64))
+    assert obj.dtype == np.int32
+    assert obj == [1, 2, 3, 4, 5]
+    with pytest.raises(TypeError, match='Cannot add values of dtype float64'):
+        mutation(obj, [4.7])
+    with pytest.raises(OverflowError, match='do not fit into dtype int32'):
+        mutation(obj, [2 ** 40])
+    assert obj.dtype == np.int32
+    assert obj == [1, 2, 3, 4, 5]
+    obj_float = orderednumericset((1.5,), dtype=np.float32)
+    mutation(obj_float, [2.5])
+    assert obj_float.dtype == np.float32
+
+
+def test_binary_ops_keep_dtype():
+    obj = orderednumericset((1, 2, 3), dtype=np.int64)
+    for result in (obj | [4], obj ^ [3, 4], {4, 5} - obj, [2, 4] | obj):
+        assert result.dtype == np.int64
+    with pytest.raises(TypeError):
+        _ = obj | [4.7]
+
+
+def test_index():
+    obj = orderednumericset(DATA)
+    for i, val in enumerate(orderedset(DATA)):
+        assert obj.index(val) == i
+    with pytest.raises(ValueError, match='is not in list'):
+        obj.index(2)
+    with pytest.raises(ValueError, match='is not in list'):
+        obj.index(DATA[0], 1)
+
+
+def test_to_numpy_read_only():
+    obj = orderednumericset(DATA)
+    arr = obj.to_numpy()
+    with pytest.raises(ValueError, match='read-only'):
+        arr[0] = 100
+    assert np.array_equal(np.asarray(obj), arr)
+
+
+def test_single_element_ops():
+    obj = orderednumericset((1, 2, 3))
+    obj.append_or_ignore(1)
+    assert obj == [1, 2, 3]
+    obj.uppend(1)
+    assert obj == [2, 3, 1]
+    obj.discard(5)
+    obj.remove(3)
+    assert obj == [2, 1]
+    with pytest.raises(KeyError):
+        obj.remove(3)
+    assert obj.pop() == 1
+    assert obj == [2]
+    obj.clear()
+    assert not obj
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_matches_orderedset(seed):
+    rnd = random.Random(seed)
+    a = [rnd.randrange(30) for _ in range(rnd.randrange(20))]
+    b = [rnd.randrange(30) for _ in range(rnd.randrange(20))]
+    b_ordered = orderedset(b)
+    expected = orderedset(a)
+    obj = orderednumericset(a, dtype=np.int64)
+    assert obj == list(expected)
+
+    assert (obj & b_ordered) == list(expected & b_ordered)
+    assert (obj | b_ordered) == list(expected | b_ordered)
+    assert (obj - b_ordered) == list(expected - b_ordered)
+    assert (obj ^ b_ordered) == list(expected ^ b_ordered)
+
+    obj_ = obj.copy()
+    expected_ = expected.copy()
+    obj_.update(b)
+    expected_.update(b)
+    assert obj_ == list(expected_)
+
+    obj_ = obj.copy()
+    expected_ = expected.copy()
+    obj_.extend_or_ignore(b)
+    for val in b:
+        expected_.append_or_ignore(val)
+    assert obj_ == list(expected_)
+
+    for op in ('__iand__', '__ior__', '__isub__', '__ixor__'):
+        obj_ = obj.copy()
+        expected_ = expected.copy()
+        assert getattr(obj_, op)(b_ordered) is obj_
+        getattr(expected_, op)(b_ordered)
+        assert obj_ == list(expected_)
+        obj_._check()
+
+
+def test_copy_and_pickle():
+    obj = orderednumericset(DATA)
+    for obj_copy in (copy(obj), deepcopy(obj), pickle_roundtrip(obj)):
+        assert obj_copy == obj
+        assert obj_copy._array is not obj._array
+
+
+@pytest.mark.parametrize('data', (['a', 'b'], [1, 2**70], [1j]))
+def test_init_not_numbers(data):
+    with pytest.raises(TypeError, match='Numbers are required'):
+        orderednumericset(data)
+
+
+def test_comparisons():
+    obj = orderednumericset((1, 2, 3))
+    assert obj == [1, 2, 3]
+    assert obj == {3, 1, 2}
+    assert obj == orderedset((1, 2, 3))
+    assert orderedset((1, 2, 3)) == obj
+    assert obj != orderedfrozenset((3, 2, 1))
+    assert obj == orderednumericset((1, 2, 3))
+    assert obj != orderednumericset((3, 2, 1))
+    assert obj <= {1, 2, 3, 4}
+    assert obj < {1, 2, 3, 4}
+    assert not (obj < {1, 2, 3})
+    assert obj >= {1}
+    assert obj < [1, 2, 4]
+    assert obj > orderednumericset((1, 2))
+    assert obj.isdisjoint({4, 5})
+    assert not obj.isdisjoint([5, 3])
+
+
+def test_reflected_ops():
+    obj = orderednumericset((1, 2, 3))
+    assert ({1, 2, 9} - obj) == [9]
+    assert ([9, 1, 8, 9] - obj) == [8, 9]
+    assert ({2, 9} & obj) == [2]
+    assert ({9} | obj) == [1, 2, 3, 9]
+    assert ({2, 9} ^ obj) == [1, 3, 9]
+    assert type({9} | obj) is orderednumericset
+
+
+def test_numpy_imported_lazily():
+    code = 'import sys, ordered_set; assert "numpy" not in sys.modules'
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, '-c', code], check=True, env=env)
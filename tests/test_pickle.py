@@ -1,3 +1,5 @@
+from ordered_set import orderedset
+
 from .helpers.ordered_set_ import parametrize_ordered_set_types
 from .helpers.pickle_ import pickle_roundtrip
 
@@ -12,3 +14,9 @@ def test_pickle_empty(class_):
 def test_pickle(class_):
     obj = class_('abracadabra')
     assert pickle_roundtrip(obj) == obj
+
+
+def test_pickle_mutable_usable():
+    obj = pickle_roundtrip(orderedset('abracadabra'))
+    obj.uppend('a')
+    assert list(obj) == list('cdbra')
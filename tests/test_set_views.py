@@ -0,0 +1,87 @@
+from collections.abc import Sequence, Set
+
+import pytest
+
+from ordered_set import orderedfrozenset, orderedintset, orderedset
+
+
+@pytest.mark.parametrize('cls', (orderedset, orderedfrozenset, orderedintset))
+def test_as_set(cls):
+    obj = cls((3, 1, 2))
+    view = obj.as_set()
+    assert isinstance(view, Set)
+    assert len(view) == 3
+    assert 1 in view
+    assert 5 not in view
+    assert set(view) == {1, 2, 3}
+    assert view == {1, 2, 3}
+    assert {1, 2, 3} == view
+    assert view != {1, 2}
+    assert view <= {1, 2, 3, 4}
+    assert view < {1, 2, 3, 4}
+    assert {1} < view
+    assert view >= {1}
+    assert (view & {1, 5}) == {1}
+    assert ({1, 5} & view) == {1}
+    assert (view | {5}) == {1, 2, 3, 5}
+    assert ({5} | view) == {1, 2, 3, 5}
+    assert (view - {1}) == {2, 3}
+    assert ({1, 5} - view) == {5}
+    assert (view ^ {1, 5}) == {2, 3, 5}
+    assert ({1, 5} ^ view) == {2, 3, 5}
+    assert view.isdisjoint((4, 5))
+    assert not view.isdisjoint((3, 4))
+
+
+def test_as_set_result_types():
+    obj = orderedset((3, 1, 2))
+    assert type(obj.as_set() & {1}) is set
+    # The storage of the frozen set is shared with a mutable set.
+    frozen = orderedfrozenset(obj)
+    assert type(frozen.as_set() & {1}) is frozenset
+    assert type({1} - frozen.as_set()) is frozenset
+
+
+def test_as_set_unwraps_ordered_operands():
+    view = orderedset((3, 1, 2)).as_set()
+    assert (view & orderedset((2, 5))) == {2}
+    assert (view | orderedfrozenset((5,)).as_set()) == {1, 2, 3, 5}
+    assert view == orderedset((1, 2, 3))
+
+
+def test_as_set_not_a_set():
+    view = orderedset((3, 1, 2)).as_set()
+    with pytest.raises(TypeError):
+        view & [1]
+    assert view != [1, 2, 3]
+
+
+@pytest.mark.parametrize('cls', (orderedset, orderedfrozenset, orderedintset))
+def test_as_sequence(cls):
+    obj = cls((3, 1, 2))
+    view = obj.as_sequence()
+    assert isinstance(view, Sequence)
+    assert len(view) == 3
+    assert list(view) == [3, 1, 2]
+    assert list(reversed(view)) == [2, 1, 3]
+    assert view[0] == 3
+    assert list(view[1:]) == [1, 2]
+    assert 2 in view
+    assert 5 not in view
+    assert view.index(2) == 2
+    assert view.count(1) == 1
+    assert view.count(5) == 0
+
+
+def test_views_are_live():
+    obj = orderedset((3, 1, 2))
+    set_view = obj.as_set()
+    sequence_view = obj.as_sequence()
+    obj.discard(1)
+    obj.update((7,))
+    assert set_view == {2, 3, 7}
+    assert list(sequence_view) == [3, 2, 7]
+    obj_snapshot = obj.snapshot()
+    obj.discard(7)
+    assert 7 not in set_view
+    assert 7 in obj_snapshot.as_set()
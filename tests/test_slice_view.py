@@ -0,0 +1,105 @@
+import itertools
+
+import pytest
+
+from ordered_set import (
+    orderedfrozenset,
+    orderedintset,
+    orderedset,
+    sortedorderedset,
+)
+
+from .test_backends import parametrize_backends
+from .test_snapshot import MUTATIONS
+
+
+SLICE_ARGS = tuple(itertools.product(
+    (None, 0, 3, -3, 25, -25),
+    (None, 0, 5, -5, 30, -30),
+    (None, 1, 2, -1, -3),
+))
+
+
+@pytest.mark.parametrize(
+    'cls', (orderedset, orderedfrozenset, sortedorderedset, orderedintset),
+)
+def test_slice_view_like_slice(cls):
+    obj = cls(range(20))
+    for start, stop, step in SLICE_ARGS:
+        view = obj.slice_view(start, stop, step)
+        expected = list(obj)[start:stop:step]
+        assert list(view) == expected
+        assert list(reversed(view)) == expected[::-1]
+        assert len(view) == len(expected)
+        assert bool(view) == bool(expected)
+        assert list(view[1:3]) == expected[1:3]
+        for value in range(-1, 21):
+            assert (value in view) == (value in expected)
+            assert view.count(value) == expected.count(value)
+            if value in expected:
+                assert view.index(value) == expected.index(value)
+            else:
+                with pytest.raises(ValueError, match='is not in list'):
+                    view.index(value)
+        materialized = view.materialize()
+        assert type(materialized) is cls
+        assert materialized == obj[start:stop:step]
+
+
+def test_slice_view_getitem_and_index_range():
+    view = orderedset('abcdef').slice_view(1, 5)
+    assert view[0] == 'b'
+    assert view[-1] == 'e'
+    with pytest.raises(IndexError):
+        view[4]
+    assert view.index('d', 1, 3) == 2
+    with pytest.raises(ValueError, match='is not in list'):
+        view.index('b', 1)
+    assert repr(view) == "_orderedset_slice_view(['b', 'c', 'd', 'e'])"
+
+
+@parametrize_backends('backend')
+def test_slice_view_backends(backend):
+    obj = orderedset(range(20), backend=backend)
+    view = obj.slice_view(2, 15, 3)
+    assert list(view) == list(range(2, 15, 3))
+    assert view.index(8) == 2
+    assert 9 not in view
+    assert view.materialize() == orderedset(range(2, 15, 3))
+
+
+@pytest.mark.parametrize('mutate', MUTATIONS)
+def test_slice_view_invalidated(mutate):
+    obj = orderedset((1, 2, 3))
+    view = obj.slice_view(1)
+    it = iter(view)
+    mutate(obj)
+    with pytest.raises(RuntimeError):
+        len(view)
+    with pytest.raises(RuntimeError):
+        iter(view)
+    with pytest.raises(RuntimeError):
+        view.materialize()
+    with pytest.raises(RuntimeError):
+        list(it)
+    # A new view sees the changes.
+    assert list(obj.slice_view()) == list(obj)
+
+
+@pytest.mark.parametrize('mutate', MUTATIONS)
+def test_slice_is_copy(mutate):
+    # Unlike `slice_view()`, slicing returns an independent ordered set.
+    obj = orderedset((1, 2, 3))
+    slice_ = obj[1:]
+    mutate(obj)
+    assert type(slice_) is orderedset
+    assert list(slice_) == [2, 3]
+    slice_.append_or_ignore(4)
+    assert list(slice_) == [2, 3, 4]
+
+
+def test_slice_view_frozen_never_invalidated():
+    obj = orderedfrozenset((1, 2, 3))
+    view = obj.slice_view(1)
+    assert list(view) == [2, 3]
+    assert view.materialize() == orderedfrozenset((2, 3))
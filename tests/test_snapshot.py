@@ -0,0 +1,110 @@
+import pickle
+
+import pytest
+
+from ordered_set import orderedfrozenset, orderedintset, orderedset
+
+from .helpers.ordered_set_ import check_orderedset_invariants
+from .test_backends import parametrize_backends
+
+
+MUTATIONS = (
+    lambda obj: obj.uppend(1),
+    lambda obj: obj.append_or_ignore(10),
+    lambda obj: obj.insert_or_ignore(0, 10),
+    lambda obj: obj.upsert(0, 3),
+    lambda obj: obj.remove(2),
+    lambda obj: obj.discard(2),
+    lambda obj: obj.pop(),
+    lambda obj: obj.__delitem__(0),
+    lambda obj: obj.__delitem__(slice(1, None)),
+    lambda obj: obj.clear(),
+    lambda obj: obj.reverse(),
+    lambda obj: obj.update((5, 1)),
+    lambda obj: obj.update({5, 1}),
+    lambda obj: obj.extend_or_ignore((5, 1)),
+    lambda obj: obj.__iand__({1, 3}),
+    lambda obj: obj.__ior__({1, 5}),
+    lambda obj: obj.__isub__({1}),
+    lambda obj: obj.__ixor__({1, 5}),
+    lambda obj: obj.__ixor__(orderedset((1, 5))),
+)
+
+
+def test_snapshot_shares_storage():
+    obj = orderedset((3, 1, 2))
+    snapshot = obj.snapshot()
+    assert isinstance(snapshot, orderedfrozenset)
+    assert snapshot._set is obj._set
+    assert snapshot._list is obj._list
+    assert orderedfrozenset(obj)._list is obj._list
+
+
+@pytest.mark.parametrize('backend', ('indexed', 'tombstoned', 'blocked'))
+def test_snapshot_copies_other_backends(backend):
+    obj = orderedset((3, 1, 2), backend=backend)
+    snapshot = obj.snapshot()
+    assert type(snapshot._list) is tuple
+    assert not obj._shared
+    assert snapshot == orderedfrozenset((3, 1, 2))
+    assert list(obj.iter_snapshot()) == [3, 1, 2]
+    assert not obj._shared
+
+
+@pytest.mark.parametrize('mutation', (
+    lambda obj: obj.remove(10),
+    lambda obj: obj.pop(10),
+    lambda obj: obj.pop(-10),
+    lambda obj: obj.__delitem__(10),
+))
+def test_failed_mutation_keeps_sharing(mutation):
+    obj = orderedset((3, 1, 2))
+    snapshot = obj.snapshot()
+    with pytest.raises((KeyError, IndexError)):
+        mutation(obj)
+    assert obj._list is snapshot._list
+    assert obj._set is snapshot._set
+
+
+@parametrize_backends('backend')
+@pytest.mark.parametrize('mutation', MUTATIONS)
+def test_snapshot_copy_on_write(backend, mutation):
+    obj = orderedset((3, 1, 2), backend=backend)
+    snapshot = obj.snapshot()
+    expected = list(obj)
+    mutation(obj)
+    assert list(snapshot) == expected
+    assert set(snapshot) == set(expected)
+    assert snapshot._list is not obj._list
+    check_orderedset_invariants(obj)
+    check_orderedset_invariants(snapshot)
+    # the object owns its storage now
+    mutation_list = obj._list
+    obj.append_or_ignore(20)
+    assert obj._list is mutation_list
+
+
+def test_snapshot_frozen_semantics():
+    obj = orderedset((3, 1, 2))
+    snapshot = obj.snapshot()
+    frozen = orderedfrozenset((3, 1, 2))
+    assert snapshot == frozen
+    assert frozen == snapshot
+    assert snapshot == (3, 1, 2)
+    assert snapshot <= frozen
+    assert not (snapshot < (3, 1, 2))
+    assert hash(snapshot) == hash(frozen)
+    assert repr(snapshot) == repr(frozen)
+    assert pickle.loads(pickle.dumps(snapshot)) == frozen
+    obj.uppend(3)
+    assert snapshot == frozen
+
+
+def test_snapshot_of_unboxed():
+    obj = orderedintset((1000, 2000))
+    snapshot = obj.snapshot()
+    obj.discard(1000)
+    assert snapshot == orderedfrozenset((1000, 2000))
+    check_orderedset_invariants(snapshot)
+    check_orderedset_invariants(snapshot.copy())
+    check_orderedset_invariants(orderedset(obj).copy())
@@ -0,0 +1,180 @@
+from copy import copy, deepcopy
+
+import pytest
+
+from ordered_set import orderedset, sortedorderedset
+
+from .helpers.ordered_set_ import check_orderedset_invariants
+from .helpers.pickle_ import pickle_roundtrip
+
+
+DATA = (5, 3, 9, 1, 3, 7)
+DATA_SORTED = (1, 3, 5, 7, 9)
+
+WORDS = ('bb', 'a', 'ccc', 'dd', 'e')
+WORDS_SORTED_BY_LEN = ('a', 'e', 'bb', 'dd', 'ccc')
+
+
+def test_init():
+    obj = sortedorderedset(DATA)
+    assert tuple(obj) == DATA_SORTED
+    check_orderedset_invariants(obj)
+
+
+def test_init_key():
+    obj = sortedorderedset(WORDS, key=len)
+    assert tuple(obj) == WORDS_SORTED_BY_LEN
+    assert obj.key is len
+    check_orderedset_invariants(obj)
+
+
+def test_from_unique():
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = sortedorderedset.from_unique(DATA)
+    obj = sortedorderedset.from_unique(WORDS, key=len)
+    assert tuple(obj) == WORDS_SORTED_BY_LEN
+
+
+def test_add():
+    obj = sortedorderedset(WORDS, key=len)
+    obj.add('ff')
+    obj.add('a')
+    assert tuple(obj) == ('a', 'e', 'bb', 'dd', 'ff', 'ccc')
+    check_orderedset_invariants(obj)
+
+
+def test_update():
+    obj = sortedorderedset(DATA)
+    obj.update((8, 2, 9, 8, 0))
+    assert tuple(obj) == (0, 1, 2, 3, 5, 7, 8, 9)
+    check_orderedset_invariants(obj)
+
+
+def test_add_incomparable():
+    obj = sortedorderedset((1, 2, 3))
+    with pytest.raises(TypeError):
+        obj.add('a')
+    assert tuple(obj) == (1, 2, 3)
+    assert 'a' not in obj
+    check_orderedset_invariants(obj)
+
+
+def test_update_incomparable():
+    obj = sortedorderedset((1, 2, 3))
+    it = obj.iter_checked()
+    next(it)
+    with pytest.raises(TypeError):
+        obj.update(('a', 0, 'b'))
+    assert tuple(obj) == (1, 2, 3)
+    assert list(it) == [2, 3]
+    check_orderedset_invariants(obj)
+
+
+@pytest.mark.parametrize('val', DATA_SORTED)
+def test_index(val):
+    obj = sortedorderedset(DATA)
+    assert obj.index(val) == DATA_SORTED.index(val)
+
+
+def test_index_equal_keys():
+    obj = sortedorderedset(WORDS, key=len)
+    for val in WORDS:
+        assert obj.index(val) == WORDS_SORTED_BY_LEN.index(val)
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = obj.index('zz')
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = obj.index('dd', 0, 3)
+
+
+def test_remove_discard_pop():
+    obj = sortedorderedset(WORDS, key=len)
+    obj.remove('bb')
+    obj.discard('e')
+    obj.discard('zz')
+    with pytest.raises(KeyError):
+        obj.remove('zz')
+    assert obj.pop() == 'ccc'
+    assert obj.pop(0) == 'a'
+    assert tuple(obj) == ('dd',)
+    check_orderedset_invariants(obj)
+
+
+def test_delitem():
+    obj = sortedorderedset(DATA)
+    del obj[1]
+    del obj[-2:]
+    assert tuple(obj) == (1, 5)
+    check_orderedset_invariants(obj)
+
+
+def test_bisect():
+    obj = sortedorderedset(DATA)
+    assert obj.bisect_left(5) == 2
+    assert obj.bisect_right(5) == 3
+    assert obj.bisect(4) == 2
+    obj = sortedorderedset(WORDS, key=len)
+    assert obj.bisect_key_left(2) == 2
+    assert obj.bisect_key_right(2) == 4
+    assert obj.bisect_left('zz') == 2
+
+
+@pytest.mark.parametrize(
+    ('minimum', 'maximum', 'inclusive', 'reverse', 'expected'),
+    (
+        (None, None, (True, True), False, DATA_SORTED),
+        (3, 7, (True, True), False, (3, 5, 7)),
+        (3, 7, (False, True), False, (5, 7)),
+        (3, 7, (True, False), False, (3, 5)),
+        (2, 8, (False, False), False, (3, 5, 7)),
+        (4, None, (True, True), True, (9, 7, 5)),
+        (None, 4, (True, True), False, (1, 3)),
+        (7, 3, (True, True), False, ()),
+    ),
+)
+def test_irange(minimum, maximum, inclusive, reverse, expected):
+    obj = sortedorderedset(DATA)
+    assert tuple(obj.irange(minimum, maximum, inclusive, reverse)) == expected
+
+
+def test_irange_key():
+    obj = sortedorderedset(WORDS, key=len)
+    assert tuple(obj.irange_key(1, 2, (False, True))) == ('bb', 'dd')
+
+
+def test_binary_ops_keep_key():
+    obj = sortedorderedset(WORDS, key=len)
+    for result, expected in (
+        ((obj | {'ffff', 'gg'}), ('a', 'e', 'bb', 'dd', 'gg', 'ccc', 'ffff')),
+        ((obj & orderedset(('dd', 'a', 'x'))), ('a', 'dd')),
+        ((obj - {'a', 'ccc'}), ('e', 'bb', 'dd')),
+        ((obj ^ {'a', 'f'}), ('e', 'f', 'bb', 'dd', 'ccc')),
+        (obj[1:3], ('e', 'bb')),
+    ):
+        assert isinstance(result, sortedorderedset)
+        assert result.key is len
+        assert tuple(result) == expected
+        check_orderedset_invariants(result)
+
+
+def test_inplace_ops():
+    obj = sortedorderedset(DATA)
+    obj |= {4, 10}
+    assert tuple(obj) == (1, 3, 4, 5, 7, 9, 10)
+    obj &= {1, 4, 5, 9, 11}
+    assert tuple(obj) == (1, 4, 5, 9)
+    obj -= {5}
+    assert tuple(obj) == (1, 4, 9)
+    obj ^= {4, 0}
+    assert tuple(obj) == (0, 1, 9)
+    check_orderedset_invariants(obj)
+
+
+@pytest.mark.parametrize('copy_func', (copy, deepcopy, pickle_roundtrip))
+def test_copy(copy_func):
+    obj = sortedorderedset(WORDS, key=len)
+    copy_ = copy_func(obj)
+    assert copy_ is not obj
+    assert copy_ == obj
+    assert copy_.key is len
+    copy_.add('ff')
+    check_orderedset_invariants(copy_)
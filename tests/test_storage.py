@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from ordered_set import blockedlist, indexedlist, tombstonedlist
+
+from .helpers.storage_ import smallblockedlist
+
+
+STORAGE_TYPES = (indexedlist, tombstonedlist, blockedlist, smallblockedlist)
+
+
+def parametrize_storage_types(argname):
+    return pytest.mark.parametrize(argname, STORAGE_TYPES, ids=lambda t: t.__name__)
+
+
+def check_storage(storage, expected):
+    assert len(storage) == len(expected)
+    assert list(storage) == expected
+    assert list(reversed(storage)) == list(reversed(expected))
+    assert storage == expected
+    storage._check()
+
+
+@parametrize_storage_types('class_')
+@pytest.mark.parametrize('seed', range(5))
+def test_random_operations(class_, seed):
+    rng = random.Random(seed)
+    expected = list(range(40))
+    storage = class_(expected)
+    value_next = len(expected)
+    for _ in range(400):
+        op = rng.randrange(8)
+        size = len(expected)
+        if op == 0:
+            storage.append(value_next)
+            expected.append(value_next)
+            value_next += 1
+        elif op == 1:
+            idx = rng.randint(-size - 2, size + 2)
+            storage.insert(idx, value_next)
+            expected.insert(idx, value_next)
+            value_next += 1
+        elif op == 2 and size > 0:
+            idx = rng.choice((0, -1, rng.randrange(-size, size)))
+            assert storage.pop(idx) == expected.pop(idx)
+        elif op == 3 and size > 0:
+            val = rng.choice(expected)
+            storage.remove(val)
+            expected.remove(val)
+        elif op == 4 and size > 0:
+            val = rng.choice(expected)
+            assert storage.index(val) == expected.index(val)
+            idx = rng.randrange(-size, size)
+            assert storage[idx] == expected[idx]
+        elif op == 5:
+            start = rng.randint(-size - 2, size + 2)
+            stop = rng.randint(-size - 2, size + 2)
+            step = rng.choice((None, 1, 2, -1, -3))
+            assert list(storage[start:stop:step]) == expected[start:stop:step]
+            if rng.random() < 0.3:
+                del storage[start:stop:step]
+                del expected[start:stop:step]
+        elif op == 6:
+            values = list(range(value_next, value_next + rng.randrange(10)))
+            value_next += len(values)
+            storage.extend(values)
+            expected.extend(values)
+        elif op == 7 and rng.random() < 0.1:
+            storage.reverse()
+            expected.reverse()
+        check_storage(storage, expected)
+
+
+@parametrize_storage_types('class_')
+def test_index_absent(class_):
+    storage = class_((1, 2, 3))
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = storage.index(4)
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = storage.index(1, 1)
+    with pytest.raises(ValueError):  # noqa: PT011
+        storage.remove(4)
+
+
+@parametrize_storage_types('class_')
+def test_copy(class_):
+    storage = class_((1, 2, 3))
+    copy_ = storage.copy()
+    copy_.append(4)
+    check_storage(storage, [1, 2, 3])
+    check_storage(copy_, [1, 2, 3, 4])